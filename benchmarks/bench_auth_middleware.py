@@ -0,0 +1,133 @@
+"""
+So sánh throughput (request/s) của AuthMiddleware ASGI thuần với bản cũ dựa trên BaseHTTPMiddleware.
+
+Chạy từ thư mục gốc repo (cần các biến môi trường của Settings):
+
+    python -m benchmarks.bench_auth_middleware --requests 20000
+
+Request được gửi thẳng vào ASGI app (không qua socket) để chỉ đo chi phí của middleware.
+"""
+import argparse
+import asyncio
+import time
+
+from datetime import datetime, timedelta, timezone
+
+import jwt
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from src.core.config import settings
+from src.core.exceptions import UnauthorizedError
+from src.presentation.api.middlewares.auth_middleware import AuthMiddleware, PUBLIC_PATHS
+from src.schemas.error_response import ErrorResponse
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    """Bản sao AuthMiddleware trước khi chuyển sang ASGI thuần, chỉ dùng để so sánh."""
+
+    async def dispatch(self, request, call_next):
+        try:
+            if any(request.url.path.startswith(path) for path in PUBLIC_PATHS):
+                return await call_next(request)
+
+            auth_header = request.headers.get("Authorization")
+            if not auth_header:
+                raise UnauthorizedError()
+            try:
+                scheme, token = auth_header.split()
+                if scheme.lower() != "bearer":
+                    raise UnauthorizedError()
+            except ValueError:
+                raise UnauthorizedError()
+
+            try:
+                payload = jwt.decode(token, key=settings.JWT_ACCESS_SECRET, algorithms=["HS256"])
+            except jwt.InvalidTokenError:
+                raise UnauthorizedError()
+
+            request.state.user = {
+                "id": payload["id"],
+                "signin_count": payload["signin_count"],
+                "sign_out_count": payload["sign_out_count"],
+                "refresh_jti": payload["refresh_jti"],
+            }
+            return await call_next(request)
+        except UnauthorizedError as e:
+            return ErrorResponse(status=e.status_code, message=e.message, errors=e.errors)
+
+
+async def endpoint(request: Request):
+    return PlainTextResponse("ok")
+
+
+def build_app(middleware_class) -> Starlette:
+    routes = [
+        Route("/api/v1/me", endpoint),
+        Route("/api/v1/auth/signin", endpoint),
+    ]
+    return Starlette(routes=routes, middleware=[Middleware(middleware_class)])
+
+
+def build_token() -> str:
+    payload = {
+        "id": 1,
+        "signin_count": 1,
+        "sign_out_count": 0,
+        "exp": datetime.now(timezone.utc) + timedelta(minutes=30),
+        "refresh_jti": "bench",
+    }
+    return jwt.encode(payload, settings.JWT_ACCESS_SECRET, algorithm="HS256")
+
+
+async def drive(app, path: str, headers: list[tuple[bytes, bytes]], total: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(total):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": headers,
+            "client": ("127.0.0.1", 12345),
+            "server": ("127.0.0.1", 8000),
+        }
+        await app(scope, receive, send)
+    return total / (time.perf_counter() - started)
+
+
+async def main(total: int):
+    token = build_token()
+    cases = [
+        ("authenticated", "/api/v1/me", [(b"authorization", f"Bearer {token}".encode())]),
+        ("public", "/api/v1/auth/signin", []),
+        ("unauthorized", "/api/v1/me", []),
+    ]
+
+    print(f"{'case':<15}{'legacy req/s':>15}{'asgi req/s':>15}{'speedup':>10}")
+    for name, path, headers in cases:
+        legacy = await drive(build_app(LegacyAuthMiddleware), path, headers, total)
+        current = await drive(build_app(AuthMiddleware), path, headers, total)
+        print(f"{name:<15}{legacy:>15.0f}{current:>15.0f}{current / legacy:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,171 @@
+"""
+So sánh throughput (request/s) của các response lỗi 401/429 — loại response chiếm phần lớn
+traffic khi bị dò token hoặc spam OTP — giữa bản cũ và bản hiện tại:
+
+- Bản cũ: middleware `app_error_handler` (BaseHTTPMiddleware) bọc mọi request, route tự bắt
+  AppError và dựng ErrorResponse mới (serialize JSON) cho mỗi lỗi.
+- Bản hiện tại: exception handler đăng ký bằng `register_error_handlers`, body lỗi cố định
+  được encode sẵn một lần (PreEncodedError).
+
+Chạy từ thư mục gốc repo (cần các biến môi trường của Settings):
+
+    python -m benchmarks.bench_error_responses --requests 20000
+
+Request được gửi thẳng vào ASGI app (không qua socket) để chỉ đo chi phí xử lý lỗi.
+"""
+import argparse
+import asyncio
+import math
+import time
+
+from fastapi import FastAPI, Request
+
+from src.core.exceptions import AppError, UnauthorizedError
+from src.core.utils.token_bucket import TokenBucket
+from src.domain.exceptions.auth_exception import TooManyOtpRequestsError
+from src.presentation.api.error_handlers import register_error_handlers
+from src.presentation.api.middlewares.auth_middleware import AuthMiddleware
+from src.presentation.api.middlewares.flood_guard_middleware import FloodGuardMiddleware
+from src.schemas.base_response import BaseResponse
+from src.schemas.error_response import ErrorResponse
+
+
+class LegacyAuthMiddleware(AuthMiddleware):
+    """AuthMiddleware trước khi dùng body encode sẵn: dựng ErrorResponse cho mỗi lần 401."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith("/api/v1/auth"):
+            await self.app(scope, receive, send)
+            return
+        try:
+            scope["user"] = self.authenticate(scope)
+        except UnauthorizedError as e:
+            response = ErrorResponse(status=e.status_code, message=e.message, errors=e.errors)
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+class LegacyFloodGuardMiddleware(FloodGuardMiddleware):
+    """FloodGuardMiddleware trước khi dùng body encode sẵn."""
+
+    async def __call__(self, scope, receive, send):
+        bucket = self._buckets.get("bench")
+        if bucket is None:
+            bucket = self._buckets["bench"] = TokenBucket(self.rate, self.burst)
+        if not bucket.consume():
+            response = ErrorResponse(
+                status=429,
+                message="Too Many Requests",
+                errors={"message": "Bạn đang thao tác quá nhanh. Vui lòng thử lại sau ít phút."},
+                headers={"Retry-After": str(math.ceil(bucket.retry_after()))},
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+def build_legacy_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def app_error_handler(request: Request, call_next):
+        try:
+            return await call_next(request)
+        except AppError as e:
+            return ErrorResponse(status=e.status_code, message=e.message, errors=e.errors, headers=e.headers)
+
+    @app.post("/api/v1/auth/otp")
+    async def resend_otp():
+        try:
+            raise TooManyOtpRequestsError()
+        except AppError as e:
+            return ErrorResponse(status=e.status_code, message=e.message, errors=e.errors, headers=e.headers)
+
+    @app.get("/api/v1/me")
+    async def me():
+        return BaseResponse(status=200, message="ok", data=None)
+
+    app.add_middleware(LegacyAuthMiddleware)
+    return app
+
+
+def build_current_app() -> FastAPI:
+    app = FastAPI()
+    register_error_handlers(app)
+
+    @app.post("/api/v1/auth/otp")
+    async def resend_otp():
+        raise TooManyOtpRequestsError()
+
+    @app.get("/api/v1/me")
+    async def me():
+        return BaseResponse(status=200, message="ok", data=None)
+
+    app.add_middleware(AuthMiddleware)
+    return app
+
+
+def build_flood_guard(middleware_class, inner) -> FloodGuardMiddleware:
+    guard = middleware_class(inner)
+    # Bucket rỗng và gần như không nạp lại → mọi request đều bị chặn 429
+    guard.rate, guard.burst = 1e-9, 0
+    return guard
+
+
+async def drive(app, method: str, path: str, total: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(total):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "client": ("127.0.0.1", 12345),
+            "server": ("127.0.0.1", 8000),
+        }
+        await app(scope, receive, send)
+    return total / (time.perf_counter() - started)
+
+
+async def main(total: int):
+    legacy_app, current_app = build_legacy_app(), build_current_app()
+    cases = [
+        ("401 auth", "GET", "/api/v1/me", legacy_app, current_app),
+        ("429 otp route", "POST", "/api/v1/auth/otp", legacy_app, current_app),
+        (
+            "429 flood",
+            "GET",
+            "/api/v1/me",
+            build_flood_guard(LegacyFloodGuardMiddleware, legacy_app),
+            build_flood_guard(FloodGuardMiddleware, current_app),
+        ),
+    ]
+
+    print(f"{'case':<16}{'legacy req/s':>15}{'current req/s':>15}{'speedup':>10}")
+    for name, method, path, legacy, current in cases:
+        # Chạy nóng một lượt để FastAPI dựng middleware stack trước khi đo
+        await drive(legacy, method, path, 100)
+        await drive(current, method, path, 100)
+        legacy_rate = await drive(legacy, method, path, total)
+        current_rate = await drive(current, method, path, total)
+        print(f"{name:<16}{legacy_rate:>15.0f}{current_rate:>15.0f}{current_rate / legacy_rate:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
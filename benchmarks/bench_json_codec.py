@@ -0,0 +1,83 @@
+"""
+So sánh throughput encode/decode (thao tác/s) của json chuẩn (cách JSONResponse và RedisService
+dùng trước đây) với json_codec hiện tại, trên các payload điển hình của app.
+
+Chạy từ thư mục gốc repo (cần các biến môi trường của Settings):
+
+    python -m benchmarks.bench_json_codec --iterations 50000
+"""
+import argparse
+import json
+import time
+
+from fastapi.responses import JSONResponse
+
+from src.core.utils.json_codec import json_codec
+
+PAYLOADS = {
+    "error 429": {
+        "status": 429,
+        "message": "To Many Requests",
+        "errors": {"message": "Yêu cầu OTP quá nhiều lần, vui lòng thử lại sau."},
+    },
+    "token response": {
+        "status": 200,
+        "message": "Đăng nhập tài khoản thành công",
+        "data": {
+            "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9." + "a" * 180,
+            "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9." + "b" * 220,
+            "token_type": "Bearer",
+        },
+    },
+    "cached user": {
+        "id": 123456,
+        "name": "Nguyễn Thị Thu Hương",
+        "email": "huong.nguyen@example.com",
+        "password": "$argon2id$v=19$m=65536,t=3,p=4$" + "c" * 66,
+        "avatar": "https://lh3.googleusercontent.com/a/" + "d" * 80,
+        "last_login": "2026-10-18T07:58:58.022000+00:00",
+        "signin_count": 42,
+        "sign_out_count": 7,
+        "status": "active",
+    },
+}
+
+
+def legacy_response_encode(payload) -> bytes:
+    return JSONResponse.render(None, payload)
+
+
+def legacy_redis_encode(payload) -> bytes:
+    return json.dumps(payload).encode()
+
+
+def rate(fn, payload, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn(payload)
+    return iterations / (time.perf_counter() - started)
+
+
+def main(iterations: int):
+    print(f"codec: {json_codec.name}")
+    print(f"{'payload':<16}{'op':<16}{'legacy ops/s':>15}{'codec ops/s':>15}{'speedup':>10}")
+    for name, payload in PAYLOADS.items():
+        encoded = json_codec.dumps(payload)
+        assert encoded == legacy_response_encode(payload), "codec output differs from JSONResponse"
+
+        cases = [
+            ("response encode", legacy_response_encode, json_codec.dumps, payload),
+            ("redis encode", legacy_redis_encode, json_codec.dumps, payload),
+            ("decode", json.loads, json_codec.loads, encoded),
+        ]
+        for op, legacy, current, argument in cases:
+            legacy_rate = rate(legacy, argument, iterations)
+            current_rate = rate(current, argument, iterations)
+            print(f"{name:<16}{op:<16}{legacy_rate:>15.0f}{current_rate:>15.0f}{current_rate / legacy_rate:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=50000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,166 @@
+"""
+Đếm số round trip Redis của từng endpoint auth trước và sau khi gom lệnh vào pipeline/Lua script.
+
+Cần một Redis thật (REDIS_HOST/REDIS_PORT trong biến môi trường của Settings). Chạy từ thư mục gốc repo:
+
+    python -m benchmarks.bench_redis_round_trips --iterations 200
+
+Mỗi lần gửi lệnh (hoặc cả một pipeline) xuống socket được tính là một round trip.
+Cột ms là thời gian trung bình mỗi endpoint, nên chạy với Redis ở máy khác để thấy rõ khác biệt.
+"""
+import argparse
+import asyncio
+import time
+
+from redis.asyncio.connection import Connection
+
+from src.core.config import settings
+from src.data.cache.lua_scripts import lua_scripts
+from src.data.cache.redis_client import connect_redis, close_redis, redis_client
+from src.data.cache.redis_service import RedisService
+from src.data.services.otp_service_impl import OTPServiceImpl
+from src.data.services.token_service_impl import TokenServiceImpl
+from src.domain.exceptions.auth_exception import OTPIncorrectError
+
+round_trips = 0
+_send_packed_command = Connection.send_packed_command
+
+
+async def _counting_send_packed_command(self, command, check_health=True):
+    global round_trips
+    round_trips += 1
+    return await _send_packed_command(self, command, check_health)
+
+
+Connection.send_packed_command = _counting_send_packed_command
+
+
+class LegacyOTPService(OTPServiceImpl):
+    """Bản sao các phương thức OTP trước khi gom lệnh, chỉ dùng để so sánh."""
+
+    async def check_and_increment_limit(self, email: str) -> bool:
+        key = f"otp_limit:{email}"
+        if await self.redis_service.exists(key):
+            current = await self.redis_service.incr(key)
+        else:
+            current = 1
+            await self.redis_service.set(key, current, expire_seconds=900)
+        return current < 5
+
+    async def verify_signup_otp(self, email: str, otp: str) -> dict[str, str]:
+        data = await self.redis_service.get_json(f"otp:{email}")
+        if not data or data["otp"] != otp:
+            raise OTPIncorrectError()
+        await self.redis_service.delete(f"otp:{email}")
+        await self.redis_service.delete(f"otp_limit:{email}")
+        return {"email": email, "name": data["name"], "password": data["password"]}
+
+    async def update_otp(self, email: str, otp: str) -> bool:
+        data = await self.redis_service.get_json(f"otp:{email}")
+        if not data:
+            return False
+        data["otp"] = otp
+        await self.redis_service.set_json(f"otp:{email}", data, expire_seconds=600)
+        return True
+
+
+class LegacyTokenService(TokenServiceImpl):
+    """Bản sao các phương thức token trước khi gom lệnh, chỉ dùng để so sánh."""
+
+    async def save_refresh_token(self, user_id: int, device_id: str, token: str):
+        key = f"user_sessions:{user_id}"
+        await self.redis_service.hset(key, device_id, self.hash_token(token))
+        await self.redis_service.expire(key, int(settings.REFRESH_TOKEN_LIFETIME.total_seconds()))
+
+    async def verify_reset_token(self, token: str) -> dict[str, str] | None:
+        key = f"reset_token:{self.hash_token(token)}"
+        data = await self.redis_service.get_json(key)
+        if not data:
+            return None
+        await self.delete_reset_token(token)
+        return {"user_id": data["user_id"]}
+
+
+def build_endpoints(tag: str, otp_service: OTPServiceImpl, token_service: TokenServiceImpl):
+    """Chuỗi thao tác Redis mà mỗi use case thực hiện; phần chuẩn bị dữ liệu nằm ngoài phép đo."""
+
+    async def signup(i):
+        email = f"{tag}{i}@bench.example.com"
+        await otp_service.check_and_increment_limit(email)
+        await otp_service.save_signup_otp(email, "123456", "Bench", "hash")
+
+    async def resend_otp(i):
+        email = f"{tag}{i}@bench.example.com"
+        await otp_service.check_and_increment_limit(email)
+        await otp_service.update_otp(email, "654321")
+
+    async def signup_verification(i):
+        email = f"{tag}{i}@bench.example.com"
+        await otp_service.verify_signup_otp(email, "654321")
+        await token_service.save_refresh_token(f"{tag}{i}", f"device{i}", "refresh-token")
+
+    async def prepare_reset(i):
+        await token_service.save_reset_token(f"{tag}-reset{i}", str(i))
+
+    async def change_password(i):
+        await token_service.verify_reset_token(f"{tag}-reset{i}")
+
+    # (tên, hàm chuẩn bị, hàm được đo); thứ tự đảm bảo dữ liệu của bước sau đã tồn tại
+    return [
+        ("signup", None, signup),
+        ("otp resend", None, resend_otp),
+        ("signup verify", None, signup_verification),
+        ("password change", prepare_reset, change_password),
+    ]
+
+
+async def measure(endpoints, iterations: int) -> dict[str, tuple[float, float]]:
+    global round_trips
+    results = {}
+    for name, prepare, run in endpoints:
+        elapsed = 0.0
+        counted = 0
+        for i in range(iterations):
+            if prepare is not None:
+                await prepare(i)
+            round_trips = 0
+            started = time.perf_counter()
+            await run(i)
+            elapsed += time.perf_counter() - started
+            counted += round_trips
+        results[name] = (counted / iterations, elapsed / iterations * 1000)
+    return results
+
+
+async def main(iterations: int):
+    await connect_redis()
+    await lua_scripts.load_all()
+    redis_service = RedisService()
+
+    try:
+        legacy = await measure(
+            build_endpoints("legacy", LegacyOTPService(redis_service), LegacyTokenService(redis_service)),
+            iterations,
+        )
+        current = await measure(
+            build_endpoints("current", OTPServiceImpl(redis_service), TokenServiceImpl(redis_service)),
+            iterations,
+        )
+    finally:
+        # Chỉ dọn các key do benchmark tạo (reset token đã bị xóa khi verify)
+        for pattern in ("*@bench.example.com", "user_sessions:legacy*", "user_sessions:current*"):
+            async for key in redis_client.scan_iter(match=pattern):
+                await redis_client.delete(key)
+        await close_redis()
+
+    print(f"{'endpoint':<18}{'legacy RTT':>12}{'current RTT':>13}{'legacy ms':>11}{'current ms':>12}")
+    for name, (legacy_rtt, legacy_ms) in legacy.items():
+        current_rtt, current_ms = current[name]
+        print(f"{name:<18}{legacy_rtt:>12.1f}{current_rtt:>13.1f}{legacy_ms:>11.3f}{current_ms:>12.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,119 @@
+"""
+So sánh /auth/refresh khi kiểm tra bộ đếm token bằng user row trong Postgres (bản cũ)
+và bằng auth epoch trên Redis.
+
+Cần Postgres và Redis thật (các biến DB_* / REDIS_* của Settings). Chạy từ thư mục gốc repo:
+
+    python -m benchmarks.bench_refresh_epoch --requests 2000
+
+Benchmark tạo một user tạm, in số câu SQL và thời gian trung bình mỗi lần refresh, rồi xóa user.
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import delete, event
+
+from src.core.config import settings
+from src.core.exceptions import UnauthorizedError
+from src.data.cache.auth_epoch_cache import AuthEpochCache
+from src.data.cache.lua_scripts import lua_scripts
+from src.data.cache.redis_client import connect_redis, close_redis
+from src.data.cache.redis_service import RedisService
+from src.data.db.session import AsyncScopedSession, db_session_scope, engine
+from src.data.models import UserModel
+from src.data.repositories import UserRepositoryImpl
+from src.data.services import TokenServiceImpl
+from src.domain.entities import UserEntity
+from src.domain.use_cases.auth import RefreshSigninUseCase
+
+queries = 0
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    global queries
+    queries += 1
+
+
+class LegacyRefreshSigninUseCase(RefreshSigninUseCase):
+    """Bản sao luồng kiểm tra bằng user row trước khi có auth epoch, chỉ dùng để so sánh."""
+
+    async def execute(self, refresh_token: str) -> dict[str, str]:
+        payload = self.token_service.verify_token(token=refresh_token, secret=settings.JWT_REFRESH_SECRET)
+        user = await self.user_repository.get_user_by_id(user_id=payload["id"])
+        if not user:
+            raise UnauthorizedError()
+        if user.signin_count != payload["signin_count"] or user.sign_out_count != payload["sign_out_count"]:
+            raise UnauthorizedError()
+        stored_hash = await self.token_service.get_refresh_token_hash(user.id, payload["jti"])
+        if not stored_hash or self.token_service.hash_token(refresh_token) != stored_hash:
+            raise UnauthorizedError()
+        access_token = self.token_service.create_access_token(
+            user_id=user.id,
+            signin_count=payload["signin_count"],
+            sign_out_count=payload["sign_out_count"],
+            refresh_jti=payload["jti"],
+        )
+        return {"access_token": access_token, "token_type": "Bearer"}
+
+
+async def drive(use_case_class, auth_epoch_cache, refresh_token: str, total: int) -> tuple[float, float]:
+    global queries
+    token_service = TokenServiceImpl(RedisService())
+    queries = 0
+    started = time.perf_counter()
+    for _ in range(total):
+        async with db_session_scope():
+            repository = UserRepositoryImpl(db=AsyncScopedSession, auth_epoch_cache=auth_epoch_cache)
+            use_case = use_case_class(user_repository=repository, token_service=token_service)
+            await use_case.execute(refresh_token)
+    elapsed = time.perf_counter() - started
+    return queries / total, elapsed / total * 1000
+
+
+async def main(total: int):
+    await connect_redis()
+    await lua_scripts.load_all()
+    redis_service = RedisService()
+    token_service = TokenServiceImpl(redis_service)
+
+    async with db_session_scope():
+        user = await UserRepositoryImpl(db=AsyncScopedSession).create_user(
+            UserEntity(
+                id=None,
+                name="Bench",
+                email=f"bench-{uuid.uuid4().hex}@bench.example.com",
+                password="x",
+                avatar=None,
+                last_login=None,
+                signin_count=1,
+                sign_out_count=0,
+            )
+        )
+
+    try:
+        refresh_token, device_id = token_service.create_refresh_token(user.id, 1, 0)
+        await token_service.save_refresh_token(user.id, device_id, refresh_token)
+
+        legacy = await drive(LegacyRefreshSigninUseCase, None, refresh_token, total)
+        current = await drive(RefreshSigninUseCase, AuthEpochCache(redis_service), refresh_token, total)
+    finally:
+        await token_service.delete_all_refresh_tokens(user.id)
+        await redis_service.delete(f"{AuthEpochCache.KEY_PREFIX}{user.id}")
+        async with engine.begin() as conn:
+            await conn.execute(delete(UserModel).where(UserModel.id == user.id))
+        await close_redis()
+        await engine.dispose()
+
+    print(f"{'variant':<12}{'SQL/refresh':>13}{'ms/refresh':>12}")
+    print(f"{'user row':<12}{legacy[0]:>13.2f}{legacy[1]:>12.3f}")
+    print(f"{'auth epoch':<12}{current[0]:>13.2f}{current[1]:>12.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,93 @@
+"""
+So sánh chi phí đọc + validate body của route đăng ký (POST /api/v1/auth/signup) giữa bản cũ
+và bản hiện tại, tính trên mỗi request:
+
+- Bản cũ: `json_codec.loads` ra dict, `body.get(...).strip()` từng trường rồi gọi validate_*.
+- Bản hiện tại: `SignupRequest.model_validate_json` — parse JSON và chạy validator trong một
+  bước (core pydantic biên dịch sẵn), body không phải object trả 400 thay vì lỗi 500.
+
+Chi phí chủ yếu nằm ở các rule validate_* (regex) nên body hợp lệ tốn tương đương bản cũ;
+body lỗi tốn thêm vài µs do pydantic dựng ValidationError — không đáng kể so với một request.
+
+Chạy từ thư mục gốc repo (cần các biến môi trường của Settings):
+
+    python -m benchmarks.bench_request_validation --iterations 100000
+
+Chỉ đo phần xử lý body (không qua ASGI/route) để tách riêng chi phí validate.
+"""
+import argparse
+import time
+
+import pydantic
+
+from src.core.exceptions import ValidationError
+from src.core.utils.json_codec import json_codec
+from src.core.utils.validations.auth_validations import validate_email, validate_name, validate_password
+from src.presentation.api.request_body import _field_errors
+from src.schemas.auth_request import SignupRequest
+
+BODIES = {
+    "valid": b'{"name": "Nguyen Van An", "email": "an.nguyen@example.com", "password": "Secret#12345"}',
+    "invalid": b'{"name": "A", "email": "not-an-email", "password": "short"}',
+    "missing": b'{}',
+}
+
+
+def legacy_parse(raw: bytes) -> dict:
+    body = json_codec.loads(raw)
+    email = body.get("email", "").strip()
+    name = body.get("name", "").strip()
+    password = body.get("password", "").strip()
+
+    errors = {}
+
+    name_error = validate_name(name)
+    if name_error:
+        errors["name"] = name_error
+
+    email_error = validate_email(email)
+    if email_error:
+        errors["email"] = email_error
+
+    password_error = validate_password(password)
+    if password_error:
+        errors["password"] = password_error
+
+    if errors:
+        raise ValidationError(errors=errors)
+    return {"name": name, "email": email, "password": password}
+
+
+def current_parse(raw: bytes) -> SignupRequest:
+    try:
+        return SignupRequest.model_validate_json(raw)
+    except pydantic.ValidationError as e:
+        raise ValidationError(errors=_field_errors(e))
+
+
+def measure(parse, raw: bytes, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        try:
+            parse(raw)
+        except ValidationError:
+            pass
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main(iterations: int):
+    print(f"{'case':<10}{'legacy µs':>12}{'current µs':>12}{'speedup':>10}")
+    for name, raw in BODIES.items():
+        # Chạy nóng để cache regex và schema pydantic đã sẵn sàng
+        measure(legacy_parse, raw, 1000)
+        measure(current_parse, raw, 1000)
+        legacy = measure(legacy_parse, raw, iterations)
+        current = measure(current_parse, raw, iterations)
+        print(f"{name:<10}{legacy:>12.2f}{current:>12.2f}{legacy / current:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=100000)
+    args = parser.parse_args()
+    main(args.iterations)
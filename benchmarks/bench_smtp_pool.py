@@ -0,0 +1,70 @@
+"""
+So sánh số email/giây khi mở kết nối SMTP mới cho mỗi email (aiosmtplib.send, bản cũ)
+và khi dùng SMTPConnectionPool.
+
+Email được gửi tới SMTP sink cục bộ (tests/data/smtp_sink.py); `--handshake-ms` mô phỏng
+độ trễ chào + STARTTLS + AUTH của server thật. Chạy từ thư mục gốc repo:
+
+    python -m benchmarks.bench_smtp_pool --emails 500 --concurrency 8 --handshake-ms 40
+"""
+import argparse
+import asyncio
+import time
+
+from email.mime.text import MIMEText
+
+import aiosmtplib
+
+from src.data.mail.smtp_pool import SMTPConnectionPool
+from tests.data.smtp_sink import SMTPSink
+
+
+def build_message(i: int) -> MIMEText:
+    message = MIMEText(f"<b>{i:06d}</b>", "html")
+    message["From"] = "Bench <noreply@example.com>"
+    message["To"] = f"user{i}@example.com"
+    message["Subject"] = "OTP"
+    return message
+
+
+async def drive(send, emails: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send_one(i: int):
+        async with semaphore:
+            await send(build_message(i))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(send_one(i) for i in range(emails)))
+    return emails / (time.perf_counter() - started)
+
+
+async def main(emails: int, concurrency: int, handshake_ms: float):
+    async with SMTPSink(handshake_delay=handshake_ms / 1000) as sink:
+        async def send_per_connection(message):
+            await aiosmtplib.send(
+                message, hostname=sink.host, port=sink.port, username="u", password="p", start_tls=False
+            )
+
+        legacy = await drive(send_per_connection, emails, concurrency)
+        legacy_connections, sink.connections = sink.connections, 0
+
+        pool = SMTPConnectionPool(
+            hostname=sink.host, port=sink.port, username="u", password="p", start_tls=False, size=concurrency
+        )
+        pooled = await drive(pool.send_message, emails, concurrency)
+        await pool.close()
+
+    print(f"{'variant':<16}{'emails/s':>10}{'connections':>13}")
+    print(f"{'per-email':<16}{legacy:>10.0f}{legacy_connections:>13}")
+    print(f"{'pooled':<16}{pooled:>10.0f}{sink.connections:>13}")
+    print(f"speedup: {pooled / legacy:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--emails", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--handshake-ms", type=float, default=40)
+    args = parser.parse_args()
+    asyncio.run(main(args.emails, args.concurrency, args.handshake_ms))
@@ -0,0 +1,53 @@
+"""
+So sánh thời gian validate một trường input giữa bản cũ (mỗi rule một lần `re.search`) và
+RuleSet (mọi rule của trường gộp thành một regex, quét input một lần):
+
+- is_safe_input: 6 mẫu XSS/SQL, chạy cho tên, email và mật khẩu ở mỗi lần đăng ký.
+- is_code: 5 nhóm mẫu HTML/JS/SQL.
+- validate_password: 4 rule ký tự bắt buộc + 6 mẫu không an toàn.
+
+Chạy từ thư mục gốc repo (cần các biến môi trường của Settings):
+
+    python -m benchmarks.bench_validation_engine --iterations 200000
+"""
+import argparse
+import time
+
+from src.core.utils.validations.auth_validations import validate_password
+from src.core.utils.validations.base_validation import is_code
+from src.core.utils.validations.security_validation import is_safe_input
+from tests.core import legacy_validations as legacy
+
+CASES = [
+    ("is_safe_input", legacy.is_safe_input, is_safe_input, "Nguyen Van An <an.nguyen@example.com>"),
+    ("is_safe_input", legacy.is_safe_input, is_safe_input, "x'; DROP TABLE users --"),
+    ("is_code", legacy.is_code, is_code, "Căn hộ tầng 12, toà nhà Bình Minh"),
+    ("is_code", legacy.is_code, is_code, "function f() { return 1 }"),
+    ("validate_password", legacy.validate_password, validate_password, "Secret#12345"),
+    ("validate_password", legacy.validate_password, validate_password, "secret12345"),
+]
+
+
+def measure(validate, text: str, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        validate(text)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main(iterations: int):
+    print(f"{'function':<20}{'input':<42}{'legacy µs':>11}{'current µs':>12}{'speedup':>10}")
+    for name, legacy_validate, current_validate, text in CASES:
+        assert legacy_validate(text) == current_validate(text)
+        measure(legacy_validate, text, 1000)
+        measure(current_validate, text, 1000)
+        legacy_time = measure(legacy_validate, text, iterations)
+        current_time = measure(current_validate, text, iterations)
+        print(f"{name:<20}{text!r:<42}{legacy_time:>11.2f}{current_time:>12.2f}{legacy_time / current_time:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=200000)
+    args = parser.parse_args()
+    main(args.iterations)
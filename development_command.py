@@ -29,6 +29,16 @@ def compose_logs():
     subprocess.run(["docker", "compose", "-f", COMPOSE_FILE, "logs", "-f", "backend"], check=False)
 
 
+def calibrate_argon2():
+    """Đo chi phí argon2 ngay trong container backend và in profile cho .env"""
+    print("Đang calibrate argon2 trong container backend...")
+    subprocess.run(
+        ["docker", "compose", "-f", COMPOSE_FILE, "exec", "backend",
+         "python", "-m", "src.data.hashing.calibration", *sys.argv[2:]],
+        check=True,
+    )
+
+
 def open_db_shell():
     """Mở psql shell trong container PostgreSQL"""
     print(f"Mở shell PostgreSQL trong container `{DB_CONTAINER}`...")
@@ -61,6 +71,7 @@ def help_menu():
   python development_command.py restart   # restart container backend
   python development_command.py logs      # xem logs backend
   python development_command.py db        # mở shell PostgreSQL trong container
+  python development_command.py calibrate # đo argon2 và in profile ARGON2_* cho .env
     """)
 
 
@@ -81,5 +92,7 @@ if __name__ == "__main__":
         compose_logs()
     elif cmd == "db":
         open_db_shell()
+    elif cmd == "calibrate":
+        calibrate_argon2()
     else:
         help_menu()
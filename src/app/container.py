@@ -1,14 +1,23 @@
 from dependency_injector import containers, providers
 
+from src.data.cache.auth_epoch_cache import AuthEpochCache
+from src.data.cache.email_bloom_filter import email_bloom_filter
+from src.data.cache.google_certs import GoogleCertsCache
 from src.data.cache.redis_service import RedisService
+from src.data.cache.user_cache import UserCache
 from src.data.services import (
     OTPServiceImpl,
     TokenServiceImpl,
     MailServiceImpl,
-    PasswordHasherServiceImpl
+    PasswordHasherServiceImpl,
+    GoogleTokenVerifierImpl
 )
-from src.data.db.session import get_db_session
-from src.data.mail.mailer import MailTransporter
+from src.data.db.replica import replica_router
+from src.data.db.session import AsyncScopedSession, AsyncScopedReplicaSession
+from src.data.hashing import HashPriority
+from src.data.mail.mailer import build_mail_transporters
+from src.data.mail.outbox import MailOutbox
+from src.data.mail.send_scheduler import MailSendScheduler
 from src.data.repositories import UserRepositoryImpl
 
 from src.domain.use_cases.auth import (
@@ -30,22 +39,44 @@ class Container(containers.DeclarativeContainer):
         packages=["src.presentation.api.v1"]
     )
 
-    db_session = providers.Resource(get_db_session)
-
-    # Repositories
-    user_repository = providers.Factory(UserRepositoryImpl, db=db_session)
+    # Session theo từng request, xem db_session_scope()
+    db_session = providers.Object(AsyncScopedSession)
+    read_db_session = providers.Object(AsyncScopedReplicaSession)
+    replica_router = providers.Object(replica_router)
+    email_bloom_filter = providers.Object(email_bloom_filter)
 
     # Services
     # -------------------------- Singleton ------------------------------
     redis_service = providers.Singleton(RedisService)
-    mail_transporter = providers.Singleton(MailTransporter)
+    auth_epoch_cache = providers.Singleton(AuthEpochCache, redis_service=redis_service)
+    user_cache = providers.Singleton(UserCache, redis_service=redis_service)
+    google_certs_cache = providers.Singleton(GoogleCertsCache, redis_service=redis_service)
+    mail_scheduler = providers.Singleton(
+        MailSendScheduler, redis_service=redis_service, transporters=providers.Callable(build_mail_transporters)
+    )
+    mail_outbox = providers.Singleton(MailOutbox, redis_service=redis_service, scheduler=mail_scheduler)
     # ------------------------- Factory --------------------------
     otp_service = providers.Factory(OTPServiceImpl, redis_service=redis_service)
     token_service = providers.Factory(TokenServiceImpl, redis_service=redis_service)
-    mail_service = providers.Factory(MailServiceImpl, transporter=mail_transporter)
-    password_hasher_service = providers.Factory(PasswordHasherServiceImpl)
+    mail_service = providers.Factory(MailServiceImpl, scheduler=mail_scheduler, outbox=mail_outbox)
+    google_token_verifier = providers.Factory(GoogleTokenVerifierImpl, certs_cache=google_certs_cache)
+    # Mỗi luồng nghiệp vụ có độ ưu tiên hash riêng: signin > đổi mật khẩu > signup
+    signin_password_hasher_service = providers.Factory(PasswordHasherServiceImpl, priority=HashPriority.SIGNIN)
+    reset_password_hasher_service = providers.Factory(PasswordHasherServiceImpl, priority=HashPriority.PASSWORD_RESET)
+    signup_password_hasher_service = providers.Factory(PasswordHasherServiceImpl, priority=HashPriority.SIGNUP)
     # ------------------------------------------------------------
 
+    # Repositories
+    user_repository = providers.Factory(
+        UserRepositoryImpl,
+        db=db_session,
+        read_db=read_db_session,
+        replica_router=replica_router,
+        auth_epoch_cache=auth_epoch_cache,
+        user_cache=user_cache,
+        email_filter=email_bloom_filter
+    )
+
     # Use cases
 
     # Signup
@@ -54,7 +85,7 @@ class Container(containers.DeclarativeContainer):
         user_repository=user_repository,
         otp_service=otp_service,
         mail_service=mail_service,
-        password_hasher_service=password_hasher_service
+        password_hasher_service=signup_password_hasher_service
     )
     signup_verification_use_case = providers.Factory(
         SignupVerificationUseCase,
@@ -67,7 +98,7 @@ class Container(containers.DeclarativeContainer):
     signin_with_email_password_use_case = providers.Factory(
         SigninWithEmailPasswordUseCase,
         user_repository=user_repository,
-        password_hasher_service=password_hasher_service,
+        password_hasher_service=signin_password_hasher_service,
         token_service=token_service
     )
 
@@ -94,7 +125,7 @@ class Container(containers.DeclarativeContainer):
         ChangePasswordUseCase,
         user_repository=user_repository,
         token_service=token_service,
-        password_hasher_service=password_hasher_service
+        password_hasher_service=reset_password_hasher_service
     )
 
     # Refresh
@@ -115,5 +146,6 @@ class Container(containers.DeclarativeContainer):
     handle_google_auth_use_case = providers.Factory(
         HandleGoogleAuthUseCase,
         user_repository=user_repository,
-        token_service=token_service
+        token_service=token_service,
+        google_token_verifier=google_token_verifier
     )
@@ -2,7 +2,7 @@ import os
 
 from datetime import timedelta
 from pydantic_settings import BaseSettings
-from pydantic import ConfigDict
+from pydantic import BaseModel, ConfigDict
 from dotenv import load_dotenv
 from typing import ClassVar
 
@@ -14,27 +14,95 @@ dotenv_file = f".env.{ENV}"
 load_dotenv(dotenv_file)
 
 
+class MailAccount(BaseModel):
+    """Một tài khoản SMTP dùng để gửi email; quota gửi để None sẽ lấy MAIL_SEND_RATE/MAIL_SEND_BURST."""
+    name: str
+    host: str
+    port: int
+    user: str
+    password: str
+    use_tls: bool = True
+    rate_per_second: float | None = None
+    burst: int | None = None
+
+
 class Settings(BaseSettings):
     APP_NAME: str
     APP_VERSION: str
     DEBUG: bool
 
+    # Codec JSON cho response, body request và dữ liệu Redis: "auto" (orjson nếu đã cài), "orjson" hoặc "json"
+    JSON_CODEC: str = "auto"
+    # Kích thước tối đa (byte) của body request; body lớn hơn bị trả 413 ngay khi vượt ngưỡng, không đọc hết
+    REQUEST_BODY_MAX_BYTES: int = 16 * 1024
+
     DB_USER: str
     DB_PASSWORD: str
     DB_HOST: str
     DB_PORT: int
     DB_NAME: str
 
+    # Profile engine/pool Postgres
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800  # giây
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Chạy sau PgBouncer ở chế độ transaction pooling: tắt prepared statement cache
+    DB_PGBOUNCER_TRANSACTION_MODE: bool = False
+
+    # Read replica (tùy chọn). Truy vấn đọc quay về primary khi replica trễ quá DB_REPLICA_MAX_LAG_SECONDS.
+    # DB_READ_YOUR_WRITES_SECONDS nên lớn hơn DB_REPLICA_MAX_LAG_SECONDS + DB_REPLICA_LAG_CHECK_INTERVAL.
+    DB_REPLICA_HOST: str | None = None
+    DB_REPLICA_PORT: int | None = None
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5
+    DB_REPLICA_LAG_CHECK_INTERVAL: float = 5
+    DB_READ_YOUR_WRITES_SECONDS: int = 15
+
     REDIS_HOST: str
     REDIS_PORT: int
     REDIS_PASSWORD: str
     REDIS_USE_TLS: bool = True
 
+    # CIDR của các reverse proxy/load balancer được tin cậy header X-Forwarded-For,
+    # khai báo dạng JSON, ví dụ TRUSTED_PROXIES=["10.0.0.0/8"]
+    TRUSTED_PROXIES: list[str] = []
+
+    # Timeout (giây) khi limiter theo route gọi Redis; quá hạn sẽ chuyển sang đếm trong bộ nhớ
+    RATE_LIMIT_REDIS_TIMEOUT: float = 0.5
+    # Token bucket chặn flood theo IP trong từng process: số request/giây và burst tối đa
+    FLOOD_GUARD_RATE: float = 20
+    FLOOD_GUARD_BURST: int = 40
+    FLOOD_GUARD_MAX_CLIENTS: int = 100000
+
     MAIL_HOST: str
     MAIL_PORT: int
     MAIL_USER: str
     MAIL_PASSWORD: str
     MAIL_SENDER_NAME: str
+    MAIL_USE_TLS: bool = True
+    # Pool kết nối SMTP: số kết nối tối đa (cũng là số email gửi đồng thời), chu kỳ NOOP,
+    # thời gian rảnh tối đa và số email mỗi kết nối trước khi mở kết nối mới
+    MAIL_POOL_SIZE: int = 4
+    MAIL_POOL_KEEPALIVE_SECONDS: float = 30
+    MAIL_POOL_MAX_IDLE_SECONDS: float = 300
+    MAIL_POOL_MAX_MESSAGES_PER_CONNECTION: int = 100
+    # Outbox email (Redis Stream): số worker mỗi process, số lần gửi tối đa, backoff giữa các lần
+    # gửi lại (base * 2^(lần - 1), không quá max) và thời gian pending trước khi worker khác nhận lại
+    MAIL_OUTBOX_WORKERS: int = 2
+    MAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    MAIL_OUTBOX_BACKOFF_BASE_SECONDS: float = 2
+    MAIL_OUTBOX_BACKOFF_MAX_SECONDS: float = 300
+    MAIL_OUTBOX_CLAIM_IDLE_SECONDS: float = 60
+    MAIL_OUTBOX_DEAD_LETTER_MAXLEN: int = 10000
+    # Quota gửi của mail provider cho mỗi tài khoản (token bucket dùng chung mọi process qua Redis)
+    MAIL_SEND_RATE: float = 10
+    MAIL_SEND_BURST: int = 10
+    # Các tài khoản SMTP bổ sung để chia tải, khai báo dạng JSON, ví dụ
+    # MAIL_EXTRA_ACCOUNTS=[{"name": "backup", "host": "smtp.example.com", "port": 587, "user": "...", "password": "..."}]
+    MAIL_EXTRA_ACCOUNTS: list[MailAccount] = []
 
     JWT_ACCESS_SECRET: str
     JWT_REFRESH_SECRET: str
@@ -42,10 +110,64 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_LIFETIME: ClassVar[timedelta] = timedelta(minutes=30)
     REFRESH_TOKEN_LIFETIME: ClassVar[timedelta] = timedelta(days=45)
 
+    # Cache UserEntity: L2 trên Redis và L1 trong từng process (TTL ngắn vì không được
+    # invalidate chéo giữa các worker)
+    USER_CACHE_TTL_SECONDS: int = 300
+    USER_CACHE_LOCAL_TTL_SECONDS: float = 2
+    USER_CACHE_LOCAL_SIZE: int = 10000
+
+    # Bloom filter email đã đăng ký (bitmap trên Redis): số email dự kiến và tỉ lệ dương tính giả.
+    # 1 triệu email với 1% tốn ~1.14 MiB; log khi khởi động in ra bộ nhớ và tỉ lệ ước tính thực tế.
+    EMAIL_BLOOM_EXPECTED_ITEMS: int = 1_000_000
+    EMAIL_BLOOM_FALSE_POSITIVE_RATE: float = 0.01
+    EMAIL_BLOOM_REBUILD_LOCK_SECONDS: int = 600
+
+    # Các yêu cầu gửi OTP giống hệt nhau (cùng luồng, cùng email, cùng dữ liệu) trong khoảng này (giây)
+    # dùng chung một lần tạo OTP và một email; đặt 0 để tắt
+    OTP_SEND_COALESCE_SECONDS: float = 5
+
+    # Thời gian giữ bộ đếm signin/sign_out của user trên Redis (auth epoch)
+    AUTH_EPOCH_TTL_SECONDS: int = 86400
+
+    # Số access token đã verify được giữ trong cache của mỗi process
+    ACCESS_TOKEN_CACHE_SIZE: int = 10000
+
     GOOGLE_CLIENT_ID: str
+    # Public key ký ID token của Google (PEM theo kid). Cache theo Cache-Control max-age,
+    # làm mới nền trước khi hết hạn GOOGLE_CERTS_REFRESH_MARGIN_SECONDS giây
+    GOOGLE_CERTS_URL: str = "https://www.googleapis.com/oauth2/v1/certs"
+    GOOGLE_CERTS_REFRESH_MARGIN_SECONDS: int = 300
+    GOOGLE_CERTS_DEFAULT_MAX_AGE_SECONDS: int = 3600
+    GOOGLE_CERTS_FETCH_TIMEOUT: float = 5
+    # Độ lệch đồng hồ cho phép khi kiểm tra iat/exp của ID token
+    GOOGLE_TOKEN_CLOCK_SKEW_SECONDS: int = 10
 
     SESSION_SECRET: str
 
+    # Server production (`python -m src.server`): số worker process (None = số core khả dụng theo
+    # quota cgroup), mỗi worker tự khởi động lại sau khoảng SERVER_MAX_REQUESTS request (+ ngẫu nhiên
+    # tối đa SERVER_MAX_REQUESTS_JITTER, 0 = tắt) để giới hạn bộ nhớ tăng dần
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int | None = None
+    SERVER_MAX_REQUESTS: int = 10000
+    SERVER_MAX_REQUESTS_JITTER: int = 1000
+    # Thời gian tối đa (giây) chờ worker xử lý nốt request khi tắt, quá hạn thì kill
+    SERVER_GRACEFUL_TIMEOUT: int = 30
+
+    # Số process con dùng để hash mật khẩu (None = số core khả dụng; chạy bằng src.server thì
+    # mặc định chia đều số core cho các worker)
+    PASSWORD_HASH_WORKERS: int | None = None
+    # Giới hạn job hash đang chạy (None = số process) và số job được phép xếp hàng chờ
+    PASSWORD_HASH_MAX_CONCURRENT: int | None = None
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 5
+
+    # Profile chi phí argon2, sinh bởi `python -m src.data.hashing.calibration`
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    ARGON2_PARALLELISM: int = 4
+
     model_config = ConfigDict(
         env_file=dotenv_file,
         env_file_encoding="utf-8"
@@ -6,6 +6,7 @@ class AppError(Exception):
     status_code: int = 500
     message: str = "Internal Server Error"
     errors: Dict[str, Any] | None = None
+    headers: Dict[str, str] | None = None
 
     def __init__(self, message: str | None = None, errors: Dict[str, Any] | None = None):
         if message:
@@ -42,6 +43,27 @@ class UnauthorizedError(AppError):
         super().__init__(errors={"message": self.error})
 
 
+class TooManyRequestsError(AppError):
+    """Vượt giới hạn tần suất của route, client nên thử lại sau `retry_after` giây."""
+    status_code = 429
+    message = "Too Many Requests"
+    error = "Bạn đang thao tác quá nhanh. Vui lòng thử lại sau ít phút."
+
+    def __init__(self, retry_after: int | None = None):
+        super().__init__(errors={"message": self.error})
+        if retry_after is not None:
+            self.headers = {"Retry-After": str(retry_after)}
+
+
+class PayloadTooLargeError(AppError):
+    status_code = 413
+    message = "Payload Too Large"
+    error = "Dữ liệu gửi lên vượt quá kích thước cho phép."
+
+    def __init__(self):
+        super().__init__(errors={"message": self.error})
+
+
 class ServerError(AppError):
     """Lỗi hệ thống - database, external service,..."""
     status_code = 500
@@ -52,3 +74,14 @@ class ServerError(AppError):
             message=self.message,
             errors=errors or {"message": detail or "Hệ thống đã xảy ra lỗi, Vui lòng thử lại sau."},
         )
+
+
+class ServiceUnavailableError(AppError):
+    """Hệ thống quá tải, client nên thử lại sau `retry_after` giây."""
+    status_code = 503
+    message = "Service Unavailable"
+    error = "Hệ thống đang quá tải, vui lòng thử lại sau ít phút."
+
+    def __init__(self, retry_after: int):
+        super().__init__(errors={"message": self.error})
+        self.headers = {"Retry-After": str(retry_after)}
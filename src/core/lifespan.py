@@ -1,9 +1,13 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
+from src.data.cache.email_bloom_filter import email_bloom_filter
+from src.data.cache.lua_scripts import lua_scripts
 from src.data.cache.redis_client import connect_redis, close_redis
 from src.data.db.base import Base
+from src.data.db.replica import replica_router
 from src.data.db.session import engine
+from src.data.hashing import hashing_pool
 
 
 @asynccontextmanager
@@ -16,8 +20,44 @@ async def lifespan(app: FastAPI):
     print("Connect Redis (startup)...")
     await connect_redis()
 
+    print("Load Lua scripts (startup)...")
+    await lua_scripts.load_all()
+
+    print("Rebuild registered-email bloom filter (startup)...")
+    email_bloom_filter.start()
+
+    print("Start password hashing pool (startup)...")
+    hashing_pool.start()
+
+    print("Start replica lag monitor (startup)...")
+    await replica_router.start()
+
+    print("Start mail outbox workers (startup)...")
+    await app.container.mail_outbox().start()
+
+    print("Load Google signing keys (startup)...")
+    await app.container.google_certs_cache().start()
+
     yield
 
+    print("Stop Google signing keys refresh (shutdown)...")
+    await app.container.google_certs_cache().stop()
+
+    print("Stop mail outbox workers (shutdown)...")
+    await app.container.mail_outbox().stop()
+
+    print("Close SMTP connections (shutdown)...")
+    await app.container.mail_scheduler().close()
+
+    print("Stop email bloom filter rebuild (shutdown)...")
+    await email_bloom_filter.stop()
+
+    print("Stop replica lag monitor (shutdown)...")
+    await replica_router.stop()
+
+    print("Stop password hashing pool (shutdown)...")
+    await hashing_pool.shutdown()
+
     print("Disconnect Redis (shutdown)...")
     await close_redis()
 
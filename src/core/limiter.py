@@ -1,4 +1,89 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import asyncio
+import functools
+import logging
+import math
+import time
+from typing import Callable
 
-limiter = Limiter(key_func=get_remote_address)
+from fastapi import Request
+from limits import RateLimitItem, parse
+from limits.storage import MemoryStorage
+from limits.strategies import MovingWindowRateLimiter
+
+from src.core.config import settings
+from src.core.exceptions import TooManyRequestsError
+from src.core.metrics import metrics
+from src.core.utils.client_ip import get_client_ip
+from src.data.cache.rate_limiter import SlidingWindowRateLimiter
+from src.data.cache.redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+
+class RouteRateLimiter:
+    """
+    Giới hạn tần suất theo route + client IP, dùng như decorator:
+
+        @router.post("")
+        @limiter.limit("6/minute")
+        async def handler(request: Request, ...): ...
+
+    - Bộ đếm là SlidingWindowRateLimiter trên Redis (client asyncio, một Lua script mỗi lần),
+      dùng chung cho mọi worker/pod và không chặn event loop.
+    - Redis lỗi hoặc chậm quá RATE_LIMIT_REDIS_TIMEOUT: tạm đếm bằng moving window trong bộ nhớ
+      của từng process (chỉ thao tác trong RAM) để API vẫn chạy và vẫn có giới hạn.
+    - Vượt giới hạn → TooManyRequestsError (429, kèm Retry-After).
+    """
+
+    def __init__(self, key_func: Callable[[Request], str], prefix: str = "rate_limit",
+                 redis_service: RedisService | None = None):
+        self.key_func = key_func
+        self.prefix = prefix
+        self.redis_service = redis_service or RedisService()
+        self._fallback = MovingWindowRateLimiter(MemoryStorage())
+        self._fallback_hits = metrics.counter("rate_limit.fallback")
+
+    def limit(self, limit_value: str):
+        """Decorator giới hạn route theo chuỗi dạng `limits` ("6/minute", "2 per 30 minutes",...)."""
+        item = parse(limit_value)
+
+        def decorator(func):
+            window = SlidingWindowRateLimiter(
+                f"{self.prefix}:{func.__module__}.{func.__qualname__}",
+                limit=item.amount,
+                window_seconds=item.get_expiry(),
+                redis_service=self.redis_service,
+            )
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                request = kwargs.get("request")
+                if request is None:
+                    request = next(arg for arg in args if isinstance(arg, Request))
+                await self.hit(window, item, self.key_func(request))
+                return await func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    async def hit(self, window: SlidingWindowRateLimiter, item: RateLimitItem, identifier: str):
+        try:
+            result = await asyncio.wait_for(window.hit(identifier), settings.RATE_LIMIT_REDIS_TIMEOUT)
+            allowed, retry_after = result.allowed, result.reset_after
+        except Exception as e:
+            self._fallback_hits.inc()
+            logger.warning(f"Rate limit storage unavailable, counting in memory: {e!r}")
+            allowed, retry_after = self._hit_in_memory(window.prefix, item, identifier)
+
+        if not allowed:
+            raise TooManyRequestsError(retry_after=max(retry_after, 1))
+
+    def _hit_in_memory(self, namespace: str, item: RateLimitItem, identifier: str) -> tuple[bool, int]:
+        if self._fallback.hit(item, namespace, identifier):
+            return True, 0
+        reset_at, _ = self._fallback.get_window_stats(item, namespace, identifier)
+        return False, math.ceil(reset_at - time.time())
+
+
+limiter = RouteRateLimiter(key_func=get_client_ip)
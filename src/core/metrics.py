@@ -0,0 +1,94 @@
+import threading
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Counter:
+    """Bộ đếm tăng dần (số request bị từ chối, cache hit,...)."""
+    value: int = 0
+
+    def inc(self, amount: int = 1):
+        self.value += amount
+
+
+@dataclass
+class Gauge:
+    """Giá trị tức thời có thể tăng/giảm (độ sâu hàng đợi, số kết nối đang dùng,...)."""
+    value: float = 0
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+
+@dataclass
+class Timer:
+    """Thống kê thời gian (giây): số lần đo, tổng, lớn nhất và lần đo gần nhất."""
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    last: float = 0.0
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def avg(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+@dataclass
+class MetricsRegistry:
+    """
+    Registry metrics trong process, đủ nhẹ để gọi trên hot path.
+    Tên metric theo dạng `<thành phần>.<tên>`, ví dụ `password_hasher.queue_depth`.
+    """
+    counters: dict[str, Counter] = field(default_factory=dict)
+    gauges: dict[str, Gauge] = field(default_factory=dict)
+    timers: dict[str, Timer] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def counter(self, name: str) -> Counter:
+        metric = self.counters.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self.counters.setdefault(name, Counter())
+        return metric
+
+    def gauge(self, name: str) -> Gauge:
+        metric = self.gauges.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self.gauges.setdefault(name, Gauge())
+        return metric
+
+    def timer(self, name: str) -> Timer:
+        metric = self.timers.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self.timers.setdefault(name, Timer())
+        return metric
+
+    def snapshot(self) -> dict[str, dict]:
+        """Trả về bản chụp toàn bộ metrics dưới dạng dict (dùng cho log hoặc endpoint nội bộ)."""
+        return {
+            "counters": {name: c.value for name, c in self.counters.items()},
+            "gauges": {name: g.value for name, g in self.gauges.items()},
+            "timers": {
+                name: {"count": t.count, "avg": t.avg, "max": t.max, "last": t.last}
+                for name, t in self.timers.items()
+            },
+        }
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,55 @@
+import ipaddress
+
+from functools import lru_cache
+
+from starlette.requests import Request
+from starlette.types import Scope
+
+from src.core.config import settings
+
+_TRUSTED_NETWORKS = tuple(ipaddress.ip_network(cidr, strict=False) for cidr in settings.TRUSTED_PROXIES)
+
+
+@lru_cache(maxsize=4096)
+def is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _TRUSTED_NETWORKS)
+
+
+def client_ip_from_scope(scope: Scope) -> str:
+    """
+    IP thật của client.
+
+    Chỉ tin X-Forwarded-For khi kết nối đến từ một proxy trong TRUSTED_PROXIES. Khi đó duyệt
+    header từ phải sang trái (phần do proxy của mình thêm vào) và lấy địa chỉ đầu tiên không
+    thuộc proxy tin cậy; phần bên trái do client tự gửi nên có thể bị giả mạo.
+    """
+    client = scope.get("client")
+    peer = client[0] if client else "127.0.0.1"
+    if not _TRUSTED_NETWORKS or not is_trusted_proxy(peer):
+        return peer
+
+    forwarded_for = None
+    for name, value in scope["headers"]:
+        if name == b"x-forwarded-for":
+            # Có thể có nhiều header X-Forwarded-For, nối lại theo thứ tự
+            value = value.decode("latin-1")
+            forwarded_for = value if forwarded_for is None else f"{forwarded_for},{value}"
+
+    if not forwarded_for:
+        return peer
+
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not is_trusted_proxy(hop):
+            return hop
+    # Toàn bộ chuỗi là proxy tin cậy → địa chỉ ngoài cùng bên trái là client
+    return hops[0] if hops else peer
+
+
+def get_client_ip(request: Request) -> str:
+    """key_func cho limiter theo route."""
+    return client_ip_from_scope(request.scope)
@@ -0,0 +1,40 @@
+import math
+import os
+from pathlib import Path
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+
+def available_cpus(cgroup_root: Path = CGROUP_ROOT) -> int:
+    """
+    Số CPU mà process thực sự được dùng: nhỏ nhất giữa CPU affinity và quota CPU của cgroup
+    (docker --cpus, Kubernetes limits.cpu). `os.cpu_count()` trả về số core của cả máy host,
+    trong container sẽ tạo thừa process/worker.
+    """
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        count = os.cpu_count() or 1
+
+    quota = cgroup_cpu_quota(cgroup_root)
+    if quota is not None:
+        count = min(count, max(1, math.ceil(quota)))
+    return count
+
+
+def cgroup_cpu_quota(cgroup_root: Path = CGROUP_ROOT) -> float | None:
+    """Quota CPU (số core, có thể lẻ) theo cgroup v2 hoặc v1; None nếu không giới hạn/không đọc được."""
+    try:
+        # cgroup v2: "<quota> <period>" hoặc "max <period>"
+        quota, period = (cgroup_root / "cpu.max").read_text().split()
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+
+    try:
+        # cgroup v1: quota = -1 nghĩa là không giới hạn
+        quota = int((cgroup_root / "cpu" / "cpu.cfs_quota_us").read_text())
+        period = int((cgroup_root / "cpu" / "cpu.cfs_period_us").read_text())
+        return quota / period if quota > 0 and period > 0 else None
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,59 @@
+import json
+
+from typing import Any
+
+from src.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # orjson là tùy chọn, thiếu thì dùng thư viện chuẩn
+    orjson = None
+
+
+class StdlibJSONCodec:
+    """Codec dùng `json` chuẩn, output giống JSONResponse.render (UTF-8, không escape tiếng Việt)."""
+
+    name = "json"
+    DecodeError = json.JSONDecodeError
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """Codec dùng orjson (C/Rust), cho cùng output với StdlibJSONCodec trên dữ liệu của app."""
+
+    name = "orjson"
+    DecodeError = orjson.JSONDecodeError if orjson else json.JSONDecodeError
+
+    def dumps(self, obj: Any) -> bytes:
+        # OPT_NON_STR_KEYS: chấp nhận key int như json chuẩn
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+
+def create_codec(name: str = "auto") -> StdlibJSONCodec | OrjsonCodec:
+    """
+    Chọn codec JSON theo tên: "orjson", "json" hoặc "auto" (orjson nếu đã cài).
+    Lỗi decode của cả hai codec đều là lớp con của ValueError.
+    """
+    if name == "auto":
+        name = "orjson" if orjson is not None else "json"
+    if name == "orjson":
+        if orjson is None:
+            raise RuntimeError("JSON_CODEC=orjson but orjson is not installed")
+        return OrjsonCodec()
+    if name == "json":
+        return StdlibJSONCodec()
+    raise ValueError(f"Unknown JSON codec: {name}")
+
+
+json_codec = create_codec(settings.JSON_CODEC)
@@ -0,0 +1,54 @@
+import asyncio
+
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+from src.core.metrics import metrics
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Gộp các lời gọi đồng thời cùng key trong một process: chỉ lời gọi đầu tiên thực sự
+    chạy `fn`, các lời gọi đến sau khi nó chưa xong sẽ chờ và nhận chung kết quả (hoặc lỗi).
+
+    Dùng để chống stampede khi nhiều request cùng miss cache một key.
+    """
+
+    def __init__(self, name: str):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self._coalesced = metrics.counter(f"{name}.coalesced")
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        future = self._calls.get(key)
+        if future is not None:
+            self._coalesced.inc()
+            try:
+                # shield: request chờ bị hủy không được hủy lời gọi dùng chung
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if future.cancelled() and not asyncio.current_task().cancelling():
+                    # Lời gọi dẫn đầu bị hủy (request của nó bị ngắt) → tự chạy lại
+                    return await self.do(key, fn)
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Đánh dấu đã đọc lỗi để asyncio không cảnh báo khi không có ai chờ
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._calls.pop(key, None)
@@ -0,0 +1,38 @@
+import time
+
+from typing import Callable
+
+
+class TokenBucket:
+    """
+    Token bucket trong bộ nhớ của process: nạp `rate` token mỗi giây, chứa tối đa `capacity` token.
+
+    Không dùng lock vì chỉ được gọi trong event loop (không có await giữa đọc và ghi).
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at", "_clock")
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self.updated_at = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def consume(self, amount: float = 1) -> bool:
+        """Lấy `amount` token; trả về False (và không trừ gì) nếu không đủ."""
+        self._refill()
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return True
+        return False
+
+    def retry_after(self, amount: float = 1) -> float:
+        """Số giây cần chờ tới khi đủ `amount` token."""
+        self._refill()
+        return max(amount - self.tokens, 0) / self.rate
@@ -1,7 +1,6 @@
-import re
-
 from src.core.utils.validations.base_validation import is_empty, is_too_short, is_email
-from src.core.utils.validations.security_validation import is_safe_input
+from src.core.utils.validations.engine import Rule, RuleSet
+from src.core.utils.validations.security_validation import is_safe_input, unsafe_input_rules
 
 
 def validate_name(name: str) -> str | None:
@@ -26,6 +25,15 @@ def validate_email(email: str) -> str | None:
     return None
 
 
+_PASSWORD = RuleSet([
+    Rule("Mật khẩu phải chứa ít nhất 1 chữ cái in hoa", r"[A-Z]", required=True),
+    Rule("Mật khẩu phải chứa ít nhất 1 chữ cái thường", r"[a-z]", required=True),
+    Rule("Mật khẩu phải chứa ít nhất 1 chữ số", r"[0-9]", required=True),
+    Rule("Mật khẩu phải chứa ít nhất 1 ký tự đặc biệt", r"[\W_]", required=True),
+    *unsafe_input_rules("Mật khẩu chứa ký tự không an toàn"),
+])
+
+
 def validate_password(password: str) -> str | None:
     password = password.strip()
 
@@ -33,18 +41,9 @@ def validate_password(password: str) -> str | None:
         return "Vui lòng nhập mật khẩu của bạn"
     if is_too_short(password, 8):
         return "Mật khẩu phải có ít nhất 8 ký tự"
-    if not re.search(r"[A-Z]", password):
-        return "Mật khẩu phải chứa ít nhất 1 chữ cái in hoa"
-    if not re.search(r"[a-z]", password):
-        return "Mật khẩu phải chứa ít nhất 1 chữ cái thường"
-    if not re.search(r"[0-9]", password):
-        return "Mật khẩu phải chứa ít nhất 1 chữ số"
-    if not re.search(r"[\W_]", password):
-        return "Mật khẩu phải chứa ít nhất 1 ký tự đặc biệt"
-    if not is_safe_input(password):
-        return "Mật khẩu chứa ký tự không an toàn"
 
-    return None
+    # Các rule ký tự và mẫu không an toàn được kiểm tra trong một lần quét
+    return _PASSWORD.check(password)
 
 
 def validate_otp(otp: str) -> str | None:
@@ -1,5 +1,7 @@
 import re
 
+from src.core.utils.validations.engine import Rule, RuleSet
+
 
 def is_empty(text: str | None) -> bool:
     """Kiểm tra xem chuỗi có rỗng không."""
@@ -21,29 +23,27 @@ def is_link(text: str) -> bool:
     return bool(re.search(r"https?://|www\.", text.strip(), re.IGNORECASE))
 
 
+_CODE = RuleSet([
+    # HTML / Script tags
+    Rule("Chứa thẻ HTML", r"[<>]", first_chars="<>"),
+    Rule("Chứa thẻ <script>", r"<script\b[^>]*>.*?</script>", re.IGNORECASE, first_chars="<"),
+    # JavaScript keywords
+    Rule("Chứa từ khóa JavaScript", r"\b(if|else|function|while|for|return|var|let|const|=>|true|false|null|undefined)\b",
+         first_chars="iefwrvlc=tnu"),
+    # Code characters
+    Rule("Chứa ký tự cú pháp code", r"[{}();=\[\]]", first_chars="{}();=[]"),
+    # SQL keywords
+    Rule("Chứa từ khóa SQL", r"\b(SELECT|INSERT|UPDATE|DELETE|DROP|FROM|WHERE|TABLE|VALUES)\b", re.IGNORECASE,
+         first_chars="siudfwtv"),
+])
+
+
 def is_code(text: str) -> bool:
     """
     Kiểm tra xem chuỗi có chứa mã code (JS, SQL, HTML...) không.
     Dùng để phát hiện input độc hại hoặc code injection.
     """
-    trimmed = text.strip()
-
-    # HTML / Script tags
-    if re.search(r"[<>]", trimmed) or re.search(r"<script\b[^>]*>.*?</script>", trimmed, re.IGNORECASE):
-        return True
-
-    # JavaScript keywords
-    js_pattern = r"\b(if|else|function|while|for|return|var|let|const|=>|true|false|null|undefined)\b"
-    if re.search(js_pattern, trimmed):
-        return True
-
-    # Code characters
-    if re.search(r"[{}();=\[\]]", trimmed):
-        return True
-
-    # SQL keywords
-    sql_pattern = r"\b(SELECT|INSERT|UPDATE|DELETE|DROP|FROM|WHERE|TABLE|VALUES)\b"
-    return bool(re.search(sql_pattern, trimmed, re.IGNORECASE))
+    return _CODE.check(text.strip()) is not None
 
 
 def is_numeric(text: str) -> bool:
@@ -0,0 +1,84 @@
+import re
+from dataclasses import dataclass
+from typing import Sequence
+
+# Flag được phép gắn cho từng rule; được chuyển thành flag cục bộ (?i:...) trong pattern gộp
+_SCOPED_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s"}
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    Một rule của trường input.
+
+    - required=False: lỗi khi `pattern` xuất hiện ở bất kỳ đâu (ví dụ: chứa thẻ <script>).
+    - required=True: lỗi khi `pattern` không xuất hiện (ví dụ: mật khẩu phải có chữ in hoa).
+    - first_chars: các ký tự mà một match của rule cấm có thể bắt đầu (áp dụng cùng `flags`).
+      Khi mọi rule cấm đều khai báo, regex gộp chỉ thử các vị trí bắt đầu bằng một trong các
+      ký tự đó thay vì thử mọi rule ở mọi vị trí.
+    """
+    message: str
+    pattern: str
+    flags: re.RegexFlag = re.NOFLAG
+    required: bool = False
+    first_chars: str | None = None
+
+
+class RuleSet:
+    """
+    Kiểm tra một trường input theo danh sách rule, trả về message của rule đầu tiên (theo thứ
+    tự khai báo) bị vi phạm — giống hệt việc gọi `re.search` lần lượt cho từng rule.
+
+    - Mọi rule cấm được gộp thành một regex (phép hoặc, có bộ lọc ký tự đầu `first_chars`) và
+      quét input một lần. Input hợp lệ (trường hợp phổ biến) chỉ tốn một lần quét đó; khi có
+      rule cấm khớp, các rule cấm mới được kiểm tra riêng để biết rule nào và trả đúng message.
+    - Rule bắt buộc giữ regex riêng đã compile: mỗi rule thường là một lớp ký tự, `re` bỏ qua
+      rất nhanh các vị trí không khớp, gộp chung vào phép hoặc lại chậm hơn.
+
+    Pattern của rule không được dùng backreference theo số (\\1,...) vì số nhóm bị dịch khi gộp.
+    """
+
+    def __init__(self, rules: Sequence[Rule]):
+        self.rules = tuple(rules)
+        self._patterns = [re.compile(rule.pattern, rule.flags) for rule in self.rules]
+
+        forbidden = [rule for rule in self.rules if not rule.required]
+        self._forbidden = None
+        if forbidden:
+            combined = "|".join(self._scoped(rule.pattern, rule.flags) for rule in forbidden)
+            if all(rule.first_chars for rule in forbidden):
+                combined = f"(?={self._first_chars_guard(forbidden)})(?:{combined})"
+            self._forbidden = re.compile(combined)
+
+    def check(self, text: str) -> str | None:
+        """Message của rule đầu tiên bị vi phạm, None nếu input thỏa mọi rule."""
+        forbidden_found = None  # chỉ quét regex gộp khi tới rule cấm đầu tiên
+        for rule, pattern in zip(self.rules, self._patterns):
+            if rule.required:
+                if pattern.search(text) is None:
+                    return rule.message
+                continue
+            if forbidden_found is None:
+                forbidden_found = self._forbidden.search(text) is not None
+            if forbidden_found and pattern.search(text) is not None:
+                return rule.message
+        return None
+
+    @classmethod
+    def _first_chars_guard(cls, rules: list[Rule]) -> str:
+        # Gom ký tự đầu theo flags để mỗi nhóm flags chỉ là một lớp ký tự
+        chars_by_flags: dict[re.RegexFlag, set[str]] = {}
+        for rule in rules:
+            chars_by_flags.setdefault(rule.flags, set()).update(rule.first_chars)
+        return "|".join(
+            cls._scoped(f"[{''.join(re.escape(char) for char in sorted(chars))}]", flags)
+            for flags, chars in chars_by_flags.items()
+        )
+
+    @staticmethod
+    def _scoped(pattern: str, flags: re.RegexFlag) -> str:
+        unsupported = flags & ~(re.IGNORECASE | re.MULTILINE | re.DOTALL)
+        if unsupported:
+            raise ValueError(f"Unsupported rule flags: {unsupported!r}")
+        letters = "".join(letter for flag, letter in _SCOPED_FLAGS.items() if flags & flag)
+        return f"(?{letters}:{pattern})" if letters else f"(?:{pattern})"
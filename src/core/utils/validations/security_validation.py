@@ -1,5 +1,30 @@
 import re
 
+from src.core.utils.validations.engine import Rule, RuleSet
+
+# Các mẫu tấn công XSS / SQL injection (không phân biệt hoa thường) kèm ký tự đầu của mỗi mẫu,
+# dùng chung cho các trường input
+UNSAFE_INPUT_PATTERNS = [
+    (r"<script\b[^>]*>", "<"),  # XSS
+    (r"onerror\s*=", "o"),
+    (r"onload\s*=", "o"),
+    (r"(SELECT|INSERT|DELETE|UPDATE|DROP|UNION|FROM|WHERE)\b", "sidufw"),  # SQL
+    (r"--", "-"),  # SQL comment
+    (r";", ";"),  # SQL statement separator
+]
+
+
+def unsafe_input_rules(message: str) -> list[Rule]:
+    """Các rule cấm mẫu tấn công, cùng một `message` khi vi phạm."""
+    return [
+        Rule(message, pattern, re.IGNORECASE, first_chars=first_chars)
+        for pattern, first_chars in UNSAFE_INPUT_PATTERNS
+    ]
+
+
+_UNSAFE_INPUT = RuleSet(unsafe_input_rules("Input chứa mẫu tấn công XSS hoặc SQL injection"))
+
+
 def is_safe_input(text: str) -> bool:
     """
     Kiểm tra input có chứa các mẫu tấn công XSS hoặc SQL injection không.
@@ -7,13 +32,4 @@ def is_safe_input(text: str) -> bool:
     if not text:
         return True
 
-    patterns = [
-        r"<script\b[^>]*>",  # XSS
-        r"onerror\s*=",
-        r"onload\s*=",
-        r"(SELECT|INSERT|DELETE|UPDATE|DROP|UNION|FROM|WHERE)\b",  # SQL
-        r"--",  # SQL comment
-        r";",  # SQL statement separator
-    ]
-
-    return not any(re.search(p, text, re.IGNORECASE) for p in patterns)
+    return _UNSAFE_INPUT.check(text) is None
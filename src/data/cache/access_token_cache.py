@@ -0,0 +1,58 @@
+import hashlib
+import time
+
+from cachetools import TLRUCache
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.domain.entities import AuthPrincipal
+
+
+class AccessTokenCache:
+    """
+    Cache trong process cho access token đã verify.
+
+    Key là digest của token (không giữ token gốc trong bộ nhớ), value là AuthPrincipal.
+    Mỗi entry tự hết hạn đúng thời điểm `exp` của token nên cache không bao giờ
+    chấp nhận token đã hết hạn lâu hơn so với jwt.decode.
+    """
+
+    def __init__(self, maxsize: int | None = None):
+        self._cache: TLRUCache = TLRUCache(
+            maxsize=maxsize or settings.ACCESS_TOKEN_CACHE_SIZE,
+            ttu=lambda _key, value, _now: value[1],
+            timer=time.time,
+        )
+        self._hits = metrics.counter("access_token_cache.hits")
+        self._misses = metrics.counter("access_token_cache.misses")
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> AuthPrincipal | None:
+        entry = self._cache.get(self._digest(token))
+        if entry is None:
+            self._misses.inc()
+            return None
+        self._hits.inc()
+        return entry[0]
+
+    def put(self, token: str, principal: AuthPrincipal, expires_at: float):
+        """Lưu principal tới thời điểm `expires_at` (epoch giây, chính là claim `exp`)."""
+        self._cache[self._digest(token)] = (principal, expires_at)
+
+    def evict(self, token: str):
+        self._cache.pop(self._digest(token), None)
+
+    def evict_user(self, user_id: int):
+        """Xóa mọi token đã cache của một user (gọi khi user đăng xuất)."""
+        stale = [key for key, (principal, _) in list(self._cache.items()) if principal.id == user_id]
+        for key in stale:
+            self._cache.pop(key, None)
+
+    def clear(self):
+        self._cache.clear()
+
+
+access_token_cache = AccessTokenCache()
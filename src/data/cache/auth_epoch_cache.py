@@ -0,0 +1,76 @@
+import logging
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.data.cache.lua_scripts import lua_scripts
+from src.data.cache.redis_service import RedisService
+from src.domain.entities import AuthEpoch
+
+logger = logging.getLogger(__name__)
+
+# Ghi epoch "giữ giá trị lớn nhất": bộ đếm chỉ tăng, nên một lần ghi đến muộn
+# (request cũ, đọc từ replica trễ) không thể kéo epoch trong cache lùi lại.
+# KEYS[1] = auth_epoch:{user_id}, ARGV[1] = signin_count, ARGV[2] = sign_out_count, ARGV[3] = TTL (giây)
+lua_scripts.register("auth_epoch_put", """
+local signin_count = tonumber(ARGV[1])
+local sign_out_count = tonumber(ARGV[2])
+local current = redis.call('GET', KEYS[1])
+if current then
+    local cached_signin, cached_sign_out = string.match(current, '^(%d+):(%d+)$')
+    if cached_signin then
+        signin_count = math.max(signin_count, tonumber(cached_signin))
+        sign_out_count = math.max(sign_out_count, tonumber(cached_sign_out))
+    end
+end
+local value = signin_count .. ':' .. sign_out_count
+redis.call('SET', KEYS[1], value, 'EX', ARGV[3])
+return value
+""")
+
+
+class AuthEpochCache:
+    """
+    Bản sao (signin_count, sign_out_count) của từng user trên Redis, dạng chuỗi "signin:sign_out".
+
+    Repository ghi xuyên (write-through) mỗi khi bộ đếm đổi và đọc xuyên (read-through) khi
+    cache trống, nên kiểm tra token ở refresh/sign-out chỉ cần một lệnh GET.
+    """
+
+    KEY_PREFIX = "auth_epoch:"
+
+    def __init__(self, redis_service: RedisService):
+        self.redis_service = redis_service
+        self._hits = metrics.counter("auth_epoch_cache.hits")
+        self._misses = metrics.counter("auth_epoch_cache.misses")
+
+    async def get(self, user_id: int) -> AuthEpoch | None:
+        try:
+            value = await self.redis_service.get(f"{self.KEY_PREFIX}{user_id}")
+        except Exception as e:
+            logger.warning(f"Auth epoch lookup failed for user {user_id}: {e}")
+            value = None
+
+        if value is None:
+            self._misses.inc()
+            return None
+
+        self._hits.inc()
+        signin_count, sign_out_count = value.split(":")
+        return AuthEpoch(user_id=user_id, signin_count=int(signin_count), sign_out_count=int(sign_out_count))
+
+    async def put(self, epoch: AuthEpoch):
+        key = f"{self.KEY_PREFIX}{epoch.user_id}"
+        try:
+            await self.redis_service.eval_script(
+                "auth_epoch_put",
+                keys=[key],
+                args=[epoch.signin_count, epoch.sign_out_count, settings.AUTH_EPOCH_TTL_SECONDS],
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write auth epoch for user {epoch.user_id}: {e}")
+            # Epoch cũ còn trong cache tới hết TTL sẽ vẫn chấp nhận token lẽ ra đã bị thu hồi
+            # → xóa key (best effort) để lần kiểm tra sau đọc lại DB
+            try:
+                await self.redis_service.delete(key)
+            except Exception as e:
+                logger.warning(f"Failed to drop stale auth epoch for user {epoch.user_id}: {e}")
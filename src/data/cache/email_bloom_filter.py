@@ -0,0 +1,192 @@
+import asyncio
+import hashlib
+import logging
+import math
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.data.cache.lua_scripts import lua_scripts
+from src.data.cache.redis_service import RedisService
+from src.data.db.session import engine as primary_engine
+from src.data.models import UserModel
+
+logger = logging.getLogger(__name__)
+
+# Kiểm tra các bit của một email. KEYS[1] = bitmap, ARGV = vị trí bit
+# Trả về -1 nếu bitmap chưa được dựng (chưa biết), 0 nếu chắc chắn chưa đăng ký, 1 nếu có thể đã đăng ký.
+lua_scripts.register("bloom_check", """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+for i = 1, #ARGV do
+    if redis.call('GETBIT', KEYS[1], ARGV[i]) == 0 then
+        return 0
+    end
+end
+return 1
+""")
+
+# Thêm một email vào bitmap chính và bitmap đang dựng lại (nếu có).
+# Không tạo bitmap mới: một bitmap chỉ chứa vài email sẽ trả lời "chưa đăng ký" sai cho mọi email khác.
+# KEYS[1] = bitmap chính, KEYS[2] = bitmap đang dựng, ARGV = vị trí bit
+lua_scripts.register("bloom_add", """
+for k = 1, 2 do
+    if redis.call('EXISTS', KEYS[k]) == 1 then
+        for i = 1, #ARGV do
+            redis.call('SETBIT', KEYS[k], ARGV[i], 1)
+        end
+    end
+end
+return 1
+""")
+
+
+def optimal_parameters(expected_items: int, false_positive_rate: float) -> tuple[int, int]:
+    """Số bit (m) và số hàm hash (k) tối ưu cho n phần tử với tỉ lệ dương tính giả p."""
+    bits = math.ceil(-expected_items * math.log(false_positive_rate) / (math.log(2) ** 2))
+    hashes = max(1, round(bits / expected_items * math.log(2)))
+    return bits, hashes
+
+
+class EmailBloomFilter:
+    """
+    Bloom filter các email đã đăng ký, lưu bằng bitmap trên Redis nên mọi worker dùng chung.
+
+    - `might_exist(email)` trả về False khi email chắc chắn chưa đăng ký → repository bỏ qua DB.
+      Khi bitmap chưa dựng xong hoặc Redis lỗi thì trả về True (đi tiếp xuống DB như cũ).
+    - Khi khởi động, một worker (giữ lock NX) stream toàn bộ email trong bảng users vào bitmap
+      tạm rồi RENAME đè bitmap chính; email đăng ký trong lúc dựng được ghi vào cả hai bitmap.
+    - Tên key chứa (m, k) nên khi đổi cấu hình, bitmap cũ không bị dùng nhầm.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self,
+                 engine: AsyncEngine,
+                 redis_service: RedisService | None = None,
+                 expected_items: int | None = None,
+                 false_positive_rate: float | None = None):
+        self.engine = engine
+        self.redis_service = redis_service or RedisService()
+        self.expected_items = expected_items or settings.EMAIL_BLOOM_EXPECTED_ITEMS
+        self.false_positive_rate = false_positive_rate or settings.EMAIL_BLOOM_FALSE_POSITIVE_RATE
+        self.bits, self.hashes = optimal_parameters(self.expected_items, self.false_positive_rate)
+
+        self.key = f"email_bloom:{self.bits}:{self.hashes}"
+        self.building_key = f"{self.key}:building"
+        self.lock_key = f"{self.key}:lock"
+        self._task: asyncio.Task | None = None
+
+        self._negatives = metrics.counter("email_bloom.negatives")
+        self._positives = metrics.counter("email_bloom.positives")
+        self._unavailable = metrics.counter("email_bloom.unavailable")
+        metrics.gauge("email_bloom.memory_bytes").set(math.ceil(self.bits / 8))
+        metrics.gauge("email_bloom.hashes").set(self.hashes)
+
+    def positions(self, email: str) -> list[int]:
+        """k vị trí bit của email (double hashing trên một digest blake2b)."""
+        digest = hashlib.blake2b(email.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    async def might_exist(self, email: str) -> bool:
+        try:
+            result = await self.redis_service.eval_script("bloom_check", keys=[self.key], args=self.positions(email))
+        except Exception as e:
+            logger.warning(f"Email bloom filter lookup failed: {e}")
+            result = -1
+
+        if result == 0:
+            self._negatives.inc()
+            return False
+        if result == -1:
+            self._unavailable.inc()
+        else:
+            self._positives.inc()
+        return True
+
+    async def add(self, email: str):
+        try:
+            await self.redis_service.eval_script(
+                "bloom_add", keys=[self.key, self.building_key], args=self.positions(email)
+            )
+        except Exception as e:
+            # Thiếu email trong filter sẽ khiến user không đăng nhập được → bỏ filter, quay về DB
+            logger.error(f"Failed to add email to bloom filter, dropping filter: {e}")
+            try:
+                await self.redis_service.delete(self.key)
+            except Exception:
+                logger.exception("Failed to drop email bloom filter")
+
+    def start(self):
+        """Dựng lại filter trong nền; trong lúc dựng, các lần kiểm tra vẫn đi xuống DB."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.rebuild())
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def rebuild(self):
+        acquired = await self.redis_service.set_nx(
+            self.lock_key, uuid.uuid4().hex, expire_seconds=settings.EMAIL_BLOOM_REBUILD_LOCK_SECONDS
+        )
+        if not acquired:
+            logger.info("Email bloom filter is being rebuilt by another worker")
+            return
+
+        try:
+            count = await self._stream_emails()
+            async with self.redis_service.pipeline() as pipe:
+                pipe.rename(self.building_key, self.key)
+                pipe.bitcount(self.key)
+                _, bits_set = await pipe.execute()
+        except Exception:
+            logger.exception("Email bloom filter rebuild failed")
+            return
+
+        estimated_rate = (bits_set / self.bits) ** self.hashes
+        metrics.gauge("email_bloom.items").set(count)
+        metrics.gauge("email_bloom.estimated_false_positive_rate").set(estimated_rate)
+        logger.info(
+            f"Email bloom filter rebuilt: {count} emails, {self.bits / 8 / 1024 / 1024:.2f} MiB, "
+            f"k={self.hashes}, target fpr={self.false_positive_rate}, estimated fpr={estimated_rate:.6f}"
+        )
+        if count > self.expected_items:
+            logger.warning(
+                f"Email bloom filter holds {count} emails, above EMAIL_BLOOM_EXPECTED_ITEMS={self.expected_items}"
+            )
+
+    async def _stream_emails(self) -> int:
+        # Tạo sẵn bitmap tạm (toàn bit 0) để add() ghi vào ngay từ lúc bắt đầu stream
+        async with self.redis_service.pipeline() as pipe:
+            pipe.delete(self.building_key)
+            pipe.setbit(self.building_key, self.bits - 1, 0)
+            await pipe.execute()
+
+        count = 0
+        async with self.engine.connect() as conn:
+            result = await conn.stream(
+                select(UserModel.email).execution_options(yield_per=self.BATCH_SIZE)
+            )
+            async for batch in result.partitions(self.BATCH_SIZE):
+                async with self.redis_service.pipeline(transaction=False) as pipe:
+                    for (email,) in batch:
+                        for position in self.positions(email):
+                            pipe.setbit(self.building_key, position, 1)
+                    await pipe.execute()
+                count += len(batch)
+        return count
+
+
+email_bloom_filter = EmailBloomFilter(primary_engine)
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import re
+import time
+
+import httpx
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.utils.single_flight import SingleFlight
+from src.data.cache.redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+def parse_max_age(cache_control: str | None, age: str | None = None) -> int | None:
+    """Số giây còn được cache theo header Cache-Control (trừ đi header Age nếu có)."""
+    match = _MAX_AGE.search(cache_control or "")
+    if not match:
+        return None
+    return max(int(match.group(1)) - int(age or 0), 0)
+
+
+class GoogleCertsCache:
+    """
+    Cache các public key Google dùng để ký ID token (dạng {kid: PEM}).
+
+    - Tải bằng httpx (không chặn event loop), lưu trong process và trên Redis theo
+      Cache-Control max-age của Google, nên mỗi lần đăng nhập không cần gọi mạng.
+    - Task nền làm mới key trước khi hết hạn GOOGLE_CERTS_REFRESH_MARGIN_SECONDS giây; nếu
+      process khác đã làm mới trên Redis thì dùng lại, không tải lại từ Google.
+    - Tải lỗi thì tiếp tục dùng key cũ (Google giữ key cũ song song một thời gian sau khi xoay).
+    """
+
+    REDIS_KEY = "google_certs"
+    RETRY_SECONDS = 30
+    # Khoảng cách tối thiểu giữa hai lần ép tải lại (token mang kid lạ), tránh bị lợi dụng để spam Google
+    MIN_FORCED_REFRESH_SECONDS = 60
+
+    def __init__(self, redis_service: RedisService, url: str | None = None):
+        self.redis_service = redis_service
+        self.url = url or settings.GOOGLE_CERTS_URL
+        self._certs: dict[str, str] = {}
+        self._expires_at = 0.0  # epoch giây, dùng chung định dạng với bản trên Redis
+        self._fetched_at = float("-inf")
+        self._client: httpx.AsyncClient | None = None
+        self._task: asyncio.Task | None = None
+        self._single_flight = SingleFlight("google_certs")
+
+        self._fetches = metrics.counter("google_certs.fetches")
+        self._redis_hits = metrics.counter("google_certs.redis_hits")
+        self._fetch_errors = metrics.counter("google_certs.fetch_errors")
+
+    async def get(self) -> dict[str, str]:
+        if self._certs and time.time() < self._expires_at:
+            return self._certs
+        try:
+            return await self._single_flight.do("load", self._load)
+        except Exception as e:
+            if not self._certs:
+                raise
+            logger.warning(f"Google certs refresh failed, serving stale keys: {e}")
+            return self._certs
+
+    async def refresh(self) -> dict[str, str]:
+        """Ép tải lại từ Google (token mang kid chưa biết), tối đa một lần mỗi MIN_FORCED_REFRESH_SECONDS."""
+        if time.monotonic() - self._fetched_at < self.MIN_FORCED_REFRESH_SECONDS:
+            return self._certs
+        return await self._single_flight.do("fetch", self._fetch)
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def _refresh_loop(self):
+        while True:
+            delay = self._expires_at - time.time() - settings.GOOGLE_CERTS_REFRESH_MARGIN_SECONDS
+            # Lần đầu tải ngay; sau đó không làm mới dày hơn RETRY_SECONDS dù max-age rất ngắn
+            await asyncio.sleep(max(delay, self.RETRY_SECONDS if self._certs else 0))
+            try:
+                await self._load(margin=settings.GOOGLE_CERTS_REFRESH_MARGIN_SECONDS)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Google certs background refresh failed")
+                await asyncio.sleep(self.RETRY_SECONDS)
+
+    async def _load(self, margin: float = 0) -> dict[str, str]:
+        """Lấy key từ Redis nếu còn hạn quá `margin` giây, ngược lại tải từ Google."""
+        try:
+            cached = await self.redis_service.get_json(self.REDIS_KEY)
+        except Exception as e:
+            logger.warning(f"Google certs Redis lookup failed: {e}")
+            cached = None
+
+        if cached and cached["expires_at"] - margin > time.time():
+            self._redis_hits.inc()
+            self._certs, self._expires_at = cached["certs"], cached["expires_at"]
+            return self._certs
+        return await self._fetch()
+
+    async def _fetch(self) -> dict[str, str]:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=settings.GOOGLE_CERTS_FETCH_TIMEOUT)
+
+        self._fetches.inc()
+        try:
+            response = await self._client.get(self.url)
+            response.raise_for_status()
+            certs = response.json()
+        except Exception:
+            self._fetch_errors.inc()
+            raise
+
+        max_age = parse_max_age(response.headers.get("cache-control"), response.headers.get("age"))
+        if max_age is None:
+            max_age = settings.GOOGLE_CERTS_DEFAULT_MAX_AGE_SECONDS
+        self._certs, self._expires_at = certs, time.time() + max_age
+        self._fetched_at = time.monotonic()
+
+        if max_age > 0:
+            try:
+                await self.redis_service.set_json(
+                    self.REDIS_KEY, {"certs": certs, "expires_at": self._expires_at}, expire_seconds=max_age
+                )
+            except Exception as e:
+                logger.warning(f"Failed to store Google certs in Redis: {e}")
+        return certs
@@ -0,0 +1,47 @@
+import logging
+
+from redis.commands.core import AsyncScript
+
+from src.data.cache.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class LuaScriptRegistry:
+    """
+    Danh sách các Lua script dùng chung của ứng dụng.
+
+    Mỗi script được đăng ký một lần lúc import (thường ở module service dùng nó) và được
+    nạp sẵn lên Redis bằng SCRIPT LOAD khi khởi động, nên mọi lần gọi sau chỉ tốn một
+    round trip EVALSHA. Nếu Redis bị restart/flush mất script, AsyncScript tự nạp lại.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._scripts: dict[str, AsyncScript] = {}
+
+    def register(self, name: str, source: str) -> AsyncScript:
+        """
+        Đăng ký một script theo tên.
+
+        :param name: Tên định danh, dùng với `RedisService.eval_script`.
+        :param source: Mã Lua.
+        :return: Đối tượng script có thể gọi trực tiếp.
+        """
+        if name in self._scripts:
+            raise ValueError(f"Lua script '{name}' is already registered")
+        script = self.client.register_script(source)
+        self._scripts[name] = script
+        return script
+
+    def get(self, name: str) -> AsyncScript:
+        return self._scripts[name]
+
+    async def load_all(self):
+        """Nạp toàn bộ script đã đăng ký lên Redis (SCRIPT LOAD)."""
+        for name, script in self._scripts.items():
+            script.sha = await self.client.script_load(script.script)
+        logger.info(f"Loaded {len(self._scripts)} Lua scripts into Redis")
+
+
+lua_scripts = LuaScriptRegistry(redis_client)
@@ -0,0 +1,89 @@
+import math
+import uuid
+
+from dataclasses import dataclass
+
+from src.core.metrics import metrics
+from src.data.cache.lua_scripts import lua_scripts
+from src.data.cache.redis_service import RedisService
+
+# Cửa sổ trượt trên một ZSET: mỗi lần được phép là một phần tử có score = thời điểm (ms).
+# Thời gian lấy từ Redis (TIME) nên không phụ thuộc đồng hồ của từng worker.
+# KEYS[1] = key giới hạn, ARGV[1] = số lần tối đa, ARGV[2] = độ dài cửa sổ (ms), ARGV[3] = id lần gọi
+# Trả về {được phép (1/0), số lần còn lại, số ms tới khi có thêm quota}.
+lua_scripts.register("sliding_window_hit", """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window_ms)
+local count = redis.call('ZCARD', key)
+
+local allowed = 0
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[3])
+    count = count + 1
+    allowed = 1
+end
+redis.call('PEXPIRE', key, window_ms)
+
+local reset_ms = 0
+if count >= limit then
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    reset_ms = tonumber(oldest[2]) + window_ms - now
+end
+return {allowed, limit - count, reset_ms}
+""")
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    remaining: int
+    reset_after: int  # Số giây tới khi được gọi lại; 0 nếu vẫn còn quota
+
+
+class SlidingWindowRateLimiter:
+    """
+    Bộ giới hạn tần suất dạng cửa sổ trượt chạy hoàn toàn trên Redis.
+
+    Kiểm tra và ghi nhận trong cùng một Lua script (một round trip, nguyên tử), nên các
+    request đồng thời ở nhiều worker không thể cùng vượt giới hạn. Mỗi loại giới hạn
+    (theo email, IP, user,...) là một instance với prefix riêng:
+
+        limiter = SlidingWindowRateLimiter("otp_rate", limit=5, window_seconds=900)
+        result = await limiter.hit(email)
+    """
+
+    def __init__(self, prefix: str, limit: int, window_seconds: int, redis_service: RedisService | None = None):
+        self.prefix = prefix
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.redis_service = redis_service or RedisService()
+
+        self._rejected = metrics.counter(f"rate_limit.{prefix}.rejected")
+
+    def key(self, identifier: str | int) -> str:
+        return f"{self.prefix}:{identifier}"
+
+    async def hit(self, identifier: str | int) -> RateLimitResult:
+        """Ghi nhận một lần gọi nếu còn quota và trả về kết quả."""
+        allowed, remaining, reset_ms = await self.redis_service.eval_script(
+            "sliding_window_hit",
+            keys=[self.key(identifier)],
+            args=[self.limit, self.window_seconds * 1000, uuid.uuid4().hex],
+        )
+        if not allowed:
+            self._rejected.inc()
+        return RateLimitResult(
+            allowed=bool(allowed),
+            remaining=int(remaining),
+            reset_after=math.ceil(int(reset_ms) / 1000),
+        )
+
+    async def reset(self, identifier: str | int):
+        """Xóa toàn bộ lịch sử gọi của identifier."""
+        await self.redis_service.delete(self.key(identifier))
@@ -1,13 +1,48 @@
-import json
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Sequence
+
+from redis.asyncio.client import Pipeline
+from redis.exceptions import ResponseError
+
+from src.core.utils.json_codec import json_codec
 # Giả sử redis_client là một instance của redis.asyncio.Redis
 from src.data.cache.redis_client import redis_client
+from src.data.cache.lua_scripts import lua_scripts
 
 
 class RedisService:
     """
     Lớp dịch vụ cung cấp các phương thức tiện ích để tương tác với Redis,
     bao gồm các thao tác với String, JSON và Hash.
+
+    Các thao tác cần nhiều lệnh nên gom vào `pipeline()` hoặc một Lua script
+    (`eval_script`) để chỉ tốn một round trip tới Redis.
     """
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = True) -> AsyncIterator[Pipeline]:
+        """
+        Gom nhiều lệnh và gửi trong một round trip.
+
+        Các lệnh được xếp hàng trên pipeline và gửi đi khi gọi `await pipe.execute()`
+        (kết quả trả về theo đúng thứ tự lệnh). Pipeline được reset khi thoát khối `with`.
+
+        :param transaction: True để bọc các lệnh trong MULTI/EXEC (thực thi nguyên tử).
+        """
+        async with redis_client.pipeline(transaction=transaction) as pipe:
+            yield pipe
+
+    async def eval_script(self, name: str, keys: Sequence[str] = (), args: Sequence = ()):
+        """
+        Chạy một Lua script đã đăng ký trong `lua_scripts` bằng EVALSHA.
+
+        :param name: Tên script đã đăng ký.
+        :param keys: Danh sách KEYS truyền cho script.
+        :param args: Danh sách ARGV truyền cho script.
+        :return: Giá trị script trả về.
+        """
+        return await lua_scripts.get(name)(keys=keys, args=args)
+
     async def set_json(self, key: str, data: dict, expire_seconds: int | None = None):
         """
         Chuyển đổi một dictionary thành chuỗi JSON và lưu vào Redis với một key.
@@ -16,7 +51,7 @@ class RedisService:
         :param data: Dữ liệu dictionary cần lưu.
         :param expire_seconds: Thời gian tự hủy (TTL) tính bằng giây (tùy chọn).
         """
-        value = json.dumps(data)
+        value = json_codec.dumps(data)
         await redis_client.set(key, value, ex=expire_seconds)
 
     async def get_json(self, key: str) -> dict | None:
@@ -27,7 +62,17 @@ class RedisService:
         :return: Dữ liệu dictionary nếu key tồn tại, ngược lại trả về None.
         """
         value = await redis_client.get(key)
-        return json.loads(value) if value else None
+        return json_codec.loads(value) if value else None
+
+    async def getdel_json(self, key: str) -> dict | None:
+        """
+        Lấy và xóa một chuỗi JSON trong cùng một lệnh (GETDEL), dùng cho dữ liệu chỉ được đọc một lần.
+
+        :param key: Key cần lấy dữ liệu.
+        :return: Dữ liệu dictionary nếu key tồn tại, ngược lại trả về None.
+        """
+        value = await redis_client.getdel(key)
+        return json_codec.loads(value) if value else None
 
     async def set(self, key: str, value: str | int | dict, expire_seconds: int | None = None):
         """
@@ -39,11 +84,24 @@ class RedisService:
         :param expire_seconds: Thời gian tự hủy (TTL) tính bằng giây (tùy chọn).
         """
         if isinstance(value, dict):
-            value = json.dumps(value)
+            value = json_codec.dumps(value)
         else:
             value = str(value)
         await redis_client.set(key, value, ex=expire_seconds)
 
+    async def set_nx(self, key: str, value: str | int, expire_seconds: int | None = None,
+                     expire_ms: int | None = None) -> bool:
+        """
+        Chỉ lưu giá trị nếu key chưa tồn tại (SET NX), thường dùng làm lock.
+
+        :param key: Key để lưu trong Redis.
+        :param value: Giá trị cần lưu.
+        :param expire_seconds: Thời gian tự hủy (TTL) tính bằng giây (tùy chọn).
+        :param expire_ms: Thời gian tự hủy tính bằng mili giây, dùng thay cho expire_seconds (tùy chọn).
+        :return: True nếu đã lưu, False nếu key đã tồn tại.
+        """
+        return bool(await redis_client.set(key, str(value), ex=expire_seconds, px=expire_ms, nx=True))
+
     async def get(self, key: str) -> str | None:
         """
         Lấy giá trị dạng chuỗi thô từ Redis theo key.
@@ -53,6 +111,15 @@ class RedisService:
         """
         return await redis_client.get(key)
 
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        """
+        Lấy giá trị của nhiều key trong một lần gọi.
+
+        :param keys: Danh sách key cần lấy.
+        :return: Danh sách giá trị theo đúng thứ tự key, None với key không tồn tại.
+        """
+        return await redis_client.mget(keys)
+
     async def delete(self, key: str):
         """
         Xóa một key và giá trị tương ứng khỏi Redis.
@@ -118,4 +185,55 @@ class RedisService:
         :param key: Key của cấu trúc Hash.
         :param field: Tên của trường cần xóa.
         """
-        await redis_client.hdel(key, field)
\ No newline at end of file
+        await redis_client.hdel(key, field)
+
+    async def xadd(self, stream: str, fields: dict, maxlen: int | None = None) -> str:
+        """
+        Thêm một entry vào Redis Stream.
+
+        :param stream: Tên stream.
+        :param fields: Các trường của entry.
+        :param maxlen: Giới hạn gần đúng số entry của stream (tùy chọn).
+        :return: Id của entry vừa thêm.
+        """
+        return await redis_client.xadd(stream, fields, maxlen=maxlen, approximate=True)
+
+    async def xgroup_create(self, stream: str, group: str):
+        """
+        Tạo consumer group (và stream nếu chưa có); bỏ qua nếu group đã tồn tại.
+
+        :param stream: Tên stream.
+        :param group: Tên consumer group.
+        """
+        try:
+            await redis_client.xgroup_create(stream, group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def xreadgroup(self, group: str, consumer: str, streams: list[str], count: int,
+                         block_ms: int | None = None) -> list:
+        """
+        Đọc các entry mới (chưa giao cho consumer nào) của một hoặc nhiều stream qua consumer group.
+
+        :param count: Số entry tối đa đọc từ mỗi stream.
+        :param block_ms: Thời gian chờ entry mới; None = không chờ.
+        :return: Danh sách (stream, id, fields); rỗng nếu không có entry mới.
+        """
+        response = await redis_client.xreadgroup(
+            group, consumer, {stream: ">" for stream in streams}, count=count, block=block_ms
+        )
+        return [
+            (stream, entry_id, fields)
+            for stream, entries in response or []
+            for entry_id, fields in entries
+        ]
+
+    async def xautoclaim(self, stream: str, group: str, consumer: str, min_idle_ms: int, count: int) -> list:
+        """
+        Nhận về consumer này các entry đã pending quá `min_idle_ms` (consumer cũ bị treo/chết).
+
+        :return: Danh sách (id, fields); fields là None nếu entry đã bị xóa khỏi stream.
+        """
+        response = await redis_client.xautoclaim(stream, group, consumer, min_idle_ms, start_id="0-0", count=count)
+        return response[1]
@@ -0,0 +1,158 @@
+import dataclasses
+import logging
+
+from datetime import datetime
+from typing import Awaitable, Callable
+
+from cachetools import TTLCache
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.utils.json_codec import json_codec
+from src.core.utils.single_flight import SingleFlight
+from src.data.cache.lua_scripts import lua_scripts
+from src.data.cache.redis_service import RedisService
+from src.domain.entities import UserEntity, UserStatus
+
+logger = logging.getLogger(__name__)
+
+# Ghi user vào cache (theo id và email) trừ khi một trong hai key vừa bị invalidate.
+# Chặn trường hợp request A đọc DB, request B ghi + invalidate, rồi A mới ghi bản cũ vào cache.
+# KEYS[1], KEYS[2] = key theo id/email, KEYS[3], KEYS[4] = tombstone tương ứng
+# ARGV[1] = JSON của user, ARGV[2] = TTL (giây)
+lua_scripts.register("user_cache_fill", """
+if redis.call('EXISTS', KEYS[3], KEYS[4]) > 0 then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[2])
+return 1
+""")
+
+
+class UserCache:
+    """
+    Cache hai tầng cho UserEntity, đặt trước Postgres:
+
+    - L1: TTLCache trong process, TTL rất ngắn (USER_CACHE_LOCAL_TTL_SECONDS) vì các worker
+      khác không thể xóa L1 của process này khi user thay đổi.
+    - L2: JSON trên Redis (USER_CACHE_TTL_SECONDS), dùng chung cho mọi worker.
+
+    Mỗi user được lưu dưới cả key id và key email. Khi ghi DB, repository gọi `invalidate`
+    để xóa cả hai tầng và đặt tombstone ngắn hạn trên Redis; trong lúc tombstone còn, các lần
+    nạp lại sẽ không ghi vào L2 (tránh ghi đè bằng dữ liệu đọc trước khi ghi).
+    Các lần miss đồng thời cùng key trong một process được gộp thành một truy vấn DB.
+
+    Hash mật khẩu không bao giờ được lưu ở cả hai tầng: user lấy từ cache luôn có password=None,
+    đăng nhập bằng mật khẩu đọc hash thẳng từ DB (UserRepository.get_user_credentials_by_email).
+    """
+
+    TOMBSTONE_SECONDS = 10
+
+    def __init__(self, redis_service: RedisService):
+        self.redis_service = redis_service
+        self._local: TTLCache = TTLCache(
+            maxsize=settings.USER_CACHE_LOCAL_SIZE,
+            ttl=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+        )
+        # Tăng mỗi lần invalidate; lần nạp bắt đầu trước đó không được ghi vào L1
+        self._generation = 0
+        self._single_flight = SingleFlight("user_cache")
+
+        self._local_hits = metrics.counter("user_cache.local_hits")
+        self._redis_hits = metrics.counter("user_cache.redis_hits")
+        self._misses = metrics.counter("user_cache.misses")
+
+    @staticmethod
+    def id_key(user_id: int) -> str:
+        return f"user_cache:id:{user_id}"
+
+    @staticmethod
+    def email_key(email: str) -> str:
+        return f"user_cache:email:{email}"
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[UserEntity | None]]) -> UserEntity | None:
+        """
+        Lấy user theo key cache; nếu cả hai tầng đều miss thì gọi `loader` (đọc DB) rồi lưu lại.
+        Luôn trả về bản sao để caller có thể sửa entity mà không ảnh hưởng cache.
+        """
+        user = self._local.get(key)
+        if user is not None:
+            self._local_hits.inc()
+            return dataclasses.replace(user)
+
+        user = await self._single_flight.do(key, lambda: self._load(key, loader))
+        return dataclasses.replace(user) if user is not None else None
+
+    async def invalidate(self, user_id: int | None, *emails: str):
+        """Xóa user khỏi cả hai tầng (gọi sau khi commit thay đổi của user)."""
+        keys = [self.email_key(email) for email in emails if email]
+        if user_id is not None:
+            keys.append(self.id_key(user_id))
+
+        self._generation += 1
+        for key in keys:
+            self._local.pop(key, None)
+
+        try:
+            async with self.redis_service.pipeline(transaction=False) as pipe:
+                pipe.delete(*keys)
+                for key in keys:
+                    pipe.set(f"{key}:invalidated", 1, ex=self.TOMBSTONE_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to invalidate user cache {keys}: {e}")
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[UserEntity | None]]) -> UserEntity | None:
+        generation = self._generation
+
+        user = await self._get_remote(key)
+        if user is not None:
+            self._redis_hits.inc()
+        else:
+            self._misses.inc()
+            user = await loader()
+            if user is None:
+                return None
+            user = dataclasses.replace(user, password=None)
+            await self._put_remote(user)
+
+        if generation == self._generation:
+            self._local[self.id_key(user.id)] = user
+            self._local[self.email_key(user.email)] = user
+        return user
+
+    async def _get_remote(self, key: str) -> UserEntity | None:
+        try:
+            data = await self.redis_service.get_json(key)
+        except Exception as e:
+            logger.warning(f"User cache lookup failed for {key}: {e}")
+            return None
+        return self._from_cache(data) if data else None
+
+    async def _put_remote(self, user: UserEntity):
+        id_key, email_key = self.id_key(user.id), self.email_key(user.email)
+        try:
+            await self.redis_service.eval_script(
+                "user_cache_fill",
+                keys=[id_key, email_key, f"{id_key}:invalidated", f"{email_key}:invalidated"],
+                args=[json_codec.dumps(self._to_cache(user)), settings.USER_CACHE_TTL_SECONDS],
+            )
+        except Exception as e:
+            logger.warning(f"Failed to fill user cache for user {user.id}: {e}")
+
+    @staticmethod
+    def _to_cache(user: UserEntity) -> dict:
+        data = dataclasses.asdict(user)
+        data["last_login"] = user.last_login.isoformat() if user.last_login else None
+        data["status"] = user.status.value if user.status else None
+        data.pop("password", None)
+        return data
+
+    @staticmethod
+    def _from_cache(data: dict) -> UserEntity:
+        data["last_login"] = datetime.fromisoformat(data["last_login"]) if data["last_login"] else None
+        data["status"] = UserStatus(data["status"]) if data["status"] else None
+        # Bản ghi cũ trên Redis có thể còn hash mật khẩu
+        data["password"] = None
+        return UserEntity(**data)
@@ -0,0 +1,41 @@
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.core.metrics import metrics
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool có đo thời gian chờ lấy kết nối và mức độ bão hòa của pool.
+
+    Metrics theo tên `pool_logging_name` của engine (mặc định "primary"):
+    - db.<name>.checkout_wait: thời gian chờ lấy kết nối (gồm cả mở kết nối mới)
+    - db.<name>.checked_out / db.<name>.saturation: số kết nối đang dùng và tỷ lệ trên sức chứa
+    - db.<name>.checkout_timeouts: số lần hết pool_timeout mà không có kết nối
+    """
+
+    def _do_get(self):
+        name = self._orig_logging_name or "primary"
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            metrics.counter(f"db.{name}.checkout_timeouts").inc()
+            raise
+        finally:
+            metrics.timer(f"db.{name}.checkout_wait").observe(time.perf_counter() - started)
+
+        self._report_usage(name)
+        return record
+
+    def _do_return_conn(self, record):
+        super()._do_return_conn(record)
+        self._report_usage(self._orig_logging_name or "primary")
+
+    def _report_usage(self, name: str):
+        checked_out = self.checkedout()
+        capacity = self.size() + max(self._max_overflow, 0)
+        metrics.gauge(f"db.{name}.checked_out").set(checked_out)
+        metrics.gauge(f"db.{name}.saturation").set(checked_out / capacity if capacity else 0)
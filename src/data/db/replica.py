@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.data.cache.redis_service import RedisService
+from src.data.db.session import replica_engine
+
+logger = logging.getLogger(__name__)
+
+# Độ trễ replay của replica (giây); bằng 0 khi replica đã replay hết WAL nhận được
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+class ReplicaRouter:
+    """
+    Quyết định truy vấn chỉ đọc được chạy trên replica hay phải quay về primary.
+
+    - Một task nền đo độ trễ replica định kỳ; khi trễ quá DB_REPLICA_MAX_LAG_SECONDS
+      hoặc không đo được, mọi truy vấn đọc quay về primary.
+    - Read-your-writes: sau mỗi lần ghi, repository đánh dấu các key liên quan
+      (ví dụ `user:1`, `email:a@b.c`) trong Redis với TTL DB_READ_YOUR_WRITES_SECONDS.
+      Truy vấn đọc theo key đang được đánh dấu luôn chạy trên primary, kể cả ở worker khác.
+    """
+
+    MARKER_PREFIX = "db_rw:"
+
+    def __init__(self, engine: AsyncEngine | None, redis_service: RedisService | None = None):
+        self.engine = engine
+        self.redis_service = redis_service or RedisService()
+        self.lag_seconds: float | None = None
+        self._task: asyncio.Task | None = None
+
+        self._lag_gauge = metrics.gauge("db.replica.lag_seconds")
+        self._replica_reads = metrics.counter("db.replica.reads")
+        self._primary_reads = metrics.counter("db.replica.fallback_reads")
+
+    @property
+    def enabled(self) -> bool:
+        return self.engine is not None
+
+    @property
+    def healthy(self) -> bool:
+        return (
+            self.enabled
+            and self.lag_seconds is not None
+            and self.lag_seconds <= settings.DB_REPLICA_MAX_LAG_SECONDS
+        )
+
+    async def start(self):
+        if self.enabled and self._task is None:
+            await self.check_lag()
+            self._task = asyncio.create_task(self._monitor())
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def check_lag(self):
+        try:
+            async with self.engine.connect() as conn:
+                result = await conn.execute(REPLICA_LAG_QUERY)
+                self.lag_seconds = float(result.scalar_one())
+                self._lag_gauge.set(self.lag_seconds)
+        except Exception as e:
+            logger.warning(f"Replica lag check failed, routing reads to primary: {e}")
+            self.mark_unhealthy()
+
+    def mark_unhealthy(self):
+        """Đưa replica ra khỏi vòng đọc tới lần đo độ trễ kế tiếp."""
+        self.lag_seconds = None
+        metrics.counter("db.replica.unhealthy").inc()
+
+    async def use_replica(self, *consistency_keys: str) -> bool:
+        """True nếu truy vấn đọc theo các key này có thể chạy trên replica."""
+        if not self.healthy:
+            self._primary_reads.inc()
+            return False
+
+        if consistency_keys:
+            try:
+                markers = await self.redis_service.mget([self.MARKER_PREFIX + key for key in consistency_keys])
+            except Exception as e:
+                # Không xác định được lần ghi gần nhất → đọc primary cho chắc chắn.
+                logger.warning(f"Read-your-writes lookup failed: {e}")
+                markers = [True]
+            if any(markers):
+                self._primary_reads.inc()
+                return False
+
+        self._replica_reads.inc()
+        return True
+
+    async def mark_written(self, *consistency_keys: str):
+        """Ghi nhận vừa ghi dữ liệu của các key này → các lần đọc kế tiếp dùng primary."""
+        if not self.enabled:
+            return
+        now = str(time.time())
+        try:
+            async with self.redis_service.pipeline(transaction=False) as pipe:
+                for key in consistency_keys:
+                    pipe.set(self.MARKER_PREFIX + key, now, ex=settings.DB_READ_YOUR_WRITES_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            # Dữ liệu đã commit; chỉ mất đảm bảo read-your-writes nên không làm hỏng request.
+            logger.warning(f"Failed to record write marker for {consistency_keys}: {e}")
+
+    async def _monitor(self):
+        while True:
+            await asyncio.sleep(settings.DB_REPLICA_LAG_CHECK_INTERVAL)
+            await self.check_lag()
+
+
+replica_router = ReplicaRouter(replica_engine)
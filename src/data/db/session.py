@@ -1,25 +1,95 @@
-from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.ext.asyncio import async_sessionmaker
+from contextvars import ContextVar
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, async_scoped_session
 from src.core.config import settings
+from src.data.db.pool import InstrumentedAsyncQueuePool
 from contextlib import asynccontextmanager
 
-DATABASE_URL = (
-    f"postgresql+asyncpg://{settings.DB_USER}:{settings.DB_PASSWORD}"
-    f"@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
-)
 
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+def build_database_url(host: str, port: int) -> str:
+    return (
+        f"postgresql+asyncpg://{settings.DB_USER}:{settings.DB_PASSWORD}"
+        f"@{host}:{port}/{settings.DB_NAME}"
+    )
+
+
+DATABASE_URL = build_database_url(settings.DB_HOST, settings.DB_PORT)
+
+
+def build_engine(url: str, name: str = "primary") -> AsyncEngine:
+    """Tạo engine theo profile DB_* trong Settings. `name` dùng làm nhãn metrics của pool."""
+    if settings.DB_PGBOUNCER_TRANSACTION_MODE:
+        # PgBouncer transaction pooling có thể đổi backend giữa các transaction,
+        # nên không được giữ prepared statement theo tên cố định.
+        cache_size = 0
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    else:
+        cache_size = settings.DB_STATEMENT_CACHE_SIZE
+        connect_args = {"statement_cache_size": cache_size}
+
+    return create_async_engine(
+        f"{url}?prepared_statement_cache_size={cache_size}",
+        echo=settings.DB_ECHO,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name=name,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+
+
+engine = build_engine(DATABASE_URL)
+
+# Engine read replica, None nếu không cấu hình DB_REPLICA_HOST
+replica_engine = (
+    build_engine(
+        build_database_url(settings.DB_REPLICA_HOST, settings.DB_REPLICA_PORT or settings.DB_PORT),
+        name="replica",
+    )
+    if settings.DB_REPLICA_HOST
+    else None
+)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
     expire_on_commit=False,
 )
 
+AsyncReplicaSessionLocal = async_sessionmaker(
+    replica_engine or engine,
+    expire_on_commit=False,
+)
+
+# Định danh phạm vi session hiện tại (mỗi request một giá trị), được đặt bởi db_session_scope()
+_db_scope: ContextVar[object | None] = ContextVar("db_scope", default=None)
+
+# Proxy session theo phạm vi: AsyncSession thật chỉ được tạo ở lần dùng đầu tiên trong phạm vi
+AsyncScopedSession = async_scoped_session(AsyncSessionLocal, scopefunc=_db_scope.get)
+AsyncScopedReplicaSession = async_scoped_session(AsyncReplicaSessionLocal, scopefunc=_db_scope.get)
+
 
 @asynccontextmanager
-async def get_db_session():
-    async with AsyncSessionLocal() as session:
+async def db_session_scope():
+    """
+    Mở một phạm vi session riêng (thường là một request).
+    Các repository dùng AsyncScopedSession trong phạm vi này dùng chung một AsyncSession,
+    session đó được đóng và trả kết nối về pool khi phạm vi kết thúc.
+    Phạm vi không có truy vấn nào sẽ không tạo session.
+    """
+    token = _db_scope.set(object())
+    try:
+        yield
+    finally:
         try:
-            yield session
+            await AsyncScopedSession.remove()
+            await AsyncScopedReplicaSession.remove()
         finally:
-            await session.close()
+            _db_scope.reset(token)
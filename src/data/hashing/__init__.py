@@ -0,0 +1,2 @@
+from .hashing_pool import HashingPool, hashing_pool
+from .admission import HashAdmissionController, HashPriority, hash_admission_controller
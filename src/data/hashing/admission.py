@@ -0,0 +1,119 @@
+import asyncio
+import heapq
+import itertools
+
+from contextlib import asynccontextmanager
+from enum import IntEnum
+
+from src.core.config import settings
+from src.core.exceptions import ServiceUnavailableError
+from src.core.metrics import metrics
+from src.data.hashing.hashing_pool import hashing_pool
+
+
+class HashPriority(IntEnum):
+    """Độ ưu tiên của job hash, giá trị nhỏ hơn được phục vụ trước."""
+    SIGNIN = 0
+    PASSWORD_RESET = 1
+    SIGNUP = 2
+
+
+class HashAdmissionController:
+    """
+    Kiểm soát số job hash được đưa vào HashingPool.
+
+    - Tối đa `max_concurrent` job chạy cùng lúc, phần còn lại xếp hàng theo độ ưu tiên.
+    - Hàng đợi có giới hạn `max_queue`. Khi đầy, job mới có độ ưu tiên cao hơn sẽ đẩy
+      job kém ưu tiên nhất ra khỏi hàng đợi (signin thắng signup), ngược lại job mới
+      bị từ chối với ServiceUnavailableError (503 + Retry-After).
+    """
+
+    def __init__(self,
+                 max_concurrent: int | None = None,
+                 max_queue: int | None = None,
+                 retry_after: int | None = None):
+        self.max_concurrent = max_concurrent or settings.PASSWORD_HASH_MAX_CONCURRENT or hashing_pool.max_workers
+        self.max_queue = max_queue if max_queue is not None else settings.PASSWORD_HASH_MAX_QUEUE
+        self.retry_after = retry_after or settings.PASSWORD_HASH_RETRY_AFTER_SECONDS
+
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+        self._queued = metrics.counter("password_hasher.queued")
+        self._queue_size = metrics.gauge("password_hasher.admission_queue")
+        self._active_gauge = metrics.gauge("password_hasher.admission_active")
+
+    @asynccontextmanager
+    async def slot(self, priority: HashPriority):
+        """Giữ một slot hash trong suốt khối `async with`."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: HashPriority):
+        if self._active < self.max_concurrent and not self._waiters:
+            self._set_active(self._active + 1)
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self._shed_for(priority)
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (int(priority), next(self._sequence), future)
+        heapq.heappush(self._waiters, entry)
+        self._queued.inc()
+        self._queue_size.set(len(self._waiters))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # Slot đã được chuyển giao đúng lúc bị hủy → trả lại.
+                self._release()
+            else:
+                # Vẫn còn trong hàng đợi, hoặc đã bị đẩy ra (_shed_for) → chưa giữ slot nào.
+                self._remove_waiter(entry)
+            raise
+
+    def _shed_for(self, priority: HashPriority):
+        """Hàng đợi đầy: đẩy job kém ưu tiên nhất ra nếu job mới quan trọng hơn, ngược lại từ chối job mới."""
+        worst = max(self._waiters)
+        if worst[0] <= priority:
+            self._reject(priority)
+            raise ServiceUnavailableError(retry_after=self.retry_after)
+
+        self._remove_waiter(worst)
+        self._reject(HashPriority(worst[0]))
+        worst[2].set_exception(ServiceUnavailableError(retry_after=self.retry_after))
+
+    def _release(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            self._queue_size.set(len(self._waiters))
+            if not future.done():
+                # Chuyển slot trực tiếp cho job đang chờ, số job đang chạy giữ nguyên.
+                future.set_result(None)
+                return
+        self._set_active(self._active - 1)
+
+    def _remove_waiter(self, entry: tuple[int, int, asyncio.Future]):
+        try:
+            self._waiters.remove(entry)
+        except ValueError:
+            return
+        heapq.heapify(self._waiters)
+        self._queue_size.set(len(self._waiters))
+
+    def _reject(self, priority: HashPriority):
+        metrics.counter("password_hasher.rejected").inc()
+        metrics.counter(f"password_hasher.rejected.{priority.name.lower()}").inc()
+
+    def _set_active(self, value: int):
+        self._active = value
+        self._active_gauge.set(value)
+
+
+hash_admission_controller = HashAdmissionController()
@@ -0,0 +1,96 @@
+"""
+Đo chi phí argon2 trên máy hiện tại và chọn profile phù hợp với thời gian verify mục tiêu.
+
+Chạy trên đúng loại máy sẽ phục vụ production:
+
+    python -m src.data.hashing.calibration --target-ms 250 --max-memory-mib 128
+
+Kết quả in ra dưới dạng biến môi trường để dán vào file .env.<env>. Sau khi đổi profile,
+các hash cũ sẽ được hash lại khi user đăng nhập (xem SigninWithEmailPasswordUseCase).
+"""
+import argparse
+import os
+import statistics
+import time
+
+from dataclasses import dataclass
+
+from argon2 import PasswordHasher
+
+# Mức bộ nhớ tối thiểu được OWASP khuyến nghị cho argon2id (19 MiB)
+MIN_MEMORY_KIB = 19 * 1024
+MAX_TIME_COST = 10
+
+
+@dataclass(frozen=True)
+class Argon2Profile:
+    time_cost: int
+    memory_cost: int  # KiB
+    parallelism: int
+    verify_ms: float
+
+    def as_env(self) -> str:
+        return (
+            f"ARGON2_TIME_COST={self.time_cost}\n"
+            f"ARGON2_MEMORY_COST={self.memory_cost}\n"
+            f"ARGON2_PARALLELISM={self.parallelism}"
+        )
+
+
+def measure_verify_ms(time_cost: int, memory_cost: int, parallelism: int, rounds: int = 5) -> float:
+    """Thời gian verify trung vị (ms) với bộ tham số cho trước."""
+    ph = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    password = "Calibration-Password-1!"
+    hashed = ph.hash(password)
+
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        ph.verify(hashed, password)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def calibrate(target_ms: float, max_memory_kib: int, parallelism: int, rounds: int = 5) -> Argon2Profile:
+    """
+    Ưu tiên bộ nhớ lớn nhất trong ngân sách, sau đó tăng time_cost tới khi chạm mục tiêu.
+    Nếu ngay cả time_cost=1 đã vượt mục tiêu thì giảm một nửa bộ nhớ và thử lại.
+    """
+    memory_cost = max_memory_kib
+
+    while True:
+        elapsed = measure_verify_ms(1, memory_cost, parallelism, rounds)
+        if elapsed > target_ms and memory_cost // 2 >= MIN_MEMORY_KIB:
+            memory_cost //= 2
+            continue
+
+        best = Argon2Profile(1, memory_cost, parallelism, elapsed)
+        for time_cost in range(2, MAX_TIME_COST + 1):
+            elapsed = measure_verify_ms(time_cost, memory_cost, parallelism, rounds)
+            if elapsed > target_ms:
+                break
+            best = Argon2Profile(time_cost, memory_cost, parallelism, elapsed)
+        return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate argon2 cost for this machine")
+    parser.add_argument("--target-ms", type=float, default=250, help="Thời gian verify mục tiêu (ms)")
+    parser.add_argument("--max-memory-mib", type=int, default=64, help="Bộ nhớ tối đa cho mỗi lần hash (MiB)")
+    parser.add_argument("--parallelism", type=int, default=min(os.cpu_count() or 1, 4))
+    parser.add_argument("--rounds", type=int, default=5, help="Số lần đo cho mỗi bộ tham số")
+    args = parser.parse_args()
+
+    profile = calibrate(
+        target_ms=args.target_ms,
+        max_memory_kib=args.max_memory_mib * 1024,
+        parallelism=args.parallelism,
+        rounds=args.rounds,
+    )
+
+    print(f"# verify ≈ {profile.verify_ms:.1f} ms (target {args.target_ms:.0f} ms)")
+    print(profile.as_env())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.utils.cpu import available_cpus
+from src.data.hashing import workers
+
+logger = logging.getLogger(__name__)
+
+
+class HashingPool:
+    """
+    Process pool dành riêng cho argon2.
+
+    argon2 tốn CPU hàng chục ms mỗi lần gọi, nếu chạy trực tiếp trong use case
+    sẽ chặn toàn bộ event loop của uvicorn. Pool này đẩy việc hash/verify sang
+    các process con (số process gắn với số core) và đo độ sâu hàng đợi cũng như
+    thời gian chờ của từng job.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers or settings.PASSWORD_HASH_WORKERS or available_cpus()
+        self._executor: ProcessPoolExecutor | None = None
+        self._in_flight = 0
+
+        # Profile argon2 đang áp dụng; hasher cục bộ chỉ dùng để đọc tham số của hash cũ.
+        self.profile = (settings.ARGON2_TIME_COST, settings.ARGON2_MEMORY_COST, settings.ARGON2_PARALLELISM)
+        self._local_ph = PasswordHasher(*self.profile)
+
+        self._queue_depth = metrics.gauge("password_hasher.queue_depth")
+        self._in_flight_gauge = metrics.gauge("password_hasher.in_flight")
+        self._wait_time = metrics.timer("password_hasher.wait_time")
+        self._exec_time = metrics.timer("password_hasher.exec_time")
+
+    def start(self):
+        """Khởi tạo executor và khởi động sẵn các process con."""
+        if self._executor is not None:
+            return
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=workers.init_worker,
+            initargs=self.profile,
+        )
+        for _ in range(self.max_workers):
+            self._executor.submit(workers.warm_up)
+        logger.info(f"Password hashing pool started with {self.max_workers} workers")
+
+    async def shutdown(self):
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+        logger.info("Password hashing pool stopped")
+
+    async def run(self, fn: Callable[..., tuple[Any, float]], *args) -> Any:
+        """
+        Chạy `fn(*args)` trong process con.
+        `fn` phải trả về (kết quả, thời gian thực thi) như các hàm trong `workers`.
+        """
+        self.start()
+        executor = self._executor
+        loop = asyncio.get_running_loop()
+
+        self._track(+1)
+        submitted_at = time.perf_counter()
+        try:
+            result, exec_seconds = await loop.run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # Một process con bị kill (OOM,...) → bỏ executor hỏng, lần gọi sau sẽ tạo lại.
+            # Chỉ bỏ đúng executor mà job này đã dùng: caller lỗi muộn không được vứt mất
+            # executor mới mà request khác vừa tạo (process của nó sẽ không bao giờ được tắt).
+            if self._executor is executor:
+                logger.error("Password hashing pool is broken, recreating on next call")
+                self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            self._track(-1)
+
+        total_seconds = time.perf_counter() - submitted_at
+        self._exec_time.observe(exec_seconds)
+        self._wait_time.observe(max(total_seconds - exec_seconds, 0.0))
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self.run(workers.hash_password, password)
+
+    async def verify(self, hashed_password: str, password: str) -> bool:
+        return await self.run(workers.verify_password, hashed_password, password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Hash có được tạo với tham số khác profile hiện tại không (chỉ parse chuỗi, không tốn CPU)."""
+        try:
+            return self._local_ph.check_needs_rehash(hashed_password)
+        except InvalidHashError:
+            return False
+
+    def _track(self, delta: int):
+        self._in_flight += delta
+        self._in_flight_gauge.set(self._in_flight)
+        self._queue_depth.set(max(self._in_flight - self.max_workers, 0))
+
+
+hashing_pool = HashingPool()
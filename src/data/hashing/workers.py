@@ -0,0 +1,39 @@
+"""
+Các hàm chạy bên trong process con của HashingPool.
+
+Module này chỉ import argon2 để process con (start method "spawn") khởi động nhanh
+và không phải nạp cấu hình, database hay Redis của app.
+"""
+import time
+
+from argon2 import PasswordHasher
+
+_ph: PasswordHasher | None = None
+
+
+def init_worker(time_cost: int, memory_cost: int, parallelism: int):
+    """Khởi tạo PasswordHasher theo profile đang dùng, một lần cho mỗi process con."""
+    global _ph
+    _ph = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+
+
+def warm_up() -> None:
+    """Task rỗng, dùng để buộc executor khởi động process con trước khi có request."""
+    return None
+
+
+def hash_password(password: str) -> tuple[str, float]:
+    """Hash mật khẩu, trả về (hash, thời gian thực thi tính bằng giây)."""
+    started = time.perf_counter()
+    hashed = _ph.hash(password)
+    return hashed, time.perf_counter() - started
+
+
+def verify_password(hashed_password: str, password: str) -> tuple[bool, float]:
+    """Kiểm tra mật khẩu, trả về (kết quả, thời gian thực thi tính bằng giây)."""
+    started = time.perf_counter()
+    try:
+        verified = _ph.verify(hashed_password, password)
+    except Exception:
+        verified = False
+    return verified, time.perf_counter() - started
@@ -1,15 +1,46 @@
-import aiosmtplib
+import logging
+
 from email.mime.text import MIMEText
-from src.core.config import settings
+
+from src.core.config import MailAccount, settings
+from src.data.mail.smtp_pool import SMTPConnectionPool
+
+logger = logging.getLogger(__name__)
 
 
 class MailTransporter:
-    def __init__(self):
-        self.host = settings.MAIL_HOST
-        self.port = settings.MAIL_PORT
-        self.user = settings.MAIL_USER
-        self.password = settings.MAIL_PASSWORD
+    def __init__(self, account: MailAccount | None = None):
+        # Mặc định là tài khoản chính khai báo bằng MAIL_HOST/MAIL_USER/...
+        account = account or MailAccount(
+            name="default",
+            host=settings.MAIL_HOST,
+            port=settings.MAIL_PORT,
+            user=settings.MAIL_USER,
+            password=settings.MAIL_PASSWORD,
+            use_tls=settings.MAIL_USE_TLS,
+        )
+        self.name = account.name
+        self.host = account.host
+        self.port = account.port
+        self.user = account.user
+        self.password = account.password
         self.sender = settings.MAIL_SENDER_NAME
+        self.rate_per_second = account.rate_per_second or settings.MAIL_SEND_RATE
+        self.burst = account.burst or settings.MAIL_SEND_BURST
+
+        # Giữ sẵn các kết nối đã STARTTLS + đăng nhập thay vì bắt tay lại cho từng email
+        self.pool = SMTPConnectionPool(
+            hostname=self.host,
+            port=self.port,
+            username=self.user,
+            password=self.password,
+            start_tls=account.use_tls,
+            size=settings.MAIL_POOL_SIZE,
+            keepalive_seconds=settings.MAIL_POOL_KEEPALIVE_SECONDS,
+            max_idle_seconds=settings.MAIL_POOL_MAX_IDLE_SECONDS,
+            max_messages=settings.MAIL_POOL_MAX_MESSAGES_PER_CONNECTION,
+            name=self.name,
+        )
 
     async def send_mail(self, to: str, subject: str, html: str):
         message = MIMEText(html, "html")
@@ -18,15 +49,16 @@ class MailTransporter:
         message["Subject"] = subject
 
         try:
-            await aiosmtplib.send(
-                message,
-                hostname=self.host,
-                port=self.port,
-                username=self.user,
-                password=self.password,
-                start_tls=True,
-            )
+            await self.pool.send_message(message)
             return True
         except Exception as e:
-            print(f"Mail sending failed: {e}")
+            logger.error(f"Mail sending failed: {e}")
             return False
+
+    async def close(self):
+        await self.pool.close()
+
+
+def build_mail_transporters() -> list[MailTransporter]:
+    """Tài khoản chính cùng các tài khoản trong MAIL_EXTRA_ACCOUNTS."""
+    return [MailTransporter(), *(MailTransporter(account) for account in settings.MAIL_EXTRA_ACCOUNTS)]
@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.utils.json_codec import json_codec
+from src.data.cache.lua_scripts import lua_scripts
+from src.data.cache.redis_service import RedisService
+from src.data.mail.mailer import MailTransporter
+from src.data.mail.send_scheduler import MailSendScheduler
+from src.domain.services import MailPriority
+
+logger = logging.getLogger(__name__)
+
+# Chuyển các email tới hạn gửi lại từ ZSET retry về stream của từng làn.
+# KEYS = các cặp (ZSET retry, stream) của mỗi làn; ARGV[1] = thời điểm hiện tại, ARGV[2] = số email tối đa mỗi làn
+# Mỗi phần tử ZSET là JSON mảng phẳng [field1, value1, field2, value2,...] để XADD lại nguyên vẹn.
+lua_scripts.register("mail_outbox_release_due", """
+local released = 0
+for k = 1, #KEYS, 2 do
+    local due = redis.call('ZRANGEBYSCORE', KEYS[k], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+    for _, payload in ipairs(due) do
+        redis.call('XADD', KEYS[k + 1], '*', unpack(cjson.decode(payload)))
+        redis.call('ZREM', KEYS[k], payload)
+    end
+    released = released + #due
+end
+return released
+""")
+
+
+class MailOutbox:
+    """
+    Hàng đợi email bền vững trên Redis Stream, chia làn theo MailPriority.
+
+    - Use case gọi `enqueue` (một lệnh XADD vào stream của làn) rồi trả response ngay, không chờ SMTP.
+    - Mỗi process chạy MAIL_OUTBOX_WORKERS worker đọc các stream qua consumer group, nên email
+      được chia cho các worker/pod và không bị gửi trùng trong trường hợp bình thường.
+    - Worker luôn chọn email ở làn ưu tiên cao nhất còn email chờ (OTP/email bảo mật vượt lên
+      trước email thông báo đang tồn đọng) và chỉ lấy quota gửi từ MailSendScheduler khi đã có
+      email trong tay, nên worker rảnh không tốn token hay lệnh Redis nào ngoài lần đọc chặn.
+    - Gửi lỗi: email được đưa vào ZSET retry của làn với backoff lũy thừa (có giới hạn); quá
+      MAIL_OUTBOX_MAX_ATTEMPTS lần thì chuyển sang stream dead-letter.
+    - Worker chết giữa chừng: email còn pending quá MAIL_OUTBOX_CLAIM_IDLE_SECONDS được worker
+      khác nhận lại bằng XAUTOCLAIM (giao ít nhất một lần, có thể gửi trùng trong trường hợp này).
+    """
+
+    STREAM_PREFIX = "mail_outbox"
+    GROUP = "mail_workers"
+    DEAD_LETTER_STREAM = "mail_outbox:dead"
+
+    READ_COUNT = 10
+    READ_BLOCK_MS = 1000
+    SCHEDULER_INTERVAL_SECONDS = 1
+
+    def __init__(self, redis_service: RedisService, scheduler: MailSendScheduler):
+        self.redis_service = redis_service
+        self.scheduler = scheduler
+        self.consumer_prefix = f"{socket.gethostname()}-{os.getpid()}"
+        self._tasks: list[asyncio.Task] = []
+
+        # Stream và ZSET retry của từng làn, theo thứ tự ưu tiên
+        self.streams = {priority: self.stream_name(priority) for priority in sorted(MailPriority)}
+        self._priorities = {stream: priority for priority, stream in self.streams.items()}
+        self._retry_keys = {stream: f"{stream}:retry" for stream in self.streams.values()}
+
+        self._queue_depth = {s: metrics.gauge(f"{s}.queue_depth") for s in self.streams.values()}
+        self._retry_depth = {s: metrics.gauge(f"{s}.retry_depth") for s in self.streams.values()}
+        self._latency = {s: metrics.timer(f"{s}.delivery_latency") for s in self.streams.values()}
+        self._dead_letters = metrics.gauge("mail_outbox.dead_letters")
+        self._delivered = metrics.counter("mail_outbox.delivered")
+        self._retried = metrics.counter("mail_outbox.retried")
+        self._dead_lettered = metrics.counter("mail_outbox.dead_lettered")
+
+    @classmethod
+    def stream_name(cls, priority: MailPriority) -> str:
+        return f"{cls.STREAM_PREFIX}:{priority.name.lower()}"
+
+    async def enqueue(self, to: str, subject: str, html: str,
+                      priority: MailPriority = MailPriority.NOTIFICATION) -> str:
+        """Thêm email vào làn `priority` của outbox, trả về id của entry trong stream."""
+        return await self.redis_service.xadd(self.streams[priority], {
+            "to": to,
+            "subject": subject,
+            "html": html,
+            "attempt": 0,
+            "enqueued_at": time.time(),
+        })
+
+    async def start(self):
+        if self._tasks:
+            return
+        for stream in self.streams.values():
+            await self.redis_service.xgroup_create(stream, self.GROUP)
+        self._tasks = [
+            asyncio.create_task(self._worker(f"{self.consumer_prefix}-{i}"))
+            for i in range(settings.MAIL_OUTBOX_WORKERS)
+        ]
+        self._tasks.append(asyncio.create_task(self._scheduler()))
+
+    async def stop(self):
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _worker(self, consumer: str):
+        while True:
+            try:
+                entries = await self._next_entries(consumer)
+                for stream, entry_id, fields in entries:
+                    # Mỗi email một token mới: _deliver lỗi giữa chừng thì email có thể đã được gửi,
+                    # token đó coi như đã dùng
+                    transporter = await self.scheduler.acquire()
+                    await self._deliver(stream, entry_id, fields, transporter)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Mail outbox worker failed, retrying shortly")
+                await asyncio.sleep(self.SCHEDULER_INTERVAL_SECONDS)
+
+    async def _next_entries(self, consumer: str) -> list:
+        """Email kế tiếp ở làn ưu tiên cao nhất; nếu mọi làn đều trống thì chờ email mới ở tất cả các làn."""
+        for stream in self.streams.values():
+            entries = await self.redis_service.xreadgroup(self.GROUP, consumer, [stream], count=1)
+            if entries:
+                return entries
+
+        entries = await self.redis_service.xreadgroup(
+            self.GROUP, consumer, list(self.streams.values()), count=1, block_ms=self.READ_BLOCK_MS
+        )
+        return sorted(entries, key=lambda entry: self._priorities[entry[0]])
+
+    async def _scheduler(self):
+        """Đưa email tới hạn retry về stream, nhận lại email bị treo và cập nhật metrics."""
+        release_keys = [key for stream, retry_key in self._retry_keys.items() for key in (retry_key, stream)]
+        while True:
+            await asyncio.sleep(self.SCHEDULER_INTERVAL_SECONDS)
+            try:
+                await self.redis_service.eval_script(
+                    "mail_outbox_release_due",
+                    keys=release_keys,
+                    args=[time.time(), 100],
+                )
+                for stream in self.streams.values():
+                    await self._reclaim_stuck(stream)
+                await self._report_depth()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Mail outbox scheduler failed")
+
+    async def _reclaim_stuck(self, stream: str):
+        claimed = await self.redis_service.xautoclaim(
+            stream,
+            self.GROUP,
+            f"{self.consumer_prefix}-reclaimer",
+            min_idle_ms=int(settings.MAIL_OUTBOX_CLAIM_IDLE_SECONDS * 1000),
+            count=self.READ_COUNT,
+        )
+        for entry_id, fields in claimed:
+            if not fields:
+                # Entry đã bị xóa (Redis < 7 vẫn giữ trong danh sách pending) → chỉ cần ack
+                async with self.redis_service.pipeline(transaction=False) as pipe:
+                    pipe.xack(stream, self.GROUP, entry_id)
+                    await pipe.execute()
+                continue
+            logger.warning(f"Reclaimed stuck outbox entry {entry_id} from {stream}")
+            await self._deliver(stream, entry_id, fields, await self.scheduler.acquire())
+
+    async def _report_depth(self):
+        async with self.redis_service.pipeline(transaction=False) as pipe:
+            for stream, retry_key in self._retry_keys.items():
+                pipe.xlen(stream)
+                pipe.zcard(retry_key)
+            pipe.xlen(self.DEAD_LETTER_STREAM)
+            *depths, dead_letters = await pipe.execute()
+
+        for index, stream in enumerate(self._retry_keys):
+            self._queue_depth[stream].set(depths[2 * index])
+            self._retry_depth[stream].set(depths[2 * index + 1])
+        self._dead_letters.set(dead_letters)
+
+    async def _deliver(self, stream: str, entry_id: str, fields: dict, transporter: MailTransporter):
+        try:
+            sent = await transporter.send_mail(to=fields["to"], subject=fields["subject"], html=fields["html"])
+        except Exception as e:
+            logger.error(f"Mail outbox delivery error for {entry_id}: {e}")
+            sent = False
+
+        async with self.redis_service.pipeline() as pipe:
+            if sent:
+                self._latency[stream].observe(time.time() - float(fields["enqueued_at"]))
+                self._delivered.inc()
+            else:
+                self._schedule_retry(pipe, stream, entry_id, fields)
+            # Entry đã được xử lý xong (gửi, hẹn retry hoặc dead-letter) → xóa khỏi stream
+            pipe.xack(stream, self.GROUP, entry_id)
+            pipe.xdel(stream, entry_id)
+            await pipe.execute()
+
+    def _schedule_retry(self, pipe, stream: str, entry_id: str, fields: dict):
+        attempt = int(fields["attempt"]) + 1
+        fields = {**fields, "attempt": attempt}
+
+        if attempt >= settings.MAIL_OUTBOX_MAX_ATTEMPTS:
+            logger.error(f"Mail to {fields['to']} dead-lettered after {attempt} attempts")
+            self._dead_lettered.inc()
+            pipe.xadd(
+                self.DEAD_LETTER_STREAM,
+                {**fields, "failed_at": time.time(), "source_stream": stream, "source_id": entry_id},
+                maxlen=settings.MAIL_OUTBOX_DEAD_LETTER_MAXLEN,
+                approximate=True,
+            )
+            return
+
+        backoff = min(
+            settings.MAIL_OUTBOX_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1),
+            settings.MAIL_OUTBOX_BACKOFF_MAX_SECONDS,
+        )
+        self._retried.inc()
+        payload = json_codec.dumps([str(item) for pair in fields.items() for item in pair])
+        pipe.zadd(self._retry_keys[stream], {payload: time.time() + backoff})
@@ -0,0 +1,110 @@
+import asyncio
+
+from src.core.metrics import metrics
+from src.data.cache.lua_scripts import lua_scripts
+from src.data.cache.redis_service import RedisService
+from src.data.mail.mailer import MailTransporter
+
+# Token bucket quota gửi của một tài khoản SMTP, dùng chung mọi process.
+# KEYS[1] = hash trạng thái bucket; ARGV[1] = token/giây, ARGV[2] = số token tối đa
+# Trả về 0 nếu lấy được token, ngược lại số ms cần chờ tới khi có token (không trừ gì).
+lua_scripts.register("mail_quota_take", """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local rate = tonumber(ARGV[1]) / 1000
+local capacity = tonumber(ARGV[2])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now_ms
+tokens = math.min(capacity, tokens + math.max(0, now_ms - updated_at) * rate)
+
+local wait_ms = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait_ms = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now_ms)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate) + 1000)
+return wait_ms
+""")
+
+# Trả lại một token chưa dùng (không vượt quá số token tối đa). KEYS[1] = hash bucket; ARGV[1] = số token tối đa
+lua_scripts.register("mail_quota_refund", """
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+if tokens then
+    redis.call('HSET', KEYS[1], 'tokens', math.min(tonumber(ARGV[1]), tokens + 1))
+end
+return 1
+""")
+
+
+class MailSendScheduler:
+    """
+    Giữ tốc độ gửi của từng tài khoản SMTP dưới quota của mail provider.
+
+    - Mỗi tài khoản có một token bucket trên Redis (rate/burst riêng), nên quota được tôn trọng
+      dù có bao nhiêu process/pod cùng gửi.
+    - `acquire` xoay vòng qua các tài khoản và trả về tài khoản đầu tiên còn token; nếu mọi
+      tài khoản đều hết token thì chờ tới khi tài khoản sớm nhất có lại token.
+    - Thứ tự ưu tiên giữa các loại email do MailOutbox quyết định: worker chọn email ở làn ưu
+      tiên cao nhất rồi mới lấy token cho email đó.
+    """
+
+    KEY_PREFIX = "mail_quota:"
+
+    def __init__(self, redis_service: RedisService, transporters: list[MailTransporter]):
+        if not transporters:
+            raise ValueError("MailSendScheduler needs at least one MailTransporter")
+        self.redis_service = redis_service
+        self.transporters = transporters
+        self._next = 0
+
+        self._throttled = metrics.counter("mail_scheduler.throttled")
+        self._wait_time = metrics.timer("mail_scheduler.wait_time")
+        self._acquired = {t.name: metrics.counter(f"mail_scheduler.{t.name}.acquired") for t in transporters}
+
+    async def acquire(self) -> MailTransporter:
+        """Chờ tới khi một tài khoản còn quota và trả về tài khoản đó (đã trừ một token)."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        while True:
+            wait_ms = None
+            for offset in range(len(self.transporters)):
+                index = (self._next + offset) % len(self.transporters)
+                transporter = self.transporters[index]
+                account_wait_ms = await self._take(transporter)
+                if account_wait_ms == 0:
+                    self._next = index + 1
+                    self._acquired[transporter.name].inc()
+                    self._wait_time.observe(loop.time() - started)
+                    return transporter
+                wait_ms = account_wait_ms if wait_ms is None else min(wait_ms, account_wait_ms)
+
+            self._throttled.inc()
+            await asyncio.sleep(wait_ms / 1000)
+
+    async def release(self, transporter: MailTransporter):
+        """Trả lại token đã lấy bằng `acquire` nhưng không dùng tới."""
+        await self.redis_service.eval_script(
+            "mail_quota_refund", keys=[self._key(transporter)], args=[transporter.burst]
+        )
+
+    async def send_mail(self, to: str, subject: str, html: str) -> bool:
+        transporter = await self.acquire()
+        return await transporter.send_mail(to=to, subject=subject, html=html)
+
+    async def close(self):
+        for transporter in self.transporters:
+            await transporter.close()
+
+    async def _take(self, transporter: MailTransporter) -> int:
+        return int(await self.redis_service.eval_script(
+            "mail_quota_take",
+            keys=[self._key(transporter)],
+            args=[transporter.rate_per_second, transporter.burst],
+        ))
+
+    def _key(self, transporter: MailTransporter) -> str:
+        return f"{self.KEY_PREFIX}{transporter.name}"
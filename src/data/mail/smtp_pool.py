@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import time
+
+from collections import deque
+from contextlib import asynccontextmanager
+from email.message import Message
+from typing import AsyncIterator
+
+import aiosmtplib
+
+from src.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Lỗi cho thấy kết nối đã chết → bỏ kết nối, mở kết nối mới và gửi lại
+_CONNECTION_ERRORS = (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPTimeoutError, ConnectionError, OSError)
+
+
+class _PooledConnection:
+    __slots__ = ("client", "idle_since", "checked_at", "messages_sent")
+
+    def __init__(self, client: aiosmtplib.SMTP):
+        self.client = client
+        self.idle_since = self.checked_at = time.monotonic()  # checked_at: lần cuối biết chắc kết nối còn sống
+        self.messages_sent = 0
+
+
+class SMTPConnectionPool:
+    """
+    Pool các kết nối SMTP đã STARTTLS + đăng nhập sẵn, dùng lại giữa các email.
+
+    - Tối đa `size` kết nối cùng lúc; request thứ size+1 chờ tới khi có kết nối rảnh.
+    - Kết nối rảnh lâu hơn `keepalive_seconds` được kiểm tra bằng NOOP trước khi dùng;
+      một task nền gửi NOOP định kỳ và đóng kết nối rảnh quá `max_idle_seconds`.
+    - Kết nối bị đóng và mở lại sau `max_messages` email (nhiều server giới hạn số thư mỗi phiên).
+    - Khi gửi gặp lỗi kết nối, kết nối bị bỏ và email được gửi lại một lần trên kết nối mới.
+    """
+
+    def __init__(self,
+                 hostname: str,
+                 port: int,
+                 username: str | None,
+                 password: str | None,
+                 start_tls: bool = True,
+                 size: int = 4,
+                 keepalive_seconds: float = 30,
+                 max_idle_seconds: float = 300,
+                 max_messages: int = 100,
+                 timeout: float = 30,
+                 name: str = "default"):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.start_tls = start_tls
+        self.size = size
+        self.keepalive_seconds = keepalive_seconds
+        self.max_idle_seconds = max_idle_seconds
+        self.max_messages = max_messages
+        self.timeout = timeout
+
+        self._idle: deque[_PooledConnection] = deque()
+        self._semaphore = asyncio.Semaphore(size)
+        self._keepalive_task: asyncio.Task | None = None
+        self._closed = False
+
+        self._connects = metrics.counter(f"smtp_pool.{name}.connects")
+        self._reconnects = metrics.counter(f"smtp_pool.{name}.reconnects")
+        self._in_use = metrics.gauge(f"smtp_pool.{name}.in_use")
+        self._send_time = metrics.timer(f"smtp_pool.{name}.send_time")
+
+    async def send_message(self, message: Message):
+        """Gửi một email; ném lỗi aiosmtplib nếu server từ chối hoặc không kết nối được."""
+        started = time.perf_counter()
+        async with self._connection() as connection:
+            try:
+                await connection.client.send_message(message)
+            except _CONNECTION_ERRORS as e:
+                logger.warning(f"SMTP connection lost while sending, reconnecting: {e}")
+                self._reconnects.inc()
+                await self._discard(connection)
+                connection.client = await self._connect()
+                await connection.client.send_message(message)
+            connection.messages_sent += 1
+        self._send_time.observe(time.perf_counter() - started)
+
+    async def close(self):
+        self._closed = True
+        task, self._keepalive_task = self._keepalive_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        while self._idle:
+            await self._discard(self._idle.popleft())
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[_PooledConnection]:
+        self._ensure_keepalive()
+        async with self._semaphore:
+            # Mở kết nối/đăng nhập lỗi thì không có kết nối nào đang dùng → chỉ tăng gauge sau checkout
+            connection = await self._checkout()
+            self._in_use.inc()
+            try:
+                yield connection
+            except BaseException:
+                # Trạng thái phiên SMTP không còn chắc chắn → đóng socket, không trả lại pool
+                connection.client.close()
+                raise
+            else:
+                await self._checkin(connection)
+            finally:
+                self._in_use.dec()
+
+    async def _checkout(self) -> _PooledConnection:
+        while self._idle:
+            connection = self._idle.pop()
+            if time.monotonic() - connection.checked_at < self.keepalive_seconds:
+                return connection
+            if await self._is_alive(connection):
+                return connection
+            await self._discard(connection)
+        return _PooledConnection(await self._connect())
+
+    async def _checkin(self, connection: _PooledConnection):
+        if self._closed or connection.messages_sent >= self.max_messages or not connection.client.is_connected:
+            await self._discard(connection)
+            return
+        connection.idle_since = connection.checked_at = time.monotonic()
+        self._idle.append(connection)
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        self._connects.inc()
+        return client
+
+    @staticmethod
+    async def _is_alive(connection: _PooledConnection) -> bool:
+        try:
+            await connection.client.noop()
+        except (aiosmtplib.SMTPException, *_CONNECTION_ERRORS):
+            return False
+        connection.checked_at = time.monotonic()
+        return True
+
+    @staticmethod
+    async def _discard(connection: _PooledConnection):
+        try:
+            await connection.client.quit()
+        except Exception:
+            connection.client.close()
+
+    def _ensure_keepalive(self):
+        if self._keepalive_task is None and not self._closed:
+            self._keepalive_task = asyncio.create_task(self._keepalive())
+
+    async def _keepalive(self):
+        while True:
+            await asyncio.sleep(self.keepalive_seconds)
+            now = time.monotonic()
+            # Chỉ xử lý các kết nối đang rảnh tại thời điểm này. Giữ semaphore như một sender khi
+            # kiểm tra từng kết nối, để tổng số kết nối mở (kể cả kết nối đang NOOP) không vượt `size`.
+            for _ in range(len(self._idle)):
+                async with self._semaphore:
+                    if not self._idle:
+                        break
+                    connection = self._idle.popleft()
+                    if now - connection.idle_since > self.max_idle_seconds or not await self._is_alive(connection):
+                        await self._discard(connection)
+                    else:
+                        self._idle.append(connection)
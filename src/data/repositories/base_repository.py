@@ -1,8 +1,11 @@
+import asyncio
 import logging
 from typing import Type, TypeVar, Optional, Any
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, Executable
+
+from src.data.db.replica import ReplicaRouter
 
 logger = logging.getLogger(__name__)
 
@@ -10,14 +13,50 @@ T = TypeVar("T")
 
 
 class BaseRepository:
-    def __init__(self, db: AsyncSession, model: Type[T]):
+    def __init__(self,
+                 db: AsyncSession,
+                 model: Type[T],
+                 read_db: AsyncSession | None = None,
+                 replica_router: ReplicaRouter | None = None):
         """
         Base class for all repositories (Async version).
-        :param db: SQLAlchemy AsyncSession
+        :param db: SQLAlchemy AsyncSession (primary)
         :param model: SQLAlchemy model class
+        :param read_db: optional AsyncSession bound to a read replica
+        :param replica_router: decides per query whether read_db may be used
         """
         self.db = db
         self.model = model
+        self.read_db = read_db
+        self.replica_router = replica_router
+
+    # ---------- Read routing ----------
+    async def execute_read(self, stmt: Executable, *consistency_keys: str):
+        """
+        Execute a read-only statement on the replica when allowed, else on the primary.
+        consistency_keys identify the rows being read (e.g. "user:1") so reads that
+        follow a recent write of the same rows stay on the primary (read-your-writes).
+        A failing replica query (driver error, replica pool exhausted, connect timeout or
+        refused connection) is retried once on the primary.
+        """
+        if self.read_db is None or self.replica_router is None or not self.replica_router.enabled:
+            return await self.db.execute(stmt)
+
+        if not await self.replica_router.use_replica(*consistency_keys):
+            return await self.db.execute(stmt)
+
+        try:
+            return await self.read_db.execute(stmt)
+        except (SQLAlchemyError, OSError, asyncio.TimeoutError) as e:
+            logger.warning(f"Replica read failed for {self.model.__name__}, retrying on primary: {e}")
+            await self.read_db.rollback()
+            self.replica_router.mark_unhealthy()
+            return await self.db.execute(stmt)
+
+    async def mark_written(self, *consistency_keys: str):
+        """Record a committed write so following reads of these keys use the primary."""
+        if self.replica_router is not None:
+            await self.replica_router.mark_written(*consistency_keys)
 
     # ---------- Transaction ----------
     async def safe_commit(self):
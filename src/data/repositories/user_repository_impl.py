@@ -1,18 +1,30 @@
-from sqlalchemy import select, update
+from sqlalchemy import select, update, func
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.core.exceptions import ServerError
 
+from src.data.cache.auth_epoch_cache import AuthEpochCache
+from src.data.cache.email_bloom_filter import EmailBloomFilter
+from src.data.cache.user_cache import UserCache
 from src.data.models import UserModel
 from src.data.repositories.base_repository import BaseRepository
 
-from src.domain.entities import UserEntity, UserStatus
+from src.domain.entities import AuthEpoch, UserEntity, UserStatus
 from src.domain.repositories import UserRepository
 
 
 class UserRepositoryImpl(UserRepository, BaseRepository):
-    def __init__(self, db):
-        super().__init__(db, UserModel)
+    def __init__(self,
+                 db,
+                 read_db=None,
+                 replica_router=None,
+                 auth_epoch_cache: AuthEpochCache | None = None,
+                 user_cache: UserCache | None = None,
+                 email_filter: EmailBloomFilter | None = None):
+        super().__init__(db, UserModel, read_db=read_db, replica_router=replica_router)
+        self.auth_epoch_cache = auth_epoch_cache
+        self.user_cache = user_cache
+        self.email_filter = email_filter
 
     async def create_user(self, user: UserEntity) -> UserEntity:
         user_model = UserModel(
@@ -31,20 +43,36 @@ class UserRepositoryImpl(UserRepository, BaseRepository):
         try:
             await self.safe_commit()
             await self.db.refresh(user_model)
-            return self._to_domain(user_model)
         except SQLAlchemyError as e:
             await self.db.rollback()
             raise ServerError(detail=str(e)) from e
 
+        await self.mark_written(f"user:{user_model.id}", f"email:{user_model.email}")
+        await self._invalidate_cache(user_model.id, user_model.email)
+        if self.email_filter is not None:
+            await self.email_filter.add(user_model.email)
+        user = self._to_domain(user_model)
+        await self._write_auth_epoch(user)
+        return user
+
     async def exists_by_email(self, email: str) -> bool:
+        if not await self._email_might_exist(email):
+            return False
         stmt = select(UserModel).where(UserModel.email == email)
-        result = await self.db.execute(stmt)
+        result = await self.execute_read(stmt, f"email:{email}")
         return result.scalar_one_or_none() is not None
 
     async def get_user_by_id(self, user_id: int) -> UserEntity | None:
+        if self.user_cache is not None:
+            return await self.user_cache.get_or_load(
+                self.user_cache.id_key(user_id), lambda: self._load_user_by_id(user_id)
+            )
+        return await self._load_user_by_id(user_id)
+
+    async def _load_user_by_id(self, user_id: int) -> UserEntity | None:
         try:
             stmt = select(UserModel).where(UserModel.id == user_id)
-            result = await self.db.execute(stmt)
+            result = await self.execute_read(stmt, f"user:{user_id}")
             user_model = result.scalar_one_or_none()
 
             if not user_model:
@@ -55,9 +83,24 @@ class UserRepositoryImpl(UserRepository, BaseRepository):
             raise ServerError(detail=str(e)) from e
 
     async def get_user_by_email(self, email: str) -> UserEntity | None:
+        if not await self._email_might_exist(email):
+            return None
+        if self.user_cache is not None:
+            return await self.user_cache.get_or_load(
+                self.user_cache.email_key(email), lambda: self._load_user_by_email(email)
+            )
+        return await self._load_user_by_email(email)
+
+    async def get_user_credentials_by_email(self, email: str) -> UserEntity | None:
+        # Cache user không giữ hash mật khẩu nên luôn đọc DB
+        if not await self._email_might_exist(email):
+            return None
+        return await self._load_user_by_email(email)
+
+    async def _load_user_by_email(self, email: str) -> UserEntity | None:
         try:
             stmt = select(UserModel).where(UserModel.email == email)
-            result = await self.db.execute(stmt)
+            result = await self.execute_read(stmt, f"email:{email}")
             user_model = result.scalar_one_or_none()
 
             if not user_model:
@@ -74,12 +117,19 @@ class UserRepositoryImpl(UserRepository, BaseRepository):
         :param updates: dict - Các trường cần cập nhật (ví dụ: {"name": "New Name"})
         :return: User domain object hoặc None nếu không tìm thấy user
         """
+        previous_email = None
+        if "email" in updates and self.user_cache is not None:
+            # Cache theo email cũ cũng phải bị xóa khi đổi email
+            previous = await self._load_user_by_id(user_id)
+            previous_email = previous.email if previous else None
+
         try:
             stmt = (
                 update(UserModel)
                 .where(UserModel.id == user_id)
                 .values(**updates)
                 .returning(UserModel)
+                .execution_options(populate_existing=True)
             )
             result = await self.db.execute(stmt)
             user_model = result.scalar_one_or_none()
@@ -88,12 +138,84 @@ class UserRepositoryImpl(UserRepository, BaseRepository):
                 return None
 
             await self.safe_commit()
-            return self._to_domain(user_model)
 
         except SQLAlchemyError as e:
             await self.db.rollback()
             raise ServerError(detail=str(e)) from e
 
+        await self.mark_written(f"user:{user_model.id}", f"email:{user_model.email}")
+        await self._invalidate_cache(user_model.id, user_model.email, previous_email)
+        if "email" in updates and self.email_filter is not None:
+            await self.email_filter.add(user_model.email)
+        return self._to_domain(user_model)
+
+    async def record_signin(self, user_id: int, password: str | None = None) -> UserEntity | None:
+        """
+        Ghi nhận một lần đăng nhập bằng một câu UPDATE ... RETURNING:
+        signin_count tăng ngay trong DB nên hai thiết bị đăng nhập cùng lúc không ghi đè nhau.
+        :param password: hash mật khẩu mới (rehash khi đổi profile argon2), None nếu giữ nguyên
+        """
+        updates = {
+            "signin_count": UserModel.signin_count + 1,
+            "last_login": func.now(),
+        }
+        if password:
+            updates["password"] = password
+        user = await self.update_user_by_id(user_id, updates)
+        await self._write_auth_epoch(user)
+        return user
+
+    async def record_sign_out(self, user_id: int) -> UserEntity | None:
+        """Ghi nhận một lần đăng xuất chủ động bằng một câu UPDATE ... RETURNING."""
+        user = await self.update_user_by_id(user_id, {"sign_out_count": UserModel.sign_out_count + 1})
+        await self._write_auth_epoch(user)
+        return user
+
+    async def get_auth_epoch(self, user_id: int, fresh: bool = False) -> AuthEpoch | None:
+        """
+        Đọc epoch từ cache; nếu cache trống (hoặc fresh=True) thì đọc 2 cột bộ đếm
+        từ DB và ghi lại vào cache.
+        """
+        if self.auth_epoch_cache is not None and not fresh:
+            epoch = await self.auth_epoch_cache.get(user_id)
+            if epoch is not None:
+                return epoch
+
+        try:
+            stmt = select(UserModel.signin_count, UserModel.sign_out_count).where(UserModel.id == user_id)
+            if fresh:
+                result = await self.db.execute(stmt)
+            else:
+                result = await self.execute_read(stmt, f"user:{user_id}")
+            row = result.one_or_none()
+        except SQLAlchemyError as e:
+            raise ServerError(detail=str(e)) from e
+
+        if row is None:
+            return None
+
+        epoch = AuthEpoch(user_id=user_id, signin_count=row.signin_count, sign_out_count=row.sign_out_count)
+        if self.auth_epoch_cache is not None:
+            await self.auth_epoch_cache.put(epoch)
+        return epoch
+
+    async def _email_might_exist(self, email: str) -> bool:
+        """False khi bloom filter khẳng định email chưa đăng ký (không cần hỏi DB)."""
+        if self.email_filter is None:
+            return True
+        return await self.email_filter.might_exist(email)
+
+    async def _invalidate_cache(self, user_id: int, *emails: str | None):
+        if self.user_cache is not None:
+            await self.user_cache.invalidate(user_id, *emails)
+
+    async def _write_auth_epoch(self, user: UserEntity | None):
+        if user is None or self.auth_epoch_cache is None:
+            return
+        await self.auth_epoch_cache.put(
+            AuthEpoch(user_id=user.id, signin_count=user.signin_count, sign_out_count=user.sign_out_count)
+        )
+
     def _to_domain(self, user_model: UserModel) -> UserEntity:
         return UserEntity(
             id=user_model.id,
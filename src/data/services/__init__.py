@@ -1,4 +1,5 @@
 from .mail_service_impl import MailServiceImpl
 from .otp_service_impl import OTPServiceImpl
 from .password_hasher_service_impl import PasswordHasherServiceImpl
-from .token_service_impl import TokenServiceImpl
\ No newline at end of file
+from .token_service_impl import TokenServiceImpl
+from .google_token_verifier_impl import GoogleTokenVerifierImpl
\ No newline at end of file
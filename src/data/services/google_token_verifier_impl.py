@@ -0,0 +1,58 @@
+import json
+import logging
+
+from google.auth import _helpers, exceptions, jwt
+
+from src.core.config import settings
+from src.data.cache.google_certs import GoogleCertsCache
+from src.domain.exceptions.auth_exception import TokenInvalidError
+from src.domain.services import GoogleTokenVerifier
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+
+class GoogleTokenVerifierImpl(GoogleTokenVerifier):
+    """
+    Xác thực ID token Google hoàn toàn cục bộ bằng key trong GoogleCertsCache
+    (tương đương `id_token.verify_oauth2_token` nhưng không gọi mạng đồng bộ mỗi lần đăng nhập).
+    """
+
+    def __init__(self, certs_cache: GoogleCertsCache, client_id: str | None = None):
+        self.certs_cache = certs_cache
+        self.client_id = client_id or settings.GOOGLE_CLIENT_ID
+
+    async def verify(self, token: str) -> dict:
+        key_id = self._key_id(token)
+
+        certs = await self.certs_cache.get()
+        if key_id not in certs:
+            # Google có thể vừa xoay key mà cache chưa kịp làm mới
+            certs = await self.certs_cache.refresh()
+
+        try:
+            idinfo = jwt.decode(
+                token,
+                certs=certs,
+                audience=self.client_id,
+                clock_skew_in_seconds=settings.GOOGLE_TOKEN_CLOCK_SKEW_SECONDS,
+            )
+        except (ValueError, exceptions.GoogleAuthError) as e:
+            logger.info(f"Rejected Google ID token: {e}")
+            raise TokenInvalidError() from e
+
+        if idinfo.get("iss") not in GOOGLE_ISSUERS:
+            logger.info(f"Rejected Google ID token with issuer {idinfo.get('iss')}")
+            raise TokenInvalidError()
+        return idinfo
+
+    @staticmethod
+    def _key_id(token: str) -> str | None:
+        try:
+            header = json.loads(_helpers.padded_urlsafe_b64decode(token.split(".", 1)[0].encode()))
+        except ValueError as e:
+            raise TokenInvalidError() from e
+        if not isinstance(header, dict):
+            raise TokenInvalidError()
+        return header.get("kid")
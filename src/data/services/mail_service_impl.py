@@ -1,13 +1,19 @@
-from src.domain.services import MailService
-from src.data.mail.mailer import MailTransporter
+from src.domain.services import MailService, MailPriority
+from src.data.mail.outbox import MailOutbox
+from src.data.mail.send_scheduler import MailSendScheduler
 
 
 class MailServiceImpl(MailService):
-    def __init__(self, transporter: MailTransporter):
-        self.transporter = transporter
+    def __init__(self, scheduler: MailSendScheduler, outbox: MailOutbox):
+        self.scheduler = scheduler
+        self.outbox = outbox
 
     async def send_mail(self, to: str, subject: str, html: str):
-        return await self.transporter.send_mail(to=to, subject=subject, html=html)
+        return await self.scheduler.send_mail(to=to, subject=subject, html=html)
+
+    async def enqueue_mail(self, to: str, subject: str, html: str,
+                           priority: MailPriority = MailPriority.NOTIFICATION):
+        await self.outbox.enqueue(to=to, subject=subject, html=html, priority=priority)
 
     def build_otp_template(self, otp: str) -> dict[str, str]:
         subject = "Mã xác thực OTP của bạn"
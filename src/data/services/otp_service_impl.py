@@ -1,76 +1,140 @@
+import hashlib
+import hmac
+import logging
 import secrets
 
+from typing import Awaitable, Callable
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.utils.json_codec import json_codec
+from src.core.utils.single_flight import SingleFlight
 from src.domain.exceptions.auth_exception import OTPIncorrectError
 from src.domain.services import OTPService
+from src.data.cache.lua_scripts import lua_scripts
+from src.data.cache.rate_limiter import SlidingWindowRateLimiter
 from src.data.cache.redis_service import RedisService
 
+OTP_TTL_SECONDS = 600
+OTP_RATE_LIMIT = 5
+OTP_RATE_WINDOW_SECONDS = 900
+
+logger = logging.getLogger(__name__)
+
+# Gộp các yêu cầu gửi OTP đồng thời trong process (dùng chung cho mọi instance OTPServiceImpl)
+_send_flights = SingleFlight("otp_send")
+
+# So khớp OTP và xóa cả OTP lẫn bộ đếm giới hạn gửi trong một lệnh.
+# KEYS[1] = otp:{email}, KEYS[2] = otp_rate:{email}, ARGV[1] = otp người dùng nhập
+# Trả về JSON đã lưu nếu khớp, nil nếu không có OTP hoặc sai OTP.
+lua_scripts.register("otp_verify", """
+local raw = redis.call('GET', KEYS[1])
+if not raw then
+    return false
+end
+if cjson.decode(raw)['otp'] ~= ARGV[1] then
+    return false
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+return raw
+""")
+
+# Thay OTP mới vào dữ liệu đang chờ xác thực và gia hạn TTL.
+# KEYS[1] = otp:{email}, ARGV[1] = otp mới, ARGV[2] = TTL (giây)
+# Trả về 1 nếu cập nhật được, 0 nếu không có OTP đang chờ.
+lua_scripts.register("otp_update", """
+local raw = redis.call('GET', KEYS[1])
+if not raw then
+    return 0
+end
+local data = cjson.decode(raw)
+data['otp'] = ARGV[1]
+redis.call('SET', KEYS[1], cjson.encode(data), 'EX', ARGV[2])
+return 1
+""")
+
 
 class OTPServiceImpl(OTPService):
     def __init__(self, redis_service: RedisService):
         self.redis_service = redis_service
+        self.rate_limiter = SlidingWindowRateLimiter(
+            "otp_rate", limit=OTP_RATE_LIMIT, window_seconds=OTP_RATE_WINDOW_SECONDS, redis_service=redis_service
+        )
+
+    async def coalesce_send(self, email: str, send: Callable[[], Awaitable[None]],
+                            flow: str, payload: str = "") -> bool:
+        # Trong process: các request đồng thời chờ chung một lần gửi (và nhận chung lỗi nếu có).
+        # Giữa các process: key SET NX PX trên Redis, request đến trong cửa sổ bị bỏ qua.
+        # Key gồm luồng + digest của payload: chỉ gộp các yêu cầu giống hệt nhau, yêu cầu mang dữ
+        # liệu mới (tên/mật khẩu đã sửa) vẫn được gửi và ghi đè dữ liệu đang chờ xác thực.
+        key = f"otp_send:{flow}:{self._payload_digest(payload)}:{email}"
+        return await _send_flights.do(key, lambda: self._send_once(key, send))
+
+    @staticmethod
+    def _payload_digest(payload: str) -> str:
+        # HMAC thay vì hash trần: payload có thể chứa mật khẩu, không để lộ hash dò được trong tên key
+        return hmac.new(settings.SESSION_SECRET.encode(), payload.encode(), hashlib.sha256).hexdigest()[:32]
+
+    async def _send_once(self, key: str, send: Callable[[], Awaitable[None]]) -> bool:
+        window_ms = int(settings.OTP_SEND_COALESCE_SECONDS * 1000)
+        if window_ms <= 0:
+            await send()
+            return True
+
+        if not await self.redis_service.set_nx(key, 1, expire_ms=window_ms):
+            metrics.counter("otp_send.coalesced").inc()
+            return False
+
+        try:
+            await send()
+        except Exception:
+            # Lần gửi thất bại → mở lại cửa sổ để người dùng có thể thử lại ngay
+            try:
+                await self.redis_service.delete(key)
+            except Exception as e:
+                logger.warning(f"Failed to release OTP send window {key}: {e}")
+            raise
+        return True
 
     def generate_otp(self, length: int = 6) -> str:
         return ''.join(str(secrets.randbelow(10)) for _ in range(length))
 
     async def check_and_increment_limit(self, email: str) -> bool:
-        key = f"otp_limit:{email}"
-
-        exists = await self.redis_service.exists(key)
-
-        if exists:
-            current = await self.redis_service.incr(key)
-        else:
-            current = 1
-            await self.redis_service.set(key, current, expire_seconds=900)
-
-        return current < 5
+        # Tối đa OTP_RATE_LIMIT lần gửi trong OTP_RATE_WINDOW_SECONDS giây gần nhất
+        result = await self.rate_limiter.hit(email)
+        return result.allowed
 
     async def save_signup_otp(self, email: str, otp: str, name: str, password: str):
         key = f"otp:{email}"
         data = {"otp": otp, "name": name, "password": password}
-        await self.redis_service.set_json(key, data, expire_seconds=600)
+        await self.redis_service.set_json(key, data, expire_seconds=OTP_TTL_SECONDS)
 
     async def verify_signup_otp(self, email: str, otp: str) -> dict[str, str]:
-        key_signup = f"otp:{email}"
-
-        data = await self.redis_service.get_json(key_signup)
-
-        if not data or data["otp"] != otp:
-            raise OTPIncorrectError()
+        data = await self._consume_otp(email, otp)
 
-        name = data["name"]
-        password = data["password"]
-
-        await self.redis_service.delete(key_signup)
-        await self.redis_service.delete(f"otp_limit:{email}")
-
-        return {"email": email, "name": name, "password": password}
+        return {"email": email, "name": data["name"], "password": data["password"]}
 
     async def save_forgot_otp(self, email: str, otp: str, user_id: str):
         key = f"otp:{email}"
         data = {"otp": otp, "user_id": user_id}
-        await self.redis_service.set_json(key, data, expire_seconds=600)
+        await self.redis_service.set_json(key, data, expire_seconds=OTP_TTL_SECONDS)
 
     async def verify_forgot_otp(self, email: str, otp: str) -> dict[str, str]:
-        key_forgot = f"otp:{email}"
-
-        data = await self.redis_service.get_json(key_forgot)
-
-        if not data or data["otp"] != otp:
-            raise OTPIncorrectError()
-
-        user_id = data["user_id"]
+        data = await self._consume_otp(email, otp)
 
-        await self.redis_service.delete(key_forgot)
-        await self.redis_service.delete(f"otp_limit:{email}")
-
-        return {"user_id": user_id}
+        return {"user_id": data["user_id"]}
 
     async def update_otp(self, email: str, otp: str) -> bool:
-        key = f"otp:{email}"
-        data = await self.redis_service.get_json(key)
-        if not data:
-            return False
-        data["otp"] = otp
-        await self.redis_service.set_json(key, data, expire_seconds=600)
-        return True
+        updated = await self.redis_service.eval_script(
+            "otp_update", keys=[f"otp:{email}"], args=[otp, OTP_TTL_SECONDS]
+        )
+        return updated == 1
+
+    async def _consume_otp(self, email: str, otp: str) -> dict:
+        """So khớp OTP; nếu đúng thì xóa OTP và bộ đếm giới hạn gửi rồi trả về dữ liệu đã lưu."""
+        raw = await self.redis_service.eval_script(
+            "otp_verify", keys=[f"otp:{email}", self.rate_limiter.key(email)], args=[otp]
+        )
+        if raw is None:
+            raise OTPIncorrectError()
+        return json_codec.loads(raw)
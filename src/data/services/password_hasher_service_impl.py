@@ -1,15 +1,29 @@
 from src.domain.services import PasswordHasherService
-from argon2 import PasswordHasher
+from src.data.hashing import (
+    HashingPool,
+    hashing_pool,
+    HashAdmissionController,
+    HashPriority,
+    hash_admission_controller
+)
+
 
 class PasswordHasherServiceImpl(PasswordHasherService):
-    def __init__(self):
-        self.ph = PasswordHasher()
+    def __init__(self,
+                 priority: HashPriority = HashPriority.SIGNUP,
+                 pool: HashingPool = hashing_pool,
+                 admission: HashAdmissionController = hash_admission_controller):
+        self.priority = priority
+        self.pool = pool
+        self.admission = admission
+
+    async def hash(self, password: str) -> str:
+        async with self.admission.slot(self.priority):
+            return await self.pool.hash(password)
 
-    def hash(self, password: str) -> str:
-        return self.ph.hash(password)
+    async def verify(self, hashed_password: str, password: str) -> bool:
+        async with self.admission.slot(self.priority):
+            return await self.pool.verify(hashed_password, password)
 
-    def verify(self, hashed_password: str, password: str) -> bool:
-        try:
-            return self.ph.verify(hashed_password, password)
-        except Exception:
-            return False
\ No newline at end of file
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self.pool.needs_rehash(hashed_password)
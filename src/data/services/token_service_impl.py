@@ -53,10 +53,12 @@ class TokenServiceImpl(TokenService):
         key = f"user_sessions:{user_id}"
         hashed_token = self.hash_token(token)
 
-        # Lưu trữ theo cấu trúc: HSET user_sessions:{user_id} {device_id} {hashed_token}
-        await self.redis_service.hset(key, device_id, hashed_token)
-        # Đặt TTL cho cả hash key để tự động dọn dẹp
-        await self.redis_service.expire(key, int(settings.REFRESH_TOKEN_LIFETIME.total_seconds()))
+        async with self.redis_service.pipeline() as pipe:
+            # Lưu trữ theo cấu trúc: HSET user_sessions:{user_id} {device_id} {hashed_token}
+            pipe.hset(key, device_id, hashed_token)
+            # Đặt TTL cho cả hash key để tự động dọn dẹp
+            pipe.expire(key, int(settings.REFRESH_TOKEN_LIFETIME.total_seconds()))
+            await pipe.execute()
 
     async def get_refresh_token_hash(self, user_id: int, device_id: str) -> str | None:
         """Lấy hash của refresh token từ Redis."""
@@ -102,10 +104,10 @@ class TokenServiceImpl(TokenService):
     async def verify_reset_token(self, token: str) -> dict[str, str] | None:
         hashed = self.hash_token(token)
         key = f"reset_token:{hashed}"
-        data = await self.redis_service.get_json(key)
+        # Reset token chỉ dùng được một lần: lấy và xóa trong cùng một lệnh
+        data = await self.redis_service.getdel_json(key)
         if not data:
             return None
-        await self.delete_reset_token(token)
         return {"user_id": data["user_id"]}
 
     async def delete_reset_token(self, token: str):
@@ -1,2 +1,4 @@
 from .user_entity import UserEntity
-from .user_entity import UserStatus
\ No newline at end of file
+from .user_entity import UserStatus
+from .principal import AuthPrincipal
+from .auth_epoch import AuthEpoch
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class AuthEpoch:
+    """
+    Bộ đếm đăng nhập/đăng xuất hiện tại của user. Token chỉ còn hiệu lực khi
+    signin_count và sign_out_count trong token trùng với epoch này.
+    """
+    user_id: int
+    signin_count: int
+    sign_out_count: int
+
+    def matches(self, signin_count: int, sign_out_count: int) -> bool:
+        return self.signin_count == signin_count and self.sign_out_count == sign_out_count
+
+    def is_behind(self, signin_count: int, sign_out_count: int) -> bool:
+        """Epoch cũ hơn bộ đếm trong token → bản lưu trong cache chưa kịp cập nhật."""
+        return self.signin_count < signin_count or self.sign_out_count < sign_out_count
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class AuthPrincipal:
+    """Thông tin user đã xác thực, lấy từ access token và gắn vào request (request.user)."""
+    id: int
+    signin_count: int
+    sign_out_count: int
+    refresh_jti: str
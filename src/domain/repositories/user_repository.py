@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from src.domain.entities.auth_epoch import AuthEpoch
 from src.domain.entities.user_entity import UserEntity
 
 class UserRepository(ABC):
@@ -21,6 +22,29 @@ class UserRepository(ABC):
     async def get_user_by_email(self, email: str) -> UserEntity | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_user_credentials_by_email(self, email: str) -> UserEntity | None:
+        """Đọc user kèm hash mật khẩu thẳng từ DB (không qua cache), chỉ dùng để xác thực đăng nhập."""
+        raise NotImplementedError
+
     @abstractmethod
     async def update_user_by_id(self, user_id: int, updates: dict) -> UserEntity | None:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    async def record_signin(self, user_id: int, password: str | None = None) -> UserEntity | None:
+        """Tăng signin_count, cập nhật last_login (và hash mật khẩu mới nếu có) trong một câu lệnh."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def record_sign_out(self, user_id: int) -> UserEntity | None:
+        """Tăng sign_out_count trong một câu lệnh."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_auth_epoch(self, user_id: int, fresh: bool = False) -> AuthEpoch | None:
+        """
+        Bộ đếm signin/sign_out hiện tại của user, ưu tiên đọc từ cache.
+        :param fresh: True để bỏ qua cache và đọc trực tiếp từ primary
+        """
+        raise NotImplementedError
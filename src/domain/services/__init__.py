@@ -1,4 +1,5 @@
-from .mail_service import MailService
+from .mail_service import MailService, MailPriority
 from .otp_service import OTPService
 from .password_hasher_service import PasswordHasherService
-from .token_service import TokenService
\ No newline at end of file
+from .token_service import TokenService
+from .google_token_verifier import GoogleTokenVerifier
\ No newline at end of file
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+
+class GoogleTokenVerifier(ABC):
+    @abstractmethod
+    async def verify(self, token: str) -> dict:
+        """
+        Kiểm tra chữ ký, audience, issuer và hạn dùng của ID token Google.
+        Trả về các claim của token; ném TokenInvalidError nếu token không hợp lệ.
+        """
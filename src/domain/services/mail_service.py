@@ -1,9 +1,22 @@
 from abc import ABC, abstractmethod
+from enum import IntEnum
+
+
+class MailPriority(IntEnum):
+    """Làn gửi email, giá trị nhỏ hơn được gửi trước."""
+    SECURITY = 0  # OTP, đặt lại mật khẩu, cảnh báo bảo mật
+    NOTIFICATION = 1
+    BULK = 2
 
 
 class MailService(ABC):
     @abstractmethod
     async def send_mail(self, to: str, subject: str, html: str) -> None: ...
 
+    @abstractmethod
+    async def enqueue_mail(self, to: str, subject: str, html: str,
+                           priority: MailPriority = MailPriority.NOTIFICATION) -> None:
+        """Đưa email vào hàng đợi gửi nền theo làn `priority`; trả về ngay, không chờ mail server."""
+
     @abstractmethod
     def build_otp_template(self, otp: str) -> dict[str, str]: ...
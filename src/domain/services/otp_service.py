@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
 
 
 class OTPService(ABC):
@@ -22,3 +23,14 @@ class OTPService(ABC):
 
     @abstractmethod
     async def update_otp(self, email: str, otp: str) -> bool: ...
+
+
+    @abstractmethod
+    async def coalesce_send(self, email: str, send: Callable[[], Awaitable[None]],
+                            flow: str, payload: str = "") -> bool:
+        """
+        Chạy `send` (tạo + lưu OTP + gửi email) trừ khi một yêu cầu giống hệt — cùng luồng `flow`,
+        cùng email và cùng `payload` (dữ liệu sẽ được lưu kèm OTP) — vừa được gửi trong cửa sổ gộp.
+        Yêu cầu mang dữ liệu khác (ví dụ đăng ký lại với mật khẩu đã sửa) luôn được gửi.
+        Trả về False nếu yêu cầu bị gộp vào lần gửi trước đó (không tạo OTP, không gửi email).
+        """
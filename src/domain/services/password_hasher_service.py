@@ -3,7 +3,10 @@ from abc import abstractmethod, ABC
 
 class PasswordHasherService(ABC):
     @abstractmethod
-    def hash(self, password: str) -> str: ...
+    async def hash(self, password: str) -> str: ...
 
     @abstractmethod
-    def verify(self, hashed_password: str, password: str) -> bool: ...
\ No newline at end of file
+    async def verify(self, hashed_password: str, password: str) -> bool: ...
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool: ...
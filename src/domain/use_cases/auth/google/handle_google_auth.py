@@ -1,13 +1,9 @@
 import logging
 
-from google.oauth2 import id_token
-from google.auth.transport import requests
-
-from src.core.config import settings
 from src.core.exceptions import ServerError, AppError
 from src.domain.entities.user_entity import UserStatus, UserEntity
 from src.domain.repositories import UserRepository
-from src.domain.services import TokenService
+from src.domain.services import GoogleTokenVerifier, TokenService
 
 logger = logging.getLogger(__name__)
 
@@ -15,16 +11,15 @@ logger = logging.getLogger(__name__)
 class HandleGoogleAuthUseCase:
     def __init__(self,
                  user_repository: UserRepository,
-                 token_service: TokenService):
+                 token_service: TokenService,
+                 google_token_verifier: GoogleTokenVerifier):
         self.user_repository = user_repository
         self.token_service = token_service
-        self.client_id = settings.GOOGLE_CLIENT_ID
+        self.google_token_verifier = google_token_verifier
 
     async def execute(self, user_id_token: str) -> dict[str, str]:
         try:
-            idinfo = id_token.verify_oauth2_token(
-                user_id_token, requests.Request(), self.client_id
-            )
+            idinfo = await self.google_token_verifier.verify(user_id_token)
 
             user_email = idinfo.get("email")
             if not user_email:
@@ -48,6 +43,10 @@ class HandleGoogleAuthUseCase:
                     logger.error(f"HandleGoogleAuthUseCase - create user: {e}")
                     raise ServerError() from e
 
+            user = await self.user_repository.record_signin(user.id)
+            if not user:
+                raise ServerError()
+
             refresh_token, device_id = self.token_service.create_refresh_token(
                 user_id=user.id,
                 signin_count=user.signin_count,
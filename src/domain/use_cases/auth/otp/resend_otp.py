@@ -2,7 +2,7 @@ import logging
 
 from src.core.exceptions import ServerError, AppError
 from src.domain.exceptions.auth_exception import TooManyOtpRequestsError
-from src.domain.services import OTPService, MailService
+from src.domain.services import OTPService, MailService, MailPriority
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +15,10 @@ class ResendOTPUseCase:
         self.mail_service = mail_service
 
     async def execute(self, email: str):
+        # Bấm "gửi lại" nhiều lần liên tiếp chỉ tạo một OTP và gửi một email
+        await self.otp_service.coalesce_send(email, lambda: self._send_otp(email), flow="resend")
+
+    async def _send_otp(self, email: str):
         allowed = await self.otp_service.check_and_increment_limit(email)
         if not allowed:
             raise TooManyOtpRequestsError()
@@ -27,10 +31,11 @@ class ResendOTPUseCase:
         template = self.mail_service.build_otp_template(otp)
 
         try:
-            await self.mail_service.send_mail(
+            await self.mail_service.enqueue_mail(
                 to=email,
                 subject=template["subject"],
                 html=template["html"],
+                priority=MailPriority.SECURITY,
             )
 
         except AppError:
@@ -30,7 +30,7 @@ class ChangePasswordUseCase:
         user_id = int(user_id)
 
         try:
-            hashed_pw = self.password_hasher_service.hash(new_password)
+            hashed_pw = await self.password_hasher_service.hash(new_password)
             updates = {"password": hashed_pw}
             user = await self.user_repository.update_user_by_id(user_id, updates)
             if not user:
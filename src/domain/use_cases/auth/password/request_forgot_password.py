@@ -3,7 +3,7 @@ import logging
 from src.core.exceptions import ServerError, AppError
 from src.domain.exceptions.auth_exception import TooManyOtpRequestsError, EmailNotRegisteredError
 from src.domain.repositories import UserRepository
-from src.domain.services import OTPService, MailService
+from src.domain.services import OTPService, MailService, MailPriority
 
 logger = logging.getLogger(__name__)
 
@@ -24,20 +24,7 @@ class RequestForgotPasswordUseCase:
             if not user:
                 raise EmailNotRegisteredError()
 
-            allowed = await self.otp_service.check_and_increment_limit(email)
-
-            if not allowed:
-                raise TooManyOtpRequestsError()
-
-            otp = self.otp_service.generate_otp()
-            template = self.mail_service.build_otp_template(otp)
-            await self.mail_service.send_mail(
-                to=email,
-                subject=template["subject"],
-                html=template["html"],
-            )
-
-            await self.otp_service.save_forgot_otp(email=email, otp=otp, user_id=user.id)
+            await self.otp_service.coalesce_send(email, lambda: self._send_otp(email, user.id), flow="forgot")
             return {"email": email}
 
         except AppError:
@@ -46,3 +33,21 @@ class RequestForgotPasswordUseCase:
         except Exception as e:
             logger.error(f"RequestForgotPasswordUseCase: {e}")
             raise ServerError() from e
+
+    async def _send_otp(self, email: str, user_id: str):
+        allowed = await self.otp_service.check_and_increment_limit(email)
+
+        if not allowed:
+            raise TooManyOtpRequestsError()
+
+        otp = self.otp_service.generate_otp()
+        await self.otp_service.save_forgot_otp(email=email, otp=otp, user_id=user_id)
+
+        # Lưu OTP trước rồi mới xếp email vào outbox để worker không gửi mã chưa tồn tại
+        template = self.mail_service.build_otp_template(otp)
+        await self.mail_service.enqueue_mail(
+            to=email,
+            subject=template["subject"],
+            html=template["html"],
+            priority=MailPriority.SECURITY,
+        )
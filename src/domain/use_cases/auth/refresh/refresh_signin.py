@@ -28,16 +28,16 @@ class RefreshSigninUseCase:
             signin_count = payload["signin_count"]
             sign_out_count = payload["sign_out_count"]
 
-            # Lấy user trong DB
-            user = await self.user_repository.get_user_by_id(user_id=user_id)
-            if not user:
+            # Lấy bộ đếm hiện tại của user (cache Redis, đọc DB khi cache trống)
+            epoch = await self.user_repository.get_auth_epoch(user_id)
+            if epoch and epoch.is_behind(signin_count, sign_out_count):
+                # Token mới hơn cache → cache chưa kịp cập nhật, đọc lại từ DB
+                epoch = await self.user_repository.get_auth_epoch(user_id, fresh=True)
+            if not epoch:
                 raise UnauthorizedError()
 
             # Kiểm tra sync giữa token và user (chống reuse)
-            if (
-                    user.signin_count != signin_count
-                    or user.sign_out_count != sign_out_count
-            ):
+            if not epoch.matches(signin_count, sign_out_count):
                 # Token cũ (user đã đăng nhập lại hoặc đăng xuất sau khi token này phát hành)
                 await self.token_service.delete_all_refresh_tokens(user_id)
                 raise UnauthorizedError()
@@ -51,7 +51,7 @@ class RefreshSigninUseCase:
 
             # Nếu mọi thứ OK → tạo access token mới
             access_token = self.token_service.create_access_token(
-                user_id=user.id,
+                user_id=user_id,
                 signin_count=signin_count,
                 sign_out_count=sign_out_count,
                 refresh_jti=device_id
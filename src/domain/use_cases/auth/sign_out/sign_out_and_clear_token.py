@@ -16,26 +16,23 @@ class SignOutAndClearTokenUseCase:
         self.token_service = token_service
 
     async def execute(self, user_id: int, signin_count: int, sign_out_count: int):
-        user = await self.user_repository.get_user_by_id(user_id=user_id)
+        epoch = await self.user_repository.get_auth_epoch(user_id)
+        if epoch and epoch.is_behind(signin_count, sign_out_count):
+            # Token mới hơn cache → cache chưa kịp cập nhật, đọc lại từ DB
+            epoch = await self.user_repository.get_auth_epoch(user_id, fresh=True)
 
-        if not user:
+        if not epoch:
             raise EmailNotRegisteredError()
 
-        if (
-                user.signin_count != signin_count
-                or user.sign_out_count != sign_out_count
-        ):
+        if not epoch.matches(signin_count, sign_out_count):
             # Token cũ (user đã đăng nhập lại hoặc đăng xuất sau khi token này phát hành)
             await self.token_service.delete_all_refresh_tokens(user_id)
             raise UnauthorizedError()
 
         try:
-            user.increase_sign_out_count()
-            updates = {"sign_out_count": user.sign_out_count}
+            await self.user_repository.record_sign_out(user_id)
 
-            await self.user_repository.update_user_by_id(user.id, updates)
-
-            await self.token_service.delete_all_refresh_tokens(user_id=user.id)
+            await self.token_service.delete_all_refresh_tokens(user_id=user_id)
 
         except AppError:
             raise
@@ -19,22 +19,23 @@ class SigninWithEmailPasswordUseCase:
 
     async def execute(self, email: str, password: str) -> dict[str, str]:
 
-        user = await self.user_repository.get_user_by_email(email)
+        user = await self.user_repository.get_user_credentials_by_email(email)
 
         if not user:
             raise EmailNotRegisteredError()
 
-        is_verify = self.password_hasher_service.verify(hashed_password=user.password, password=password)
+        is_verify = await self.password_hasher_service.verify(hashed_password=user.password, password=password)
 
         if not is_verify:
             raise IncorrectPasswordError()
 
         try:
-            user.increase_signin_count()
+            # Hash tạo theo profile argon2 cũ → hash lại bằng profile hiện tại, lưu cùng lượt update
+            new_hash = await self._rehash_if_needed(user.password, password)
 
-            updates = {"signin_count": user.signin_count}
-
-            await self.user_repository.update_user_by_id(user.id, updates)
+            user = await self.user_repository.record_signin(user.id, password=new_hash)
+            if not user:
+                raise EmailNotRegisteredError()
 
             refresh_token, device_id = self.token_service.create_refresh_token(
                 user_id=user.id,
@@ -56,3 +57,13 @@ class SigninWithEmailPasswordUseCase:
         except Exception as e:
             logger.error(f"SigninWithEmailPasswordUseCase: {e}")
             raise ServerError() from e
+
+    async def _rehash_if_needed(self, hashed_password: str, password: str) -> str | None:
+        if not self.password_hasher_service.needs_rehash(hashed_password):
+            return None
+        try:
+            return await self.password_hasher_service.hash(password)
+        except Exception as e:
+            # Không để việc nâng cấp hash làm hỏng lượt đăng nhập, lần sau sẽ thử lại.
+            logger.warning(f"SigninWithEmailPasswordUseCase - rehash skipped: {e}")
+            return None
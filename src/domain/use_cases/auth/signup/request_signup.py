@@ -3,7 +3,7 @@ import logging
 from src.core.exceptions import ServerError, AppError
 from src.domain.exceptions.auth_exception import EmailAlreadyUsedError, TooManyOtpRequestsError
 from src.domain.repositories import UserRepository
-from src.domain.services import OTPService, MailService, PasswordHasherService
+from src.domain.services import OTPService, MailService, MailPriority, PasswordHasherService
 
 logger = logging.getLogger(__name__)
 
@@ -25,22 +25,14 @@ class RequestSignupUseCase:
             raise EmailAlreadyUsedError()
 
         try:
-            allowed = await self.otp_service.check_and_increment_limit(email)
-
-            if not allowed:
-                raise TooManyOtpRequestsError()
-
-            otp = self.otp_service.generate_otp()
-            template = self.mail_service.build_otp_template(otp)
-            await self.mail_service.send_mail(
-                to=email,
-                subject=template["subject"],
-                html=template["html"],
+            # Yêu cầu đăng ký lặp lại y hệt trong cửa sổ gộp dùng chung OTP/email của yêu cầu đầu tiên;
+            # đăng ký lại với tên/mật khẩu khác thì gửi OTP mới và lưu dữ liệu mới
+            await self.otp_service.coalesce_send(
+                email,
+                lambda: self._send_otp(email, name, password),
+                flow="signup",
+                payload=f"{name}\0{password}",
             )
-
-            hashed_pw = self.password_hasher_service.hash(password)
-            await self.otp_service.save_signup_otp(email=email, otp=otp, name=name, password=hashed_pw)
-
             return {"email": email}
 
         except AppError:
@@ -49,3 +41,22 @@ class RequestSignupUseCase:
         except Exception as e:
             logger.error(f"RequestSignupUseCase unexpected error: {e}")
             raise ServerError() from e
+
+    async def _send_otp(self, email: str, name: str, password: str):
+        allowed = await self.otp_service.check_and_increment_limit(email)
+
+        if not allowed:
+            raise TooManyOtpRequestsError()
+
+        otp = self.otp_service.generate_otp()
+        hashed_pw = await self.password_hasher_service.hash(password)
+        await self.otp_service.save_signup_otp(email=email, otp=otp, name=name, password=hashed_pw)
+
+        # Lưu OTP trước rồi mới xếp email vào outbox để worker không gửi mã chưa tồn tại
+        template = self.mail_service.build_otp_template(otp)
+        await self.mail_service.enqueue_mail(
+            to=email,
+            subject=template["subject"],
+            html=template["html"],
+            priority=MailPriority.SECURITY,
+        )
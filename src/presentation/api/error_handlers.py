@@ -0,0 +1,79 @@
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+
+from src.core.exceptions import (
+    AppError,
+    DoNotPermissionError,
+    PayloadTooLargeError,
+    TooManyRequestsError,
+    UnauthorizedError,
+)
+from src.domain.exceptions.auth_exception import (
+    EmailAlreadyUsedError,
+    EmailNotRegisteredError,
+    IncorrectPasswordError,
+    OTPIncorrectError,
+    TokenExpiredError,
+    TokenInvalidError,
+    TooManyOtpRequestsError,
+    UserNotFoundError,
+)
+from src.schemas.error_response import ErrorResponse, PreEncodedError
+
+def _pre_encode(error: AppError) -> PreEncodedError:
+    return PreEncodedError(error.status_code, error.message, error.errors)
+
+
+# Các lỗi có nội dung cố định → encode body một lần khi khởi động thay vì mỗi request
+_PRE_ENCODED_ERRORS: dict[type[AppError], PreEncodedError] = {
+    type(error): _pre_encode(error)
+    for error in (
+        UnauthorizedError(),
+        DoNotPermissionError(),
+        PayloadTooLargeError(),
+        TooManyRequestsError(),
+        TooManyOtpRequestsError(),
+        TokenExpiredError(),
+        TokenInvalidError(),
+        OTPIncorrectError(),
+        IncorrectPasswordError(),
+        EmailAlreadyUsedError(),
+        EmailNotRegisteredError(),
+        UserNotFoundError(),
+    )
+}
+
+UNAUTHORIZED = _PRE_ENCODED_ERRORS[UnauthorizedError]
+TOO_MANY_REQUESTS = _PRE_ENCODED_ERRORS[TooManyRequestsError]
+INTERNAL_SERVER_ERROR = PreEncodedError(
+    status=500,
+    message="Internal Server Error",
+    errors={"message": "Hệ thống đã xảy ra lỗi, Vui lòng thử lại sau."},
+)
+
+
+def error_response(error: AppError) -> Response:
+    pre_encoded = _PRE_ENCODED_ERRORS.get(type(error))
+    if pre_encoded is not None:
+        return pre_encoded.response(error.headers)
+    return ErrorResponse(
+        status=error.status_code,
+        message=error.message,
+        errors=error.errors,
+        headers=error.headers
+    )
+
+
+async def app_error_handler(request: Request, exc: AppError) -> Response:
+    return error_response(exc)
+
+
+async def unhandled_error_handler(request: Request, exc: Exception) -> Response:
+    # Starlette vẫn raise lại lỗi sau khi gửi response nên traceback được log bởi server
+    return INTERNAL_SERVER_ERROR.response()
+
+
+def register_error_handlers(app: FastAPI):
+    """Ánh xạ lỗi sang ErrorResponse bằng exception handler, không thêm middleware cho mỗi request."""
+    app.add_exception_handler(AppError, app_error_handler)
+    app.add_exception_handler(Exception, unhandled_error_handler)
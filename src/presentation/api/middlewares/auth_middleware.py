@@ -1,16 +1,16 @@
 import logging
+import re
 
 import jwt
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
-
-from src.schemas.error_response import ErrorResponse
-
-logger = logging.getLogger(__name__)
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.core.config import settings
 from src.core.exceptions import UnauthorizedError
+from src.data.cache.access_token_cache import access_token_cache
+from src.domain.entities import AuthPrincipal
+from src.presentation.api.error_handlers import INTERNAL_SERVER_ERROR, UNAUTHORIZED
+
+logger = logging.getLogger(__name__)
 
 # --- Các đường dẫn công khai không cần xác thực ---
 PUBLIC_PATHS = [
@@ -22,63 +22,93 @@ PUBLIC_PATHS = [
     "/api/v1/auth/google",
 ]
 
+# Gộp toàn bộ prefix public thành một regex neo đầu chuỗi, so khớp một lần thay vì duyệt list
+_PUBLIC_PATH_PATTERN = re.compile("|".join(re.escape(path) for path in PUBLIC_PATHS))
+
+
+# Claim bắt buộc của access token (xem TokenServiceImpl.create_access_token)
+REQUIRED_CLAIMS = ["exp", "id", "signin_count", "sign_out_count", "refresh_jti"]
+
+
+def is_public_path(path: str) -> bool:
+    return _PUBLIC_PATH_PATTERN.match(path) is not None
+
+
+class AuthMiddleware:
+    """
+    Middleware ASGI thuần: xác thực Bearer token cho mọi path không public và gắn
+    AuthPrincipal vào scope["user"] (đọc lại bằng `request.user`).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # --- Bỏ qua lifespan/websocket và các path public ---
+        if scope["type"] != "http" or is_public_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         try:
-            # --- Bỏ qua các path public ---
-            if any(request.url.path.startswith(path) for path in PUBLIC_PATHS):
-                return await call_next(request)
-
-            # --- Lấy và kiểm tra header Authorization ---
-            auth_header = request.headers.get("Authorization")
-            if not auth_header:
-                raise UnauthorizedError()
-
-            try:
-                scheme, token = auth_header.split()
-                if scheme.lower() != "bearer":
-                    raise UnauthorizedError()
-            except ValueError:
-                raise UnauthorizedError()
-
-            # --- Giải mã token ---
-            try:
-                payload = jwt.decode(
-                    token,
-                    key=settings.JWT_ACCESS_SECRET,
-                    algorithms=["HS256"]
-                )
-            except jwt.ExpiredSignatureError as e:
-                logger.warning(f"Expired JWT: {e}")
-                raise UnauthorizedError()
-            except jwt.InvalidTokenError:
-                raise UnauthorizedError()
-
-            # --- Gắn payload vào request.state ---
-            request.state.user = {
-                "id": payload["id"],
-                "signin_count": payload["signin_count"],
-                "sign_out_count": payload["sign_out_count"],
-                "refresh_jti": payload["refresh_jti"],
-            }
-
-            # --- Tiếp tục xử lý request ---
-            return await call_next(request)
-
-        except UnauthorizedError as e:
-            # Xử lý 401 lỗi xác thực
-            return ErrorResponse(
-                status=e.status_code,
-                message=e.message,
-                errors=e.errors
-            )
+            principal = self.authenticate(scope)
+
+        except UnauthorizedError:
+            # Xử lý 401 lỗi xác thực (body encode sẵn, đây là path nóng khi bị dò token)
+            await UNAUTHORIZED.response()(scope, receive, send)
+            return
 
-        except Exception as e:
+        except Exception:
             # Bắt mọi lỗi không lường trước
             logger.exception("Unhandled error in AuthMiddleware")
-            return ErrorResponse(
-                status=500,
-                message="Internal Server Error",
-                errors={"system": str(e)}
+            await INTERNAL_SERVER_ERROR.response()(scope, receive, send)
+            return
+
+        # --- Gắn principal vào scope và tiếp tục xử lý request ---
+        scope["user"] = principal
+        await self.app(scope, receive, send)
+
+    def authenticate(self, scope: Scope) -> AuthPrincipal:
+        # --- Lấy và kiểm tra header Authorization ---
+        auth_header = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value.decode("latin-1")
+                break
+
+        if not auth_header:
+            raise UnauthorizedError()
+
+        parts = auth_header.split()
+        if len(parts) != 2 or parts[0].lower() != "bearer":
+            raise UnauthorizedError()
+
+        token = parts[1]
+
+        # --- Token đã verify trước đó và chưa tới `exp` → dùng lại principal ---
+        principal = access_token_cache.get(token)
+        if principal is not None:
+            return principal
+
+        # --- Giải mã token ---
+        try:
+            payload = jwt.decode(
+                token,
+                key=settings.JWT_ACCESS_SECRET,
+                algorithms=["HS256"],
+                # Thiếu claim nào (kể cả exp) → 401 thay vì KeyError khi dựng principal/cache
+                options={"require": REQUIRED_CLAIMS},
             )
+        except jwt.ExpiredSignatureError as e:
+            logger.warning(f"Expired JWT: {e}")
+            raise UnauthorizedError()
+        except jwt.InvalidTokenError:
+            raise UnauthorizedError()
+
+        principal = AuthPrincipal(
+            id=payload["id"],
+            signin_count=payload["signin_count"],
+            sign_out_count=payload["sign_out_count"],
+            refresh_jti=payload["refresh_jti"],
+        )
+        access_token_cache.put(token, principal, payload["exp"])
+        return principal
@@ -0,0 +1,18 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.data.db.session import db_session_scope
+
+
+class DbSessionMiddleware:
+    """Mỗi request HTTP có một phạm vi session DB riêng, đóng lại khi response đã gửi xong."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with db_session_scope():
+            await self.app(scope, receive, send)
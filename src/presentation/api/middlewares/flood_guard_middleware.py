@@ -0,0 +1,45 @@
+import math
+
+from cachetools import LRUCache
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.utils.client_ip import client_ip_from_scope
+from src.core.utils.token_bucket import TokenBucket
+from src.presentation.api.error_handlers import TOO_MANY_REQUESTS
+
+
+class FloodGuardMiddleware:
+    """
+    Chặn sớm các IP gửi request dồn dập bằng token bucket trong bộ nhớ, trước khi
+    request chạm tới giới hạn theo route (Redis) hay xác thực.
+
+    Ngưỡng ở đây rộng hơn nhiều so với giới hạn của từng endpoint: chỉ nhằm loại bỏ
+    flood rõ ràng mà không tốn round trip Redis; giới hạn chính xác vẫn do `limiter` của từng route đảm nhận.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.rate = settings.FLOOD_GUARD_RATE
+        self.burst = settings.FLOOD_GUARD_BURST
+        self._buckets: LRUCache[str, TokenBucket] = LRUCache(maxsize=settings.FLOOD_GUARD_MAX_CLIENTS)
+        self._rejected = metrics.counter("flood_guard.rejected")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client_ip = client_ip_from_scope(scope)
+        bucket = self._buckets.get(client_ip)
+        if bucket is None:
+            bucket = self._buckets[client_ip] = TokenBucket(self.rate, self.burst)
+
+        if not bucket.consume():
+            self._rejected.inc()
+            response = TOO_MANY_REQUESTS.response({"Retry-After": str(math.ceil(bucket.retry_after()))})
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,71 @@
+from typing import TypeVar
+
+import pydantic
+from fastapi import Request
+
+from src.core.config import settings
+from src.core.exceptions import DoNotPermissionError, PayloadTooLargeError, ValidationError
+from src.schemas.auth_request import PERMISSION_ERROR, RULE_ERROR
+
+Model = TypeVar("Model", bound=pydantic.BaseModel)
+
+INVALID_JSON = "Dữ liệu gửi lên không đúng định dạng JSON."
+NOT_AN_OBJECT = "Dữ liệu gửi lên phải là một JSON object."
+INVALID_VALUE = "Giá trị không hợp lệ."
+
+
+async def read_body(request: Request, max_bytes: int | None = None) -> bytes:
+    """
+    Đọc body theo từng chunk, dừng và trả 413 ngay khi vượt `max_bytes` (mặc định
+    REQUEST_BODY_MAX_BYTES) — body quá lớn không bao giờ được buffer hết vào bộ nhớ.
+    """
+    max_bytes = max_bytes or settings.REQUEST_BODY_MAX_BYTES
+
+    content_length = request.headers.get("content-length")
+    if content_length is not None:
+        # Content-Length không phải số nguyên không âm → request sai định dạng, không phải quá lớn
+        if not content_length.isdigit():
+            raise ValidationError(errors={"body": INVALID_JSON})
+        # Content-Length đã khai báo vượt ngưỡng → từ chối luôn, không đọc byte nào
+        if int(content_length) > max_bytes:
+            raise PayloadTooLargeError()
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        # Chunked hoặc Content-Length khai báo sai: vẫn chặn theo số byte thực nhận
+        if len(body) > max_bytes:
+            raise PayloadTooLargeError()
+
+    # Lưu lại để `request.body()` gọi sau (nếu có) không đọc lại stream đã hết
+    request._body = bytes(body)
+    return request._body
+
+
+async def parse_body(request: Request, model: type[Model]) -> Model:
+    """
+    Đọc body và validate bằng model pydantic trong một bước (`model_validate_json` parse JSON
+    bằng core Rust của pydantic, không dựng dict trung gian). Lỗi được đổi sang ValidationError
+    với một câu lỗi cho mỗi trường, cùng định dạng với các route trước đây. Thiếu trường định
+    danh của flow (FlowIdentifier) → DoNotPermissionError, bất kể các trường khác có lỗi hay không.
+    """
+    body = await read_body(request)
+    try:
+        return model.model_validate_json(body)
+    except pydantic.ValidationError as e:
+        if any(item["type"] == PERMISSION_ERROR for item in e.errors(include_url=False)):
+            raise DoNotPermissionError()
+        raise ValidationError(errors=_field_errors(e))
+
+
+def _field_errors(error: pydantic.ValidationError) -> dict[str, str]:
+    errors: dict[str, str] = {}
+    for item in error.errors(include_url=False, include_context=False, include_input=False):
+        if item["type"] == "json_invalid":
+            return {"body": INVALID_JSON}
+        if not item["loc"]:
+            # Body là JSON hợp lệ nhưng không phải object (mảng, chuỗi, số,...)
+            return {"body": NOT_AN_OBJECT}
+        message = item["msg"] if item["type"] == RULE_ERROR else INVALID_VALUE
+        errors.setdefault(str(item["loc"][0]), message)
+    return errors
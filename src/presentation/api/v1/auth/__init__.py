@@ -17,4 +17,3 @@ auth_router.include_router(otp_router)
 auth_router.include_router(refresh_router)
 auth_router.include_router(sign_out_router)
 auth_router.include_router(google_router)
-
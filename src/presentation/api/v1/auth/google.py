@@ -2,13 +2,14 @@ from fastapi import APIRouter, Depends, Request
 from dependency_injector.wiring import inject, Provide
 
 from src.app.container import Container
-from src.core.exceptions import AppError, ValidationError
+from src.core.exceptions import ValidationError
 from src.core.limiter import limiter
 from src.core.utils.validations.base_validation import is_empty
 from src.domain.use_cases.auth import HandleGoogleAuthUseCase
+from src.presentation.api.request_body import parse_body
 
+from src.schemas.auth_request import GoogleAuthRequest
 from src.schemas.base_response import BaseResponse
-from src.schemas.error_response import ErrorResponse
 
 router = APIRouter(prefix="/google", tags=["Google Authentication"])
 
@@ -19,30 +20,23 @@ router = APIRouter(prefix="/google", tags=["Google Authentication"])
 async def google_auth(
         request: Request,
         handle_google_auth_use_case: HandleGoogleAuthUseCase = Depends(Provide[Container.handle_google_auth_use_case])):
-    body = await request.json()
-    user_id_token = body.get("user_id_token", "").strip()
+    body = await parse_body(request, GoogleAuthRequest)
 
     errors = {}
 
-    user_id_token_error = is_empty(user_id_token)
+    user_id_token_error = is_empty(body.user_id_token)
     if user_id_token_error:
         errors["token"] = user_id_token_error
 
     if errors:
         raise ValidationError(errors=errors)
-    try:
-        data = await handle_google_auth_use_case.execute(
-            user_id_token=user_id_token
-        )
-
-        return BaseResponse(
-            status=200,
-            message="Đăng nhập tài khoản thành công",
-            data=data
-        )
-    except AppError as e:
-        return ErrorResponse(
-            status=e.status_code,
-            message=e.message,
-            errors=e.errors
-        )
+
+    data = await handle_google_auth_use_case.execute(
+        user_id_token=body.user_id_token
+    )
+
+    return BaseResponse(
+        status=200,
+        message="Đăng nhập tài khoản thành công",
+        data=data
+    )
@@ -0,0 +1,104 @@
+from typing import Annotated, Callable
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, ValidationInfo, field_validator
+from pydantic_core import PydanticCustomError
+
+from src.core.utils.validations.auth_validations import validate_email, validate_name, validate_otp, validate_password
+from src.core.utils.validations.base_validation import is_empty
+
+# Loại lỗi của các rule validate_*: message của lỗi là câu thông báo trả nguyên cho client
+RULE_ERROR = "auth_rule"
+# Loại lỗi khi thiếu trường định danh của flow (email đang xác thực, reset token): request bị
+# từ chối 403 trước mọi lỗi validation của các trường khác
+PERMISSION_ERROR = "auth_permission"
+
+
+def _rule(validate: Callable[[str], str | None]) -> AfterValidator:
+    """Dùng lại hàm validate_* (trả về câu lỗi hoặc None) làm validator của pydantic."""
+    def check(value: str) -> str:
+        error = validate(value)
+        if error:
+            raise PydanticCustomError(RULE_ERROR, error)
+        return value
+    return AfterValidator(check)
+
+
+def _required(message: str) -> AfterValidator:
+    return _rule(lambda value: message if is_empty(value) else None)
+
+
+def _check_permission(value: str) -> str:
+    if is_empty(value):
+        raise PydanticCustomError(PERMISSION_ERROR, "Missing flow identifier")
+    return value
+
+
+Name = Annotated[str, _rule(validate_name)]
+Email = Annotated[str, _rule(validate_email)]
+Password = Annotated[str, _rule(validate_password)]
+OTP = Annotated[str, _rule(validate_otp)]
+FlowIdentifier = Annotated[str, AfterValidator(_check_permission)]
+
+
+class AuthRequest(BaseModel):
+    """
+    Body JSON của các route auth: chuỗi được strip, trường thiếu coi như chuỗi rỗng (vẫn đi
+    qua validator để trả đúng câu lỗi "Vui lòng nhập ..."), trường lạ bị bỏ qua.
+    """
+
+    model_config = ConfigDict(str_strip_whitespace=True, validate_default=True, extra="ignore", frozen=True)
+
+
+class SignupRequest(AuthRequest):
+    name: Name = ""
+    email: Email = ""
+    password: Password = ""
+
+
+class SignupVerificationRequest(AuthRequest):
+    # Thiếu email → 403 thay vì lỗi validation
+    email: FlowIdentifier = ""
+    otp: OTP = ""
+
+
+class SigninRequest(AuthRequest):
+    email: Email = ""
+    password: Annotated[str, _required("Vui lòng nhập mật khẩu.")] = ""
+
+
+class ResendOTPRequest(AuthRequest):
+    email: Email = ""
+
+
+class ForgotPasswordRequest(AuthRequest):
+    email: Email = ""
+
+
+class PasswordVerificationRequest(AuthRequest):
+    email: Email = ""
+    otp: OTP = ""
+
+
+class ResetPasswordRequest(AuthRequest):
+    # Thiếu reset_token → 403 thay vì lỗi validation
+    reset_token: FlowIdentifier = ""
+    new_password: Password = ""
+    confirm_password: str = ""
+
+    @field_validator("confirm_password")
+    @classmethod
+    def check_confirm_password(cls, value: str, info: ValidationInfo) -> str:
+        # new_password không hợp lệ thì không có trong info.data, chỉ báo lỗi của new_password
+        new_password = info.data.get("new_password")
+        if new_password is not None and value != new_password:
+            raise PydanticCustomError(RULE_ERROR, "Mật khẩu xác nhận không khớp.")
+        return value
+
+
+class RefreshRequest(AuthRequest):
+    # Thiếu refresh_token → route trả 401
+    refresh_token: str = ""
+
+
+class GoogleAuthRequest(AuthRequest):
+    user_id_token: str = ""
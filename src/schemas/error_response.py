@@ -1,10 +1,48 @@
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
-class ErrorResponse(JSONResponse):
-    def __init__(self, status: int, message: str, errors: dict | None = None):
+from src.core.utils.json_codec import json_codec
+from src.schemas.json_response import CodecJSONResponse
+
+
+class ErrorResponse(CodecJSONResponse):
+    def __init__(self, status: int, message: str, errors: dict | None = None, headers: dict[str, str] | None = None):
         content = {
             "status": status,
             "message": message,
             "errors": errors or {}
         }
-        super().__init__(status_code=status, content=content)
+        super().__init__(status_code=status, content=content, headers=headers)
+
+
+class PreEncodedError:
+    """
+    Body JSON của một lỗi có nội dung cố định (401, 403, 429,...), encode sẵn một lần.
+    Giống từng byte với ErrorResponse cùng nội dung (cùng được encode bằng json_codec).
+    """
+
+    __slots__ = ("status", "body", "raw_headers")
+
+    def __init__(self, status: int, message: str, errors: dict | None = None):
+        self.status = status
+        self.body = json_codec.dumps({"status": status, "message": message, "errors": errors or {}})
+        self.raw_headers = (
+            (b"content-length", str(len(self.body)).encode("latin-1")),
+            (b"content-type", b"application/json"),
+        )
+
+    def response(self, headers: dict[str, str] | None = None) -> "PreEncodedErrorResponse":
+        return PreEncodedErrorResponse(self, headers)
+
+
+class PreEncodedErrorResponse(Response):
+    """Response dùng lại body/header của PreEncodedError, không serialize lại cho từng request."""
+
+    media_type = "application/json"
+
+    def __init__(self, error: PreEncodedError, headers: dict[str, str] | None = None):
+        self.status_code = error.status
+        self.body = error.body
+        self.background = None
+        self.raw_headers = list(error.raw_headers)
+        if headers:
+            self.raw_headers.extend((k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items())
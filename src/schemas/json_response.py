@@ -0,0 +1,12 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from src.core.utils.json_codec import json_codec
+
+
+class CodecJSONResponse(JSONResponse):
+    """JSONResponse render bằng json_codec (orjson nếu có); là response class mặc định của app."""
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps(content)
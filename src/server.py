@@ -0,0 +1,173 @@
+"""
+Entrypoint production: `python -m src.server` (chỉ chạy trên Linux/macOS, cần os.fork).
+
+- Process master import app (src.main) một lần rồi mới fork các worker, nên code và dữ liệu
+  lúc import được chia sẻ copy-on-write giữa các worker thay vì mỗi worker tự import lại.
+- Số worker mặc định bằng số CPU khả dụng theo quota cgroup của container (SERVER_WORKERS để ghi đè).
+- Worker chạy uvicorn với uvloop + httptools trên socket chung do master bind sẵn; lifespan
+  (kết nối DB/Redis, outbox, pool hash...) chạy riêng trong từng worker, sau khi fork.
+- Worker tự tắt êm sau SERVER_MAX_REQUESTS (+ jitter ngẫu nhiên để các worker không khởi động
+  lại cùng lúc) request và được master thay bằng worker mới, giới hạn bộ nhớ tăng dần.
+- SIGTERM/SIGINT: master chuyển SIGTERM cho các worker (uvicorn ngừng nhận kết nối, xử lý nốt
+  request đang chạy, chạy lifespan shutdown), quá SERVER_GRACEFUL_TIMEOUT thì kill.
+- Worker không khởi động được (lifespan startup lỗi) → master dừng toàn bộ thay vì fork lại liên tục.
+"""
+import gc
+import logging
+import os
+import random
+import signal
+import socket
+import sys
+import time
+
+import uvicorn
+
+from src.core.config import settings
+from src.core.utils.cpu import available_cpus
+
+logger = logging.getLogger(__name__)
+
+# Mã thoát của worker khi lifespan startup lỗi (cùng mã với CLI uvicorn)
+STARTUP_FAILURE = 3
+
+
+class Supervisor:
+    """Fork và giám sát các worker uvicorn dùng chung một listening socket."""
+
+    POLL_INTERVAL = 0.2
+    # Thời gian chờ thêm sau graceful timeout của uvicorn để lifespan shutdown kịp chạy xong
+    KILL_GRACE_SECONDS = 5
+
+    def __init__(self, config: uvicorn.Config, workers: int):
+        self.config = config
+        self.workers = workers
+        self.exit_code = 0
+        self._socket: socket.socket | None = None
+        self._children: set[int] = set()
+        self._stopping = False
+        self._stop_signal: int | None = None
+        self._kill_deadline = float("inf")
+
+    def run(self) -> int:
+        self._socket = self.config.bind_socket()
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        logger.info(f"Master {os.getpid()} starting {self.workers} workers on {self.config.host}:{self.config.port}")
+
+        while True:
+            if self._stop_signal is not None and not self._stopping:
+                logger.info(f"Received {signal.Signals(self._stop_signal).name}, stopping workers")
+                self.stop()
+            self._reap()
+            if self._stopping:
+                if not self._children:
+                    break
+                if time.monotonic() > self._kill_deadline:
+                    self._signal_children(signal.SIGKILL)
+            else:
+                while len(self._children) < self.workers:
+                    self._spawn()
+            time.sleep(self.POLL_INTERVAL)
+
+        self._socket.close()
+        logger.info("Master stopped")
+        return self.exit_code
+
+    def stop(self):
+        if self._stopping:
+            return
+        self._stopping = True
+        graceful_timeout = self.config.timeout_graceful_shutdown or 0
+        self._kill_deadline = time.monotonic() + graceful_timeout + self.KILL_GRACE_SECONDS
+        self._signal_children(signal.SIGTERM)
+
+    def _handle_stop(self, signum, frame):
+        # Chỉ ghi nhận; vòng lặp chính xử lý (tránh gọi logging bên trong signal handler)
+        self._stop_signal = signum
+
+    def _signal_children(self, signum: int):
+        for pid in self._children:
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def _spawn(self):
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                code = self._serve()
+            except BaseException:
+                logger.exception("Worker crashed")
+            finally:
+                # Không chạy lại atexit/finally của master trong process con
+                os._exit(code)
+        self._children.add(pid)
+
+    def _serve(self) -> int:
+        # uvicorn tự cài handler SIGTERM/SIGINT (tắt êm) khi chạy
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+        max_requests = settings.SERVER_MAX_REQUESTS
+        if max_requests:
+            # random được seed lại sau fork nên mỗi worker có jitter khác nhau
+            self.config.limit_max_requests = max_requests + random.randint(0, settings.SERVER_MAX_REQUESTS_JITTER)
+
+        server = uvicorn.Server(self.config)
+        server.run(sockets=[self._socket])
+        return 0 if server.started else STARTUP_FAILURE
+
+    def _reap(self):
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._children.clear()
+                return
+            if pid == 0:
+                return
+            self._children.discard(pid)
+            code = os.waitstatus_to_exitcode(status)
+            if self._stopping:
+                continue
+            if code == STARTUP_FAILURE:
+                logger.error(f"Worker {pid} failed to boot, shutting down")
+                self.exit_code = STARTUP_FAILURE
+                self.stop()
+            elif code != 0:
+                logger.warning(f"Worker {pid} exited with code {code}, restarting")
+            else:
+                logger.info(f"Worker {pid} recycled after max requests")
+
+
+def main() -> int:
+    cpus = available_cpus()
+    workers = settings.SERVER_WORKERS or cpus
+    if settings.PASSWORD_HASH_WORKERS is None:
+        # Mỗi worker có pool hash riêng: chia số core để tổng số process hash không vượt số core
+        settings.PASSWORD_HASH_WORKERS = max(1, cpus // workers)
+
+    # Preload trước khi fork; import ở đây để cấu hình ở trên có hiệu lực khi app khởi tạo singleton
+    from src.main import app
+
+    # Đưa object lúc import ra khỏi GC, tránh GC chạm vào làm hỏng chia sẻ copy-on-write sau fork
+    gc.collect()
+    gc.freeze()
+
+    config = uvicorn.Config(
+        app,
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        loop="uvloop",
+        http="httptools",
+        lifespan="on",
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT,
+    )
+    return Supervisor(config, workers).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
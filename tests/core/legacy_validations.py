@@ -0,0 +1,65 @@
+"""
+Bản gốc (mỗi rule một lần `re.search`) của is_safe_input, is_code và validate_password, giữ
+nguyên để kiểm tra tương đương và làm mốc cho benchmark của RuleSet.
+"""
+import re
+
+from src.core.utils.validations.base_validation import is_empty, is_too_short
+
+
+def is_safe_input(text: str) -> bool:
+    if not text:
+        return True
+
+    patterns = [
+        r"<script\b[^>]*>",  # XSS
+        r"onerror\s*=",
+        r"onload\s*=",
+        r"(SELECT|INSERT|DELETE|UPDATE|DROP|UNION|FROM|WHERE)\b",  # SQL
+        r"--",  # SQL comment
+        r";",  # SQL statement separator
+    ]
+
+    return not any(re.search(p, text, re.IGNORECASE) for p in patterns)
+
+
+def is_code(text: str) -> bool:
+    trimmed = text.strip()
+
+    # HTML / Script tags
+    if re.search(r"[<>]", trimmed) or re.search(r"<script\b[^>]*>.*?</script>", trimmed, re.IGNORECASE):
+        return True
+
+    # JavaScript keywords
+    js_pattern = r"\b(if|else|function|while|for|return|var|let|const|=>|true|false|null|undefined)\b"
+    if re.search(js_pattern, trimmed):
+        return True
+
+    # Code characters
+    if re.search(r"[{}();=\[\]]", trimmed):
+        return True
+
+    # SQL keywords
+    sql_pattern = r"\b(SELECT|INSERT|UPDATE|DELETE|DROP|FROM|WHERE|TABLE|VALUES)\b"
+    return bool(re.search(sql_pattern, trimmed, re.IGNORECASE))
+
+
+def validate_password(password: str) -> str | None:
+    password = password.strip()
+
+    if is_empty(password):
+        return "Vui lòng nhập mật khẩu của bạn"
+    if is_too_short(password, 8):
+        return "Mật khẩu phải có ít nhất 8 ký tự"
+    if not re.search(r"[A-Z]", password):
+        return "Mật khẩu phải chứa ít nhất 1 chữ cái in hoa"
+    if not re.search(r"[a-z]", password):
+        return "Mật khẩu phải chứa ít nhất 1 chữ cái thường"
+    if not re.search(r"[0-9]", password):
+        return "Mật khẩu phải chứa ít nhất 1 chữ số"
+    if not re.search(r"[\W_]", password):
+        return "Mật khẩu phải chứa ít nhất 1 ký tự đặc biệt"
+    if not is_safe_input(password):
+        return "Mật khẩu chứa ký tự không an toàn"
+
+    return None
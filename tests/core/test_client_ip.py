@@ -0,0 +1,58 @@
+import ipaddress
+
+import pytest
+
+from src.core.utils import client_ip
+from src.core.utils.token_bucket import TokenBucket
+
+
+def build_scope(peer: str, *forwarded_for: str) -> dict:
+    headers = [(b"x-forwarded-for", value.encode()) for value in forwarded_for]
+    return {"type": "http", "client": (peer, 5000), "headers": headers}
+
+
+@pytest.fixture
+def trusted_proxies(monkeypatch):
+    networks = tuple(ipaddress.ip_network(cidr) for cidr in ("10.0.0.0/8", "172.16.0.1/32"))
+    monkeypatch.setattr(client_ip, "_TRUSTED_NETWORKS", networks)
+    client_ip.is_trusted_proxy.cache_clear()
+    yield
+    client_ip.is_trusted_proxy.cache_clear()
+
+
+class TestClientIp:
+    def test_forwarded_for_is_ignored_without_trusted_proxies(self, monkeypatch):
+        monkeypatch.setattr(client_ip, "_TRUSTED_NETWORKS", ())
+
+        scope = build_scope("203.0.113.9", "1.2.3.4")
+
+        assert client_ip.client_ip_from_scope(scope) == "203.0.113.9"
+
+    def test_forwarded_for_is_ignored_from_untrusted_peer(self, trusted_proxies):
+        scope = build_scope("203.0.113.9", "1.2.3.4")
+
+        assert client_ip.client_ip_from_scope(scope) == "203.0.113.9"
+
+    def test_rightmost_untrusted_hop_is_the_client(self, trusted_proxies):
+        # Client tự thêm "6.6.6.6" để giả mạo; proxy nối IP thật 198.51.100.7
+        scope = build_scope("10.0.0.2", "6.6.6.6, 198.51.100.7", "172.16.0.1")
+
+        assert client_ip.client_ip_from_scope(scope) == "198.51.100.7"
+
+    def test_peer_is_used_when_header_missing(self, trusted_proxies):
+        assert client_ip.client_ip_from_scope(build_scope("10.0.0.2")) == "10.0.0.2"
+
+
+class TestTokenBucket:
+    def test_bucket_refills_over_time(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0])
+
+        assert bucket.consume()
+        assert bucket.consume()
+        assert not bucket.consume()
+        assert bucket.retry_after() == pytest.approx(0.5)
+
+        now[0] = 0.5
+        assert bucket.consume()
+        assert not bucket.consume()
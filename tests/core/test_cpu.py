@@ -0,0 +1,27 @@
+from src.core.utils.cpu import available_cpus, cgroup_cpu_quota
+
+
+def test_cgroup_v2_quota(tmp_path):
+    (tmp_path / "cpu.max").write_text("150000 100000\n")
+    assert cgroup_cpu_quota(tmp_path) == 1.5
+    assert available_cpus(tmp_path) <= 2
+
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+    assert cgroup_cpu_quota(tmp_path) is None
+
+
+def test_cgroup_v1_quota(tmp_path):
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("50000\n")
+    assert cgroup_cpu_quota(tmp_path) == 0.5
+    # Quota dưới một core vẫn chạy ít nhất một worker
+    assert available_cpus(tmp_path) == 1
+
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("-1\n")
+    assert cgroup_cpu_quota(tmp_path) is None
+
+
+def test_without_cgroup_files(tmp_path):
+    assert cgroup_cpu_quota(tmp_path) is None
+    assert available_cpus(tmp_path) >= 1
@@ -0,0 +1,32 @@
+import pytest
+
+from fastapi.responses import JSONResponse
+
+from src.core.utils.json_codec import OrjsonCodec, StdlibJSONCodec, create_codec
+
+PAYLOAD = {
+    "status": 429,
+    "message": "Too Many Requests",
+    "errors": {"message": "Yêu cầu OTP quá nhiều lần, vui lòng thử lại sau."},
+    "data": {"id": 1, "name": "Nguyễn Văn Ấn", "avatar": None, "ratio": 0.5, "tags": ["đ", "ư"]},
+}
+
+
+@pytest.mark.parametrize("codec", [StdlibJSONCodec(), OrjsonCodec()], ids=lambda codec: codec.name)
+def test_codec_matches_json_response_bytes(codec):
+    # Cùng output với JSONResponse mặc định của Starlette, kể cả tiếng Việt có dấu
+    assert codec.dumps(PAYLOAD) == JSONResponse(PAYLOAD).body
+    assert codec.loads(codec.dumps(PAYLOAD)) == PAYLOAD
+    assert codec.loads(codec.dumps(PAYLOAD).decode()) == PAYLOAD
+
+
+@pytest.mark.parametrize("codec", [StdlibJSONCodec(), OrjsonCodec()], ids=lambda codec: codec.name)
+def test_codec_decode_errors_are_value_errors(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_create_codec_rejects_unknown_name():
+    assert create_codec("json").name == "json"
+    with pytest.raises(ValueError):
+        create_codec("yaml")
@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+from unittest.mock import AsyncMock
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.core.exceptions import TooManyRequestsError
+from src.core.limiter import RouteRateLimiter
+from src.presentation.api.error_handlers import register_error_handlers
+
+
+def build_client(redis_service) -> TestClient:
+    limiter = RouteRateLimiter(key_func=lambda request: "203.0.113.7", redis_service=redis_service)
+    app = FastAPI()
+    register_error_handlers(app)
+
+    @app.post("/otp")
+    @limiter.limit("2/minute")
+    async def otp(request: Request):
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_redis_decision_is_applied():
+    redis_service = AsyncMock()
+    # {được phép, số lần còn lại, ms tới khi có thêm quota} như script sliding_window_hit
+    redis_service.eval_script = AsyncMock(side_effect=[[1, 1, 0], [0, 0, 30000]])
+    client = build_client(redis_service)
+
+    assert client.post("/otp").status_code == 200
+
+    response = client.post("/otp")
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "30"
+    assert response.json()["errors"] == {"message": TooManyRequestsError.error}
+
+    key = redis_service.eval_script.await_args.kwargs["keys"][0]
+    assert key.startswith("rate_limit:") and key.endswith("otp:203.0.113.7")
+
+
+def test_falls_back_to_memory_when_redis_is_down():
+    redis_service = AsyncMock()
+    redis_service.eval_script = AsyncMock(side_effect=ConnectionError("redis down"))
+    client = build_client(redis_service)
+
+    assert [client.post("/otp").status_code for _ in range(2)] == [200, 200]
+
+    response = client.post("/otp")
+    assert response.status_code == 429
+    assert 0 < int(response.headers["retry-after"]) <= 60
+
+
+def test_slow_redis_does_not_stall_requests(monkeypatch):
+    monkeypatch.setattr("src.core.limiter.settings.RATE_LIMIT_REDIS_TIMEOUT", 0.05)
+
+    async def slow_eval(*args, **kwargs):
+        await asyncio.sleep(5)
+
+    redis_service = AsyncMock()
+    redis_service.eval_script = AsyncMock(side_effect=slow_eval)
+    client = build_client(redis_service)
+
+    started = time.monotonic()
+    assert client.post("/otp").status_code == 200
+    assert time.monotonic() - started < 1
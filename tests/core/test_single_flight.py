@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from src.core.utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    async def test_errors_are_shared_with_waiting_callers(self):
+        single_flight = SingleFlight("test")
+        calls = 0
+
+        async def fail():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            single_flight.do("key", fail), single_flight.do("key", fail), return_exceptions=True
+        )
+
+        assert calls == 1
+        assert all(isinstance(result, ValueError) for result in results)
+
+    async def test_waiter_retries_when_leader_is_cancelled(self):
+        single_flight = SingleFlight("test")
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.create_task(single_flight.do("key", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight.do("key", slow))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "done"
+        assert not single_flight.in_flight("key")
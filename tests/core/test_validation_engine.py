@@ -0,0 +1,74 @@
+import random
+import re
+
+import pytest
+
+from src.core.utils.validations.auth_validations import validate_password
+from src.core.utils.validations.base_validation import is_code
+from src.core.utils.validations.engine import Rule, RuleSet
+from src.core.utils.validations.security_validation import is_safe_input
+from tests.core import legacy_validations as legacy
+
+# Các mảnh ghép để sinh input: ký tự từng lớp và các mẫu mà rule tìm kiếm (kể cả biến thể hoa/thường)
+FRAGMENTS = [
+    "A", "z", "7", "_", " ", "!", "é", "Đ", "\t", "\n",
+    "<", ">", "<script>", "<SCRIPT src=x>", "</script>", "onerror =", "ONLOAD=", "onload",
+    "select", "Select ", "union", "fromage", "where_", "TABLE", "values",
+    "--", "-", ";", "=>", "=", "{", "}", "(", ")", "[", "]",
+    "if", "else", "iffy", "return", "null", "undefinedx", "const ", "true",
+    # Ký tự Unicode mà re.IGNORECASE coi là cùng chữ (ſ ~ s, K ~ k, İ ~ i)
+    "ſelect", "\u212a", "İnsert", "ıf",
+]
+
+EXAMPLES = [
+    "", " ", "Secret#123", "secret#123", "SECRET#123", "Secret#abc", "Secret1234", "Secret_123",
+    "Secret;123A", "P@ss--word1", "Passw0rd <script>", "DropTable#1", "Dropped#1", "x onerror= y",
+    "Nguyễn Văn An", "an@example.com", "select * from users", "if (x) { return }", "a => b",
+]
+
+
+def random_inputs(count: int, seed: int = 2024) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 12)))
+        for _ in range(count)
+    ]
+
+
+CORPUS = EXAMPLES + random_inputs(5000)
+
+
+@pytest.mark.parametrize(
+    "current, reference",
+    [
+        (is_safe_input, legacy.is_safe_input),
+        (is_code, legacy.is_code),
+        (validate_password, legacy.validate_password),
+    ],
+)
+def test_matches_legacy_validators(current, reference):
+    mismatches = [text for text in CORPUS if current(text) != reference(text)]
+    assert mismatches == []
+
+
+def test_reports_first_violated_rule_in_declaration_order():
+    rules = RuleSet([
+        Rule("letter", r"[a-zA-Z]", required=True),
+        Rule("lower", r"[a-z]", required=True),
+        Rule("no-ab", r"ab"),
+        Rule("no-b", r"(b)\b"),
+        Rule("digit", r"\d", required=True),
+    ])
+
+    assert rules.check("") == "letter"
+    # "[a-z]" luôn bị "ab"/"[a-zA-Z]" che ở cùng vị trí nhưng vẫn được xác nhận là có mặt
+    assert rules.check("Xa1") is None
+    assert rules.check("XAB1") == "lower"
+    assert rules.check("xb") == "no-b"
+    assert rules.check("xab") == "no-ab"
+    assert rules.check("xx") == "digit"
+
+
+def test_rejects_unsupported_flags():
+    with pytest.raises(ValueError):
+        RuleSet([Rule("verbose", r"a b", re.VERBOSE)])
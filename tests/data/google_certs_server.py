@@ -0,0 +1,72 @@
+import json
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import rsa
+
+from google.auth import crypt, jwt
+
+
+class GoogleCertsServer:
+    """
+    Máy chủ key giả lập https://www.googleapis.com/oauth2/v1/certs chạy trên localhost cho test:
+    trả về {kid: PEM} kèm Cache-Control max-age, và ký được ID token bằng các key đó.
+    """
+
+    def __init__(self, max_age: int = 3600, key_bits: int = 1024):
+        self.max_age = max_age
+        self.key_bits = key_bits
+        self.requests = 0
+        self._keys: dict[str, rsa.PrivateKey] = {}
+        self._public: dict[str, str] = {}
+        self._server: ThreadingHTTPServer | None = None
+        self.add_key("key-1")
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/oauth2/v1/certs"
+
+    def add_key(self, kid: str):
+        public_key, private_key = rsa.newkeys(self.key_bits)
+        self._keys[kid] = private_key
+        self._public[kid] = public_key.save_pkcs1().decode()
+
+    def sign(self, kid: str = "key-1", **claims) -> str:
+        now = int(time.time())
+        payload = {
+            "iss": "https://accounts.google.com",
+            "iat": now,
+            "exp": now + 3600,
+            "email": "user@example.com",
+            **claims,
+        }
+        signer = crypt.RSASigner.from_string(self._keys[kid].save_pkcs1().decode(), key_id=kid)
+        return jwt.encode(signer, payload).decode()
+
+    def __enter__(self) -> "GoogleCertsServer":
+        owner = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                owner.requests += 1
+                body = json.dumps(owner._public).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Cache-Control", f"public, max-age={owner.max_age}, must-revalidate")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,136 @@
+"""
+Bản Python của các Lua script trong lua_scripts, chạy trên một Redis giả trong bộ nhớ có đồng hồ
+điều khiển được, để test hành vi của script (refill, cửa sổ trượt,...) mà không cần Redis thật.
+
+Mỗi mirror ghi kèm SHA1 của mã Lua mà nó mô phỏng; `assert_mirrors_script` so với script đã
+đăng ký, nên sửa Lua mà quên sửa mirror sẽ làm test đỏ.
+"""
+import math
+from typing import Callable, Sequence
+
+from src.data.cache.lua_scripts import lua_scripts
+
+_MIRRORS: dict[str, tuple[str, Callable]] = {}
+
+
+def mirror(name: str, sha: str):
+    def decorator(func: Callable) -> Callable:
+        _MIRRORS[name] = (sha, func)
+        return func
+    return decorator
+
+
+def assert_mirrors_script(name: str):
+    sha, _ = _MIRRORS[name]
+    assert lua_scripts.get(name).sha == sha, f"Lua script '{name}' changed, update its mirror in {__name__}"
+
+
+def lua_number(value: float) -> str:
+    # Số Lua truyền vào redis.call được đổi sang chuỗi theo định dạng "%.14g"
+    return "%.14g" % value
+
+
+class FakeRedis:
+    """Hash, ZSET và TTL (theo đồng hồ giả, đơn vị ms) — đủ cho các script đang mô phỏng."""
+
+    def __init__(self, now_ms: int = 1_700_000_000_000):
+        self.now_ms = now_ms
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self._expire_at: dict[str, int] = {}
+
+    def advance(self, ms: int):
+        self.now_ms += ms
+        for key in [key for key, expire_at in self._expire_at.items() if expire_at <= self.now_ms]:
+            self.delete(key)
+
+    def time(self) -> tuple[int, int]:
+        """Giống lệnh TIME: (giây, micro giây)."""
+        return self.now_ms // 1000, self.now_ms % 1000 * 1000
+
+    def pexpire(self, key: str, ms: int):
+        if key in self.hashes or key in self.zsets:
+            self._expire_at[key] = self.now_ms + ms
+
+    def delete(self, key: str):
+        self.hashes.pop(key, None)
+        self.zsets.pop(key, None)
+        self._expire_at.pop(key, None)
+
+
+class ScriptedRedisService:
+    """Thay RedisService: `eval_script` chạy mirror của script trên FakeRedis."""
+
+    def __init__(self, redis: FakeRedis | None = None):
+        self.redis = redis or FakeRedis()
+
+    async def eval_script(self, name: str, keys: Sequence[str] = (), args: Sequence = ()):
+        _, func = _MIRRORS[name]
+        # Tham số gửi lên Redis luôn là chuỗi
+        return func(self.redis, list(keys), [str(arg) for arg in args])
+
+    async def delete(self, key: str):
+        self.redis.delete(key)
+
+
+def _now_ms(redis: FakeRedis) -> int:
+    seconds, microseconds = redis.time()
+    return seconds * 1000 + math.floor(microseconds / 1000)
+
+
+@mirror("mail_quota_take", sha="ec4e5760ca63c66790328a56f07a51e3a859d285")
+def mail_quota_take(redis: FakeRedis, keys: list[str], args: list[str]) -> int:
+    now_ms = _now_ms(redis)
+    rate = float(args[0]) / 1000
+    capacity = float(args[1])
+
+    state = redis.hashes.get(keys[0], {})
+    tokens = float(state["tokens"]) if "tokens" in state else capacity
+    updated_at = float(state["updated_at"]) if "updated_at" in state else now_ms
+    tokens = min(capacity, tokens + max(0, now_ms - updated_at) * rate)
+
+    wait_ms = 0
+    if tokens >= 1:
+        tokens = tokens - 1
+    else:
+        wait_ms = math.ceil((1 - tokens) / rate)
+    redis.hashes.setdefault(keys[0], {}).update(tokens=lua_number(tokens), updated_at=lua_number(now_ms))
+    redis.pexpire(keys[0], math.ceil(capacity / rate) + 1000)
+    return wait_ms
+
+
+@mirror("mail_quota_refund", sha="f9176213c53df21472653d68bae64f7a7ec7f29b")
+def mail_quota_refund(redis: FakeRedis, keys: list[str], args: list[str]) -> int:
+    tokens = redis.hashes.get(keys[0], {}).get("tokens")
+    if tokens is not None:
+        redis.hashes[keys[0]]["tokens"] = lua_number(min(float(args[0]), float(tokens) + 1))
+    return 1
+
+
+@mirror("sliding_window_hit", sha="7c80b6189f2a81c29242673022455aa60e79e990")
+def sliding_window_hit(redis: FakeRedis, keys: list[str], args: list[str]) -> list[int]:
+    key = keys[0]
+    limit = int(args[0])
+    window_ms = int(args[1])
+    now = _now_ms(redis)
+
+    zset = redis.zsets.setdefault(key, {})
+    for member in [member for member, score in zset.items() if score <= now - window_ms]:
+        del zset[member]
+    count = len(zset)
+
+    allowed = 0
+    if count < limit:
+        zset[args[2]] = now
+        count += 1
+        allowed = 1
+    if not zset:
+        # Redis không giữ ZSET rỗng
+        del redis.zsets[key]
+    redis.pexpire(key, window_ms)
+
+    reset_ms = 0
+    if count >= limit:
+        oldest = min(zset.values())
+        reset_ms = oldest + window_ms - now
+    return [allowed, limit - count, reset_ms]
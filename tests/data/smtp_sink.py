@@ -0,0 +1,92 @@
+import asyncio
+
+
+class SMTPSink:
+    """
+    SMTP server tối giản chạy trên localhost cho test/benchmark: nhận mọi email (AUTH luôn
+    thành công, không TLS) và lưu lại để kiểm tra. Đếm số kết nối để đo việc dùng lại kết nối.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, handshake_delay: float = 0):
+        self.host = host
+        self.port = port
+        # Mô phỏng độ trễ bắt tay (chào + AUTH) của server thật
+        self.handshake_delay = handshake_delay
+        self.messages: list[bytes] = []
+        self.connections = 0
+        self._server: asyncio.AbstractServer | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    async def __aenter__(self) -> "SMTPSink":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.drop_connections()
+        self._server.close()
+        await self._server.wait_closed()
+
+    def drop_connections(self):
+        """Đóng mọi kết nối đang mở từ phía server (mô phỏng server timeout/restart)."""
+        for writer in list(self._writers):
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        self._writers.add(writer)
+
+        async def reply(line: str):
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        try:
+            await asyncio.sleep(self.handshake_delay)
+            await reply("220 sink ESMTP")
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode().strip()
+                verb = command.split(" ", 1)[0].upper()
+
+                if verb == "EHLO":
+                    writer.write(b"250-sink\r\n250-AUTH PLAIN LOGIN\r\n250 8BITMIME\r\n")
+                    await writer.drain()
+                elif verb == "HELO":
+                    await reply("250 sink")
+                elif verb == "AUTH":
+                    await asyncio.sleep(self.handshake_delay)
+                    if command.upper().startswith("AUTH LOGIN"):
+                        await reply("334 VXNlcm5hbWU6")
+                        await reader.readline()
+                        await reply("334 UGFzc3dvcmQ6")
+                        await reader.readline()
+                    await reply("235 Authentication successful")
+                elif verb == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    body = bytearray()
+                    while True:
+                        data_line = await reader.readline()
+                        if data_line in (b".\r\n", b".\n", b""):
+                            break
+                        body += data_line
+                    self.messages.append(bytes(body))
+                    await reply("250 OK")
+                elif verb == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    # MAIL, RCPT, NOOP, RSET,...
+                    await reply("250 OK")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
@@ -0,0 +1,30 @@
+import time
+
+from src.data.cache.access_token_cache import AccessTokenCache
+from src.domain.entities import AuthPrincipal
+
+PRINCIPAL = AuthPrincipal(id=1, signin_count=1, sign_out_count=0, refresh_jti="jti")
+
+
+class TestAccessTokenCache:
+    def test_hit_returns_cached_principal(self):
+        cache = AccessTokenCache(maxsize=8)
+        cache.put("token", PRINCIPAL, time.time() + 60)
+
+        assert cache.get("token") == PRINCIPAL
+        assert cache.get("other-token") is None
+
+    def test_entry_past_exp_is_not_served(self):
+        cache = AccessTokenCache(maxsize=8)
+        cache.put("token", PRINCIPAL, time.time() - 1)
+
+        assert cache.get("token") is None
+
+    def test_cached_token_stops_hitting_at_exp(self):
+        cache = AccessTokenCache(maxsize=8)
+        cache.put("token", PRINCIPAL, time.time() + 0.05)
+        assert cache.get("token") == PRINCIPAL
+
+        time.sleep(0.1)
+
+        assert cache.get("token") is None
@@ -0,0 +1,29 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from src.data.cache.auth_epoch_cache import AuthEpochCache
+from src.domain.entities import AuthEpoch
+
+EPOCH = AuthEpoch(user_id=1, signin_count=3, sign_out_count=2)
+
+
+@pytest.mark.asyncio
+class TestAuthEpochCache:
+    async def test_failed_write_drops_stale_epoch(self):
+        redis_service = AsyncMock()
+        redis_service.eval_script = AsyncMock(side_effect=ConnectionError("timeout"))
+        cache = AuthEpochCache(redis_service)
+
+        await cache.put(EPOCH)
+
+        redis_service.delete.assert_awaited_once_with("auth_epoch:1")
+
+    async def test_failed_cleanup_is_swallowed(self):
+        redis_service = AsyncMock()
+        redis_service.eval_script = AsyncMock(side_effect=ConnectionError("down"))
+        redis_service.delete = AsyncMock(side_effect=ConnectionError("down"))
+        cache = AuthEpochCache(redis_service)
+
+        await cache.put(EPOCH)
+
+        redis_service.delete.assert_awaited_once()
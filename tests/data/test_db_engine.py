@@ -0,0 +1,86 @@
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from src.core.metrics import metrics
+from src.data.db.pool import InstrumentedAsyncQueuePool
+from src.data.db.session import build_database_url, build_engine
+
+
+def connect_params(engine) -> dict:
+    """Tham số mà engine sẽ truyền cho asyncpg.connect, lấy qua event do_connect (không mở kết nối thật)."""
+    captured = {}
+
+    @event.listens_for(engine.sync_engine, "do_connect")
+    def capture(dialect, connection_record, cargs, cparams):
+        captured.update(cparams)
+        return MagicMock()
+
+    engine.sync_engine.pool._creator(MagicMock())
+    return captured
+
+
+@pytest.fixture
+def db_settings(monkeypatch):
+    def apply(**overrides):
+        for name, value in overrides.items():
+            monkeypatch.setattr(f"src.data.db.session.settings.{name}", value)
+    return apply
+
+
+class TestBuildEngine:
+    def test_pool_options_follow_settings(self, db_settings):
+        db_settings(DB_POOL_SIZE=7, DB_MAX_OVERFLOW=3, DB_POOL_TIMEOUT=2.5, DB_POOL_RECYCLE=600,
+                    DB_POOL_PRE_PING=False, DB_STATEMENT_CACHE_SIZE=50, DB_PGBOUNCER_TRANSACTION_MODE=False)
+
+        engine = build_engine(build_database_url("db.internal", 5432), name="replica")
+        pool = engine.sync_engine.pool
+
+        assert isinstance(pool, InstrumentedAsyncQueuePool)
+        assert (pool.size(), pool._max_overflow, pool._timeout, pool._recycle, pool._pre_ping) == (7, 3, 2.5, 600, False)
+        assert pool._orig_logging_name == "replica"
+
+        params = connect_params(engine)
+        assert params["statement_cache_size"] == 50
+        assert params["prepared_statement_cache_size"] == 50
+        assert "prepared_statement_name_func" not in params
+
+    def test_pgbouncer_mode_disables_named_statement_caching(self, db_settings):
+        db_settings(DB_PGBOUNCER_TRANSACTION_MODE=True, DB_STATEMENT_CACHE_SIZE=50)
+
+        params = connect_params(build_engine(build_database_url("pgbouncer", 6432)))
+
+        assert params["statement_cache_size"] == 0
+        assert params["prepared_statement_cache_size"] == 0
+        name_func = params["prepared_statement_name_func"]
+        names = {name_func() for _ in range(100)}
+        assert len(names) == 100
+
+
+@pytest.mark.asyncio
+class TestInstrumentedAsyncQueuePool:
+    async def test_checkout_and_overflow_gauges_move(self):
+        pool = InstrumentedAsyncQueuePool(MagicMock, pool_size=1, max_overflow=1, timeout=0.01,
+                                          logging_name="pool_test")
+        checked_out = metrics.gauge("db.pool_test.checked_out")
+        saturation = metrics.gauge("db.pool_test.saturation")
+
+        first = await greenlet_spawn(pool.connect)
+        assert (checked_out.value, saturation.value) == (1, 0.5)
+
+        # Vượt pool_size → dùng kết nối overflow
+        second = await greenlet_spawn(pool.connect)
+        assert (checked_out.value, saturation.value) == (2, 1.0)
+        assert pool.overflow() == 1
+
+        timeouts = metrics.counter("db.pool_test.checkout_timeouts").value
+        with pytest.raises(PoolTimeoutError):
+            await greenlet_spawn(pool.connect)
+        assert metrics.counter("db.pool_test.checkout_timeouts").value == timeouts + 1
+
+        await greenlet_spawn(second.close)
+        await greenlet_spawn(first.close)
+        assert (checked_out.value, saturation.value) == (0, 0)
+        assert metrics.timer("db.pool_test.checkout_wait").count == 3
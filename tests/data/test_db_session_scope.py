@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.data.db.session import AsyncScopedSession, db_session_scope
+from src.data.models import UserModel
+from src.data.repositories import UserRepositoryImpl
+
+
+@pytest.mark.asyncio
+class TestDbSessionScope:
+    async def test_parallel_scopes_get_distinct_sessions(self):
+        async def request_scope():
+            async with db_session_scope():
+                session = AsyncScopedSession()
+                await asyncio.sleep(0)
+                assert AsyncScopedSession() is session
+                return session
+
+        first, second = await asyncio.gather(request_scope(), request_scope())
+
+        assert first is not second
+
+    async def test_parallel_signins_do_not_share_pending_state(self):
+        repository = UserRepositoryImpl(db=AsyncScopedSession)
+
+        async def signin(email: str):
+            async with db_session_scope():
+                user = UserModel(name="Tester", email=email)
+                repository.db.add(user)
+                await asyncio.sleep(0)
+                return set(AsyncScopedSession().new), user
+
+        (pending_a, user_a), (pending_b, user_b) = await asyncio.gather(
+            signin("a@example.com"), signin("b@example.com")
+        )
+
+        assert pending_a == {user_a}
+        assert pending_b == {user_b}
+
+    async def test_session_is_created_lazily(self):
+        async with db_session_scope():
+            assert not AsyncScopedSession.registry.has()
+
+    async def test_session_is_closed_when_scope_ends(self):
+        with patch.object(AsyncSession, "close", new=AsyncMock()) as close:
+            async with db_session_scope():
+                AsyncScopedSession()
+                assert AsyncScopedSession.registry.has()
+
+            close.assert_awaited_once()
+            assert not AsyncScopedSession.registry.has()
@@ -0,0 +1,46 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.data.cache.email_bloom_filter import EmailBloomFilter
+from src.data.models import UserModel
+from src.data.repositories import UserRepositoryImpl
+
+
+class TestEmailBloomFilter:
+    def test_false_positive_rate_stays_near_target(self):
+        bloom = EmailBloomFilter(engine=None, redis_service=AsyncMock(), expected_items=5000, false_positive_rate=0.01)
+        bitmap = bytearray(bloom.bits)
+        for i in range(5000):
+            for position in bloom.positions(f"user{i}@example.com"):
+                bitmap[position] = 1
+
+        false_positives = sum(
+            all(bitmap[position] for position in bloom.positions(f"other{i}@example.com")) for i in range(20000)
+        )
+
+        assert false_positives / 20000 < 0.02
+
+
+@pytest.mark.asyncio
+class TestUserRepositoryEmailFilter:
+    async def test_negative_answer_skips_database(self):
+        db = AsyncMock()
+        email_filter = AsyncMock()
+        email_filter.might_exist = AsyncMock(return_value=False)
+        repository = UserRepositoryImpl(db=db, email_filter=email_filter)
+
+        assert await repository.get_user_by_email("nobody@example.com") is None
+        assert await repository.exists_by_email("nobody@example.com") is False
+        db.execute.assert_not_awaited()
+
+    async def test_changed_email_is_added_to_filter(self):
+        db = AsyncMock()
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = UserModel(id=1, name="A", email="new@example.com")
+        db.execute = AsyncMock(return_value=result)
+        email_filter = AsyncMock()
+        repository = UserRepositoryImpl(db=db, email_filter=email_filter)
+
+        await repository.update_user_by_id(1, {"email": "new@example.com"})
+
+        email_filter.add.assert_awaited_once_with("new@example.com")
@@ -0,0 +1,76 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.data.cache.google_certs import GoogleCertsCache, parse_max_age
+from src.data.services.google_token_verifier_impl import GoogleTokenVerifierImpl
+from src.domain.exceptions.auth_exception import TokenInvalidError
+from tests.data.google_certs_server import GoogleCertsServer
+
+CLIENT_ID = "client-id.apps.googleusercontent.com"
+
+
+def build_verifier(server: GoogleCertsServer) -> tuple[GoogleTokenVerifierImpl, AsyncMock]:
+    redis_service = AsyncMock()
+    redis_service.get_json = AsyncMock(return_value=None)
+    certs_cache = GoogleCertsCache(redis_service=redis_service, url=server.url)
+    return GoogleTokenVerifierImpl(certs_cache=certs_cache, client_id=CLIENT_ID), redis_service
+
+
+@pytest.fixture(scope="module")
+def key_server():
+    with GoogleCertsServer(max_age=19000) as server:
+        yield server
+
+
+def test_parse_max_age():
+    assert parse_max_age("public, max-age=19000, must-revalidate, no-transform") == 19000
+    assert parse_max_age("public, max-age=19000", age="1000") == 18000
+    assert parse_max_age("no-cache") is None
+
+
+@pytest.mark.asyncio
+class TestGoogleTokenVerifier:
+    async def test_keys_are_fetched_once_and_cached(self, key_server):
+        verifier, redis_service = build_verifier(key_server)
+        requests_before = key_server.requests
+
+        for _ in range(3):
+            idinfo = await verifier.verify(key_server.sign(aud=CLIENT_ID))
+            assert idinfo["email"] == "user@example.com"
+
+        assert key_server.requests - requests_before == 1
+        (key, data), kwargs = redis_service.set_json.call_args
+        assert key == GoogleCertsCache.REDIS_KEY
+        assert kwargs["expire_seconds"] == 19000
+        await verifier.certs_cache.stop()
+
+    async def test_keys_are_read_from_redis_before_google(self, key_server):
+        verifier, redis_service = build_verifier(key_server)
+        redis_service.get_json.return_value = {"certs": key_server._public, "expires_at": 2 ** 40}
+        requests_before = key_server.requests
+
+        await verifier.verify(key_server.sign(aud=CLIENT_ID))
+
+        assert key_server.requests == requests_before
+
+    async def test_rejects_wrong_audience_and_issuer(self, key_server):
+        verifier, _ = build_verifier(key_server)
+
+        with pytest.raises(TokenInvalidError):
+            await verifier.verify(key_server.sign(aud="another-client"))
+        with pytest.raises(TokenInvalidError):
+            await verifier.verify(key_server.sign(aud=CLIENT_ID, iss="https://evil.example.com"))
+        with pytest.raises(TokenInvalidError):
+            await verifier.verify("not-a-token")
+        await verifier.certs_cache.stop()
+
+    async def test_unknown_key_id_triggers_refresh(self, key_server):
+        verifier, _ = build_verifier(key_server)
+        await verifier.verify(key_server.sign(aud=CLIENT_ID))
+
+        key_server.add_key("key-2")
+        with patch.object(GoogleCertsCache, "MIN_FORCED_REFRESH_SECONDS", 0):
+            idinfo = await verifier.verify(key_server.sign("key-2", aud=CLIENT_ID))
+
+        assert idinfo["aud"] == CLIENT_ID
+        await verifier.certs_cache.stop()
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from src.core.exceptions import ServiceUnavailableError
+from src.data.hashing import HashAdmissionController, HashPriority
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def hold(controller: HashAdmissionController, priority: HashPriority,
+               release: asyncio.Event, order: list | None = None):
+    async with controller.slot(priority):
+        if order is not None:
+            order.append(priority)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+class TestHashAdmissionController:
+    async def test_full_queue_is_served_by_priority(self):
+        controller = HashAdmissionController(max_concurrent=1, max_queue=3, retry_after=7)
+        release, order = asyncio.Event(), []
+        holder = asyncio.create_task(hold(controller, HashPriority.SIGNIN, asyncio.Event()))
+        await settle()
+
+        waiters = [
+            asyncio.create_task(hold(controller, priority, release, order))
+            for priority in (HashPriority.SIGNUP, HashPriority.PASSWORD_RESET, HashPriority.SIGNIN)
+        ]
+        await settle()
+        release.set()
+        holder.cancel()
+        await asyncio.gather(*waiters)
+
+        assert order == [HashPriority.SIGNIN, HashPriority.PASSWORD_RESET, HashPriority.SIGNUP]
+
+    async def test_higher_priority_job_evicts_lowest_priority_waiter(self):
+        controller = HashAdmissionController(max_concurrent=1, max_queue=1, retry_after=7)
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(controller, HashPriority.SIGNIN, release))
+        await settle()
+
+        signup = asyncio.create_task(hold(controller, HashPriority.SIGNUP, release))
+        await settle()
+        signin = asyncio.create_task(hold(controller, HashPriority.SIGNIN, release))
+        await settle()
+
+        with pytest.raises(ServiceUnavailableError):
+            await signup
+        release.set()
+        await asyncio.gather(holder, signin)
+        assert controller._active == 0
+
+    async def test_rejects_with_retry_after_when_queue_is_full(self):
+        controller = HashAdmissionController(max_concurrent=1, max_queue=1, retry_after=7)
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(hold(controller, HashPriority.SIGNIN, release)) for _ in range(2)]
+        await settle()
+
+        with pytest.raises(ServiceUnavailableError) as exc_info:
+            async with controller.slot(HashPriority.SIGNIN):
+                pass
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "7"}
+        release.set()
+        await asyncio.gather(*tasks)
+
+    async def test_cancelled_jobs_release_their_slot(self):
+        controller = HashAdmissionController(max_concurrent=1, max_queue=2, retry_after=7)
+        holder = asyncio.create_task(hold(controller, HashPriority.SIGNIN, asyncio.Event()))
+        await settle()
+        queued = asyncio.create_task(hold(controller, HashPriority.SIGNUP, asyncio.Event()))
+        await settle()
+
+        # Bị hủy khi đang chờ trong hàng đợi
+        queued.cancel()
+        await settle()
+        assert controller._waiters == []
+
+        # Bị hủy khi đang giữ slot
+        holder.cancel()
+        await settle()
+        assert controller._active == 0
+
+    async def test_slot_handed_over_to_a_cancelled_waiter_is_returned(self):
+        controller = HashAdmissionController(max_concurrent=1, max_queue=1, retry_after=7)
+        async with controller.slot(HashPriority.SIGNIN):
+            waiter = asyncio.create_task(hold(controller, HashPriority.SIGNIN, asyncio.Event()))
+            await settle()
+        # Slot vừa được chuyển cho waiter, waiter bị hủy trước khi kịp chạy
+        waiter.cancel()
+        await settle()
+
+        assert waiter.cancelled()
+        assert controller._active == 0
+        async with controller.slot(HashPriority.SIGNUP):
+            assert controller._active == 1
+
+    async def test_evicted_waiter_cancelled_before_waking_does_not_release(self):
+        controller = HashAdmissionController(max_concurrent=1, max_queue=1, retry_after=7)
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(controller, HashPriority.SIGNIN, release))
+        await settle()
+        signup = asyncio.create_task(hold(controller, HashPriority.SIGNUP, asyncio.Event()))
+        await settle()
+
+        # SIGNIN thứ hai đẩy SIGNUP ra; SIGNUP bị hủy trước khi kịp nhận lỗi 503
+        signin = asyncio.create_task(hold(controller, HashPriority.SIGNIN, release))
+        await asyncio.sleep(0)
+        signup.cancel()
+        await settle()
+
+        assert signup.cancelled()
+        assert controller._active == 1
+        assert len(controller._waiters) == 1
+        release.set()
+        await asyncio.gather(holder, signin)
+        assert controller._active == 0
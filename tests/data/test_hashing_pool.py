@@ -0,0 +1,68 @@
+import asyncio
+import os
+import signal
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.data.hashing import workers
+from src.data.hashing.hashing_pool import HashingPool
+
+
+def build_pool() -> HashingPool:
+    pool = HashingPool(max_workers=1)
+    # Profile argon2 nhẹ để test chạy nhanh
+    pool.profile = (1, 1024, 1)
+    return pool
+
+
+@pytest.mark.asyncio
+class TestHashingPool:
+    async def test_hash_and_verify_round_trip(self):
+        pool = build_pool()
+        try:
+            hashed = await pool.hash("Secret#123")
+
+            assert hashed.startswith("$argon2id$")
+            assert await pool.verify(hashed, "Secret#123") is True
+            assert await pool.verify(hashed, "wrong") is False
+        finally:
+            await pool.shutdown()
+
+    async def test_recovers_after_worker_is_killed(self):
+        pool = build_pool()
+        try:
+            hashed = await pool.hash("Secret#123")
+            broken = pool._executor
+            os.kill(next(iter(broken._processes)), signal.SIGKILL)
+
+            with pytest.raises(BrokenProcessPool):
+                await pool.verify(hashed, "Secret#123")
+
+            assert await pool.verify(hashed, "Secret#123") is True
+            assert pool._executor is not broken
+        finally:
+            await pool.shutdown()
+
+    async def test_late_failure_keeps_replacement_executor(self):
+        pool = build_pool()
+        job = Future()
+        broken = MagicMock()
+        broken.submit = MagicMock(return_value=job)
+        pool._executor = broken
+
+        task = asyncio.create_task(pool.run(workers.warm_up))
+        await asyncio.sleep(0)
+        # Request khác đã tạo executor mới trước khi job trên executor cũ báo lỗi
+        replacement = MagicMock()
+        pool._executor = replacement
+        job.set_exception(BrokenProcessPool())
+
+        with pytest.raises(BrokenProcessPool):
+            await task
+
+        assert pool._executor is replacement
+        broken.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        replacement.shutdown.assert_not_called()
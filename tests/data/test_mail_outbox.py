@@ -0,0 +1,188 @@
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.data.mail.outbox import MailOutbox
+from src.data.mail.send_scheduler import MailSendScheduler
+from src.domain.services import MailPriority
+from tests.data.lua_mirrors import ScriptedRedisService, assert_mirrors_script
+
+
+SECURITY_STREAM = MailOutbox.stream_name(MailPriority.SECURITY)
+BULK_STREAM = MailOutbox.stream_name(MailPriority.BULK)
+
+
+def build_outbox():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipeline = MagicMock()
+    pipeline.__aenter__ = AsyncMock(return_value=pipe)
+    pipeline.__aexit__ = AsyncMock(return_value=False)
+
+    redis_service = AsyncMock()
+    redis_service.pipeline = MagicMock(return_value=pipeline)
+    return MailOutbox(redis_service=redis_service, scheduler=AsyncMock()), redis_service, pipe
+
+
+def build_transporter(name: str = "default", sent: bool = True):
+    transporter = MagicMock()
+    transporter.name = name
+    transporter.rate_per_second = 10
+    transporter.burst = 10
+    transporter.send_mail = AsyncMock(return_value=sent)
+    return transporter
+
+
+def build_fields(attempt: int) -> dict:
+    return {"to": "a@example.com", "subject": "OTP", "html": "<b>1</b>", "attempt": str(attempt), "enqueued_at": "0"}
+
+
+@pytest.mark.asyncio
+class TestMailOutbox:
+    async def test_delivered_entry_is_acked_and_removed(self):
+        outbox, _, pipe = build_outbox()
+
+        await outbox._deliver(SECURITY_STREAM, "1-0", build_fields(0), build_transporter(sent=True))
+
+        pipe.xack.assert_called_once_with(SECURITY_STREAM, MailOutbox.GROUP, "1-0")
+        pipe.xdel.assert_called_once_with(SECURITY_STREAM, "1-0")
+        pipe.zadd.assert_not_called()
+
+    async def test_failed_entry_is_scheduled_with_exponential_backoff(self):
+        outbox, _, pipe = build_outbox()
+
+        with patch("src.data.mail.outbox.time.time", return_value=1000.0):
+            await outbox._deliver(SECURITY_STREAM, "1-0", build_fields(2), build_transporter(sent=False))
+
+        (key, mapping), _ = pipe.zadd.call_args
+        payload, due_at = next(iter(mapping.items()))
+        assert key == f"{SECURITY_STREAM}:retry"
+        assert due_at == 1000.0 + 2 * 2 ** 2
+        assert dict(zip(*[iter(json.loads(payload))] * 2))["attempt"] == "3"
+        pipe.xack.assert_called_once()
+
+    async def test_entry_is_dead_lettered_after_max_attempts(self):
+        outbox, _, pipe = build_outbox()
+
+        await outbox._deliver(SECURITY_STREAM, "1-0", build_fields(4), build_transporter(sent=False))
+
+        pipe.zadd.assert_not_called()
+        assert pipe.xadd.call_args.args[0] == MailOutbox.DEAD_LETTER_STREAM
+        pipe.xack.assert_called_once()
+
+    async def test_higher_priority_lane_is_read_first(self):
+        outbox, redis_service, _ = build_outbox()
+        backlog = {
+            SECURITY_STREAM: [(SECURITY_STREAM, "2-0", build_fields(0))],
+            BULK_STREAM: [(BULK_STREAM, "1-0", build_fields(0))],
+        }
+        redis_service.xreadgroup.side_effect = lambda group, consumer, streams, count, block_ms=None: backlog.get(streams[0], [])
+
+        entries = await outbox._next_entries("worker-0")
+
+        assert entries == backlog[SECURITY_STREAM]
+        redis_service.xreadgroup.assert_awaited_once()
+
+
+    async def test_worker_takes_quota_only_for_entries_in_hand(self):
+        outbox, _, _ = build_outbox()
+        entry = (SECURITY_STREAM, "1-0", build_fields(0))
+        outbox._next_entries = AsyncMock(side_effect=[[], [entry], [entry], asyncio.CancelledError()])
+        # Lần gửi đầu lỗi sau khi đã dùng token; lần sau phải lấy token mới
+        outbox._deliver = AsyncMock(side_effect=[RuntimeError("redis down"), None])
+        outbox.scheduler.acquire = AsyncMock(side_effect=[build_transporter("first"), build_transporter("second")])
+
+        # Lỗi thứ hai trong vòng lặp cũng dừng worker, tránh treo test nếu có hồi quy
+        with patch("src.data.mail.outbox.asyncio.sleep", new=AsyncMock(side_effect=[None, asyncio.CancelledError()])):
+            with pytest.raises(asyncio.CancelledError):
+                await outbox._worker("worker-0")
+
+        assert outbox.scheduler.acquire.await_count == 2
+        assert [call.args[3].name for call in outbox._deliver.await_args_list] == ["first", "second"]
+        outbox.scheduler.release.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestMailSendScheduler:
+    async def test_falls_over_to_account_with_quota(self):
+        primary, backup = build_transporter("primary"), build_transporter("backup")
+        redis_service = AsyncMock()
+        # primary hết quota (chờ 500ms), backup còn token
+        redis_service.eval_script.side_effect = lambda name, keys, args: 500 if keys == ["mail_quota:primary"] else 0
+        scheduler = MailSendScheduler(redis_service, [primary, backup])
+
+        assert await scheduler.acquire() is backup
+
+    async def test_waits_for_earliest_account_when_all_throttled(self):
+        transporter = build_transporter()
+        redis_service = AsyncMock()
+        redis_service.eval_script.side_effect = [200, 0]
+        scheduler = MailSendScheduler(redis_service, [transporter])
+
+        with patch("src.data.mail.send_scheduler.asyncio.sleep", new=AsyncMock()) as sleep:
+            assert await scheduler.acquire() is transporter
+
+        sleep.assert_awaited_once_with(0.2)
+
+
+@pytest.mark.asyncio
+class TestMailQuotaScripts:
+    """Token bucket mail_quota_take/mail_quota_refund, chạy qua mirror Python của Lua script."""
+
+    @staticmethod
+    def build_scheduler():
+        transporter = build_transporter()  # 10 token/giây, tối đa 10 token
+        redis_service = ScriptedRedisService()
+        return MailSendScheduler(redis_service, [transporter]), transporter, redis_service.redis
+
+    async def drain(self, scheduler, transporter, count: int):
+        assert [await scheduler._take(transporter) for _ in range(count)] == [0] * count
+
+    async def test_mirrors_match_registered_scripts(self):
+        assert_mirrors_script("mail_quota_take")
+        assert_mirrors_script("mail_quota_refund")
+
+    async def test_burst_then_refill_over_time(self):
+        scheduler, transporter, redis = self.build_scheduler()
+
+        await self.drain(scheduler, transporter, 10)
+        assert await scheduler._take(transporter) == 100
+
+        redis.advance(60)
+        assert await scheduler._take(transporter) == 40
+        redis.advance(40)
+        assert await scheduler._take(transporter) == 0
+
+    async def test_refill_is_capped_at_burst(self):
+        scheduler, transporter, redis = self.build_scheduler()
+        await self.drain(scheduler, transporter, 10)
+
+        # 1,5 giây đủ cho 15 token nhưng bucket chỉ giữ tối đa 10
+        redis.advance(1500)
+
+        await self.drain(scheduler, transporter, 10)
+        assert await scheduler._take(transporter) == 100
+
+    async def test_refund_is_capped_at_burst(self):
+        scheduler, transporter, _ = self.build_scheduler()
+        await self.drain(scheduler, transporter, 1)
+
+        await scheduler.release(transporter)
+        await scheduler.release(transporter)
+
+        await self.drain(scheduler, transporter, 10)
+        assert await scheduler._take(transporter) == 100
+
+    async def test_refund_after_refill_keeps_pending_refill(self):
+        scheduler, transporter, redis = self.build_scheduler()
+        await self.drain(scheduler, transporter, 10)
+
+        # Nửa token đang tích lũy (chưa ghi vào hash) + một token trả lại
+        redis.advance(50)
+        await scheduler.release(transporter)
+
+        assert await scheduler._take(transporter) == 0
+        assert float(redis.hashes["mail_quota:default"]["tokens"]) == pytest.approx(0.5)
+        assert await scheduler._take(transporter) == 50
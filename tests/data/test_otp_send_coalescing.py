@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.data.services.otp_service_impl import OTPServiceImpl
+
+
+def build_service(window_free: bool = True) -> tuple[OTPServiceImpl, AsyncMock]:
+    redis_service = AsyncMock()
+    redis_service.set_nx = AsyncMock(return_value=window_free)
+    return OTPServiceImpl(redis_service=redis_service), redis_service
+
+
+@pytest.mark.asyncio
+class TestOTPSendCoalescing:
+    async def test_concurrent_requests_share_one_send(self):
+        service, redis_service = build_service()
+        sends = 0
+
+        async def send():
+            nonlocal sends
+            sends += 1
+            await asyncio.sleep(0.01)
+
+        results = await asyncio.gather(*(service.coalesce_send("a@example.com", send, flow="resend") for _ in range(5)))
+
+        assert results == [True] * 5
+        assert sends == 1
+        redis_service.set_nx.assert_awaited_once()
+
+    async def test_request_inside_window_is_skipped(self):
+        service, _ = build_service(window_free=False)
+        send = AsyncMock()
+
+        assert await service.coalesce_send("a@example.com", send, flow="resend") is False
+        send.assert_not_awaited()
+
+    async def test_failed_send_reopens_window(self):
+        service, redis_service = build_service()
+        send = AsyncMock(side_effect=RuntimeError("smtp down"))
+
+        with pytest.raises(RuntimeError):
+            await service.coalesce_send("a@example.com", send, flow="resend")
+
+        key = redis_service.set_nx.await_args.args[0]
+        assert key.startswith("otp_send:resend:") and key.endswith(":a@example.com")
+        redis_service.delete.assert_awaited_once_with(key)
+
+    async def test_changed_payload_is_not_coalesced(self):
+        service, redis_service = build_service()
+        sends = []
+
+        async def signup(password: str):
+            async def send():
+                sends.append(password)
+                await asyncio.sleep(0.01)
+            return await service.coalesce_send("a@example.com", send, flow="signup", payload=f"An\0{password}")
+
+        # Gửi lại y hệt → gộp; sửa mật khẩu → vẫn gửi để dữ liệu mới được lưu
+        results = await asyncio.gather(signup("Secret#1"), signup("Secret#1"), signup("Secret#2"))
+
+        assert results == [True, True, True]
+        assert sorted(sends) == ["Secret#1", "Secret#2"]
+        keys = {call.args[0] for call in redis_service.set_nx.await_args_list}
+        assert len(keys) == 2
+        # Mật khẩu không xuất hiện trong tên key
+        assert not any("Secret" in key for key in keys)
+
+    async def test_flows_do_not_share_a_window(self):
+        service, redis_service = build_service()
+        send = AsyncMock()
+
+        await service.coalesce_send("a@example.com", send, flow="signup", payload="An\0Secret#1")
+        await service.coalesce_send("a@example.com", send, flow="forgot")
+
+        keys = [call.args[0] for call in redis_service.set_nx.await_args_list]
+        assert keys[0] != keys[1]
@@ -0,0 +1,63 @@
+import pytest
+
+from src.data.cache.rate_limiter import RateLimitResult, SlidingWindowRateLimiter
+from tests.data.lua_mirrors import ScriptedRedisService, assert_mirrors_script
+
+
+def build_limiter(limit: int = 3, window_seconds: int = 60):
+    redis_service = ScriptedRedisService()
+    return SlidingWindowRateLimiter("otp_rate", limit, window_seconds, redis_service=redis_service), redis_service.redis
+
+
+@pytest.mark.asyncio
+class TestSlidingWindowRateLimiter:
+    """sliding_window_hit chạy qua mirror Python của Lua script."""
+
+    async def test_mirror_matches_registered_script(self):
+        assert_mirrors_script("sliding_window_hit")
+
+    async def test_limit_hits_are_allowed_then_rejected_until_oldest_leaves_window(self):
+        limiter, redis = build_limiter()
+
+        results = []
+        for _ in range(3):
+            results.append(await limiter.hit("a@example.com"))
+            redis.advance(10_000)
+
+        assert results == [
+            RateLimitResult(allowed=True, remaining=2, reset_after=0),
+            RateLimitResult(allowed=True, remaining=1, reset_after=0),
+            # Lần thứ ba (t=20s) dùng hết quota: lần gọi đầu (t=0) rời cửa sổ sau 40 giây
+            RateLimitResult(allowed=True, remaining=0, reset_after=40),
+        ]
+        assert await limiter.hit("a@example.com") == RateLimitResult(allowed=False, remaining=0, reset_after=30)
+        # Lần bị từ chối không được tính vào cửa sổ
+        assert len(redis.zsets["otp_rate:a@example.com"]) == 3
+
+    async def test_window_slides_per_hit(self):
+        limiter, redis = build_limiter()
+        for _ in range(3):
+            await limiter.hit("a@example.com")
+            redis.advance(10_000)
+
+        # Lần gọi đầu rời cửa sổ đúng tại mốc 60 giây, hai lần sau vẫn còn
+        redis.advance(29_999)
+        assert (await limiter.hit("a@example.com")).allowed is False
+        redis.advance(1)
+        assert await limiter.hit("a@example.com") == RateLimitResult(allowed=True, remaining=0, reset_after=10)
+
+    async def test_recovers_fully_after_window(self):
+        limiter, redis = build_limiter()
+        for _ in range(4):
+            await limiter.hit("a@example.com")
+
+        redis.advance(60_000)
+
+        assert await limiter.hit("a@example.com") == RateLimitResult(allowed=True, remaining=2, reset_after=0)
+
+    async def test_identifiers_are_counted_separately(self):
+        limiter, _ = build_limiter(limit=1)
+
+        assert (await limiter.hit("a@example.com")).allowed is True
+        assert (await limiter.hit("b@example.com")).allowed is True
+        assert (await limiter.hit("a@example.com")).allowed is False
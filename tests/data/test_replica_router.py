@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+
+from src.core.config import settings
+from src.data.db.replica import ReplicaRouter
+from src.data.models import UserModel
+from src.data.repositories.base_repository import BaseRepository
+
+STMT = select(UserModel).where(UserModel.id == 1)
+
+
+def build_router(lag_seconds: float | None = 0.0, markers: list | None = None) -> ReplicaRouter:
+    redis_service = AsyncMock()
+    redis_service.mget = AsyncMock(return_value=markers or [None])
+    router = ReplicaRouter(engine=MagicMock(), redis_service=redis_service)
+    router.lag_seconds = lag_seconds
+    return router
+
+
+def build_repository(router: ReplicaRouter) -> BaseRepository:
+    return BaseRepository(db=AsyncMock(), model=UserModel, read_db=AsyncMock(), replica_router=router)
+
+
+@pytest.mark.asyncio
+class TestReplicaRouting:
+    async def test_healthy_replica_serves_unmarked_reads(self):
+        repository = build_repository(build_router())
+
+        await repository.execute_read(STMT, "user:1")
+
+        repository.read_db.execute.assert_awaited_once_with(STMT)
+        repository.db.execute.assert_not_awaited()
+        repository.replica_router.redis_service.mget.assert_awaited_once_with(["db_rw:user:1"])
+
+    async def test_lagging_replica_reads_from_primary(self):
+        repository = build_repository(build_router(lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS + 1))
+
+        await repository.execute_read(STMT, "user:1")
+
+        repository.db.execute.assert_awaited_once_with(STMT)
+        repository.read_db.execute.assert_not_awaited()
+
+    async def test_recent_write_marker_reads_from_primary(self):
+        repository = build_repository(build_router(markers=["1700000000.0"]))
+
+        await repository.execute_read(STMT, "user:1")
+
+        repository.db.execute.assert_awaited_once_with(STMT)
+        repository.read_db.execute.assert_not_awaited()
+
+    async def test_marker_lookup_failure_reads_from_primary(self):
+        router = build_router()
+        router.redis_service.mget = AsyncMock(side_effect=ConnectionError("redis down"))
+        repository = build_repository(router)
+
+        await repository.execute_read(STMT, "user:1")
+
+        repository.db.execute.assert_awaited_once_with(STMT)
+        repository.read_db.execute.assert_not_awaited()
+
+    @pytest.mark.parametrize("error", [
+        OperationalError("SELECT 1", {}, Exception("connection reset")),
+        PoolTimeoutError("QueuePool limit reached"),
+        asyncio.TimeoutError(),
+        ConnectionRefusedError(),
+    ])
+    async def test_replica_error_marks_unhealthy_and_retries_on_primary(self, error):
+        router = build_router()
+        repository = build_repository(router)
+        repository.read_db.execute = AsyncMock(side_effect=error)
+
+        await repository.execute_read(STMT, "user:1")
+
+        repository.db.execute.assert_awaited_once_with(STMT)
+        assert router.healthy is False
+
+    async def test_mark_written_sets_markers(self):
+        router = build_router()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        pipeline = MagicMock()
+        pipeline.__aenter__ = AsyncMock(return_value=pipe)
+        pipeline.__aexit__ = AsyncMock(return_value=False)
+        router.redis_service.pipeline = MagicMock(return_value=pipeline)
+
+        await build_repository(router).mark_written("user:1", "email:a@example.com")
+
+        keys = [call.args[0] for call in pipe.set.call_args_list]
+        assert keys == ["db_rw:user:1", "db_rw:email:a@example.com"]
+        assert all(call.kwargs["ex"] == settings.DB_READ_YOUR_WRITES_SECONDS for call in pipe.set.call_args_list)
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from email.mime.text import MIMEText
+
+from src.data.mail.smtp_pool import SMTPConnectionPool
+from tests.data.smtp_sink import SMTPSink
+
+
+def build_message(to: str) -> MIMEText:
+    message = MIMEText("<b>123456</b>", "html")
+    message["From"] = "App <noreply@example.com>"
+    message["To"] = to
+    message["Subject"] = "OTP"
+    return message
+
+
+def build_pool(sink: SMTPSink, **options) -> SMTPConnectionPool:
+    return SMTPConnectionPool(
+        hostname=sink.host, port=sink.port, username="user", password="secret", start_tls=False, **options
+    )
+
+
+@pytest.mark.asyncio
+class TestSMTPConnectionPool:
+    async def test_connections_are_reused_and_capped(self):
+        async with SMTPSink() as sink:
+            pool = build_pool(sink, size=2)
+
+            await asyncio.gather(*(pool.send_message(build_message(f"u{i}@example.com")) for i in range(10)))
+            await pool.close()
+
+        assert len(sink.messages) == 10
+        assert sink.connections == 2
+
+    async def test_reconnects_after_server_drops_connection(self):
+        async with SMTPSink() as sink:
+            pool = build_pool(sink, size=1)
+            await pool.send_message(build_message("a@example.com"))
+
+            sink.drop_connections()
+            await asyncio.sleep(0.01)
+            await pool.send_message(build_message("b@example.com"))
+            await pool.close()
+
+        assert len(sink.messages) == 2
+        assert sink.connections == 2
+
+    async def test_connection_is_recycled_after_max_messages(self):
+        async with SMTPSink() as sink:
+            pool = build_pool(sink, size=1, max_messages=2)
+
+            for i in range(5):
+                await pool.send_message(build_message(f"u{i}@example.com"))
+            await pool.close()
+
+        assert len(sink.messages) == 5
+        assert sink.connections == 3
+
+    async def test_failed_connect_does_not_leak_in_use(self):
+        async with SMTPSink() as sink:
+            port = sink.port
+        # Server đã tắt → mọi lần mở kết nối đều lỗi
+        pool = SMTPConnectionPool(hostname="127.0.0.1", port=port, username=None, password=None,
+                                  start_tls=False, timeout=1, name="unreachable")
+
+        for _ in range(3):
+            with pytest.raises(Exception):
+                await pool.send_message(build_message("a@example.com"))
+        await pool.close()
+
+        assert pool._in_use.value == 0
+
+    async def test_keepalive_holds_a_send_slot(self):
+        async with SMTPSink() as sink:
+            pool = build_pool(sink, size=1, keepalive_seconds=0.01)
+            is_alive = pool._is_alive
+
+            async def slow_is_alive(connection):
+                await asyncio.sleep(0.1)
+                return await is_alive(connection)
+
+            pool._is_alive = slow_is_alive
+            await pool.send_message(build_message("a@example.com"))
+            await asyncio.sleep(0.03)
+
+            # Keepalive đang NOOP trên kết nối duy nhất → sender chờ lượt thay vì mở kết nối thứ hai
+            await pool.send_message(build_message("b@example.com"))
+            await pool.close()
+
+        assert len(sink.messages) == 2
+        assert sink.connections == 1
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.data.cache.user_cache import UserCache
+from src.domain.entities import UserEntity
+
+
+def build_user(**overrides) -> UserEntity:
+    data = dict(id=1, name="A", email="a@example.com", password="hash", avatar=None, last_login=None)
+    data.update(overrides)
+    return UserEntity(**data)
+
+
+def build_cache() -> UserCache:
+    redis_service = AsyncMock()
+    redis_service.get_json = AsyncMock(return_value=None)
+
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipeline = MagicMock()
+    pipeline.__aenter__ = AsyncMock(return_value=pipe)
+    pipeline.__aexit__ = AsyncMock(return_value=False)
+    redis_service.pipeline = MagicMock(return_value=pipeline)
+    return UserCache(redis_service)
+
+
+@pytest.mark.asyncio
+class TestUserCache:
+    async def test_concurrent_misses_load_once(self):
+        cache = build_cache()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return build_user()
+
+        first, second = await asyncio.gather(
+            cache.get_or_load(cache.id_key(1), loader),
+            cache.get_or_load(cache.id_key(1), loader),
+        )
+
+        assert calls == 1
+        assert first == second and first is not second
+
+    async def test_user_is_served_from_local_cache_by_id_and_email(self):
+        cache = build_cache()
+        await cache.get_or_load(cache.id_key(1), AsyncMock(return_value=build_user()))
+
+        loader = AsyncMock()
+        user = await cache.get_or_load(cache.email_key("a@example.com"), loader)
+
+        assert user.id == 1
+        loader.assert_not_awaited()
+        cache.redis_service.get_json.assert_awaited_once()
+
+    async def test_invalidate_during_load_keeps_stale_user_out_of_local_cache(self):
+        cache = build_cache()
+
+        async def load_then_concurrent_write():
+            await cache.invalidate(1, "a@example.com")
+            return build_user(name="stale")
+
+        await cache.get_or_load(cache.id_key(1), load_then_concurrent_write)
+
+        loader = AsyncMock(return_value=build_user(name="fresh"))
+        user = await cache.get_or_load(cache.id_key(1), loader)
+
+        assert user.name == "fresh"
+        loader.assert_awaited_once()
+
+    async def test_password_hash_is_not_cached(self):
+        cache = build_cache()
+        cache.redis_service.eval_script = AsyncMock()
+
+        user = await cache.get_or_load(cache.id_key(1), AsyncMock(return_value=build_user()))
+        cached = await cache.get_or_load(cache.email_key("a@example.com"), AsyncMock())
+
+        assert user.password is None and cached.password is None
+        payload = cache.redis_service.eval_script.await_args.kwargs["args"][0]
+        assert b"hash" not in payload and b"password" not in payload
+
+    async def test_legacy_redis_entry_drops_password_hash(self):
+        cache = build_cache()
+        data = UserCache._to_cache(build_user())
+        data["password"] = "hash"
+        cache.redis_service.get_json = AsyncMock(return_value=data)
+
+        user = await cache.get_or_load(cache.id_key(1), AsyncMock())
+
+        assert user.password is None
@@ -0,0 +1,56 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from src.core.config import settings
+from src.core.exceptions import UnauthorizedError
+from src.data.cache.access_token_cache import access_token_cache
+from src.domain.entities import AuthPrincipal
+from src.presentation.api.middlewares.auth_middleware import AuthMiddleware
+
+CLAIMS = {"id": 1, "signin_count": 1, "sign_out_count": 0, "refresh_jti": "jti"}
+
+
+def build_token(**claims) -> str:
+    return jwt.encode({**CLAIMS, **claims}, settings.JWT_ACCESS_SECRET, algorithm="HS256")
+
+
+def build_scope(token: str) -> dict:
+    return {"type": "http", "path": "/api/v1/users/me", "headers": [(b"authorization", f"Bearer {token}".encode())]}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    access_token_cache.clear()
+    yield
+    access_token_cache.clear()
+
+
+class TestAuthMiddlewareTokenCache:
+    def test_token_without_exp_is_unauthorized(self):
+        middleware = AuthMiddleware(app=None)
+
+        with pytest.raises(UnauthorizedError):
+            middleware.authenticate(build_scope(build_token()))
+
+    def test_verified_token_is_served_from_cache(self, monkeypatch):
+        middleware = AuthMiddleware(app=None)
+        token = build_token(exp=datetime.now(timezone.utc) + timedelta(minutes=5))
+        first = middleware.authenticate(build_scope(token))
+
+        monkeypatch.setattr(jwt, "decode", lambda *args, **kwargs: pytest.fail("token decoded again"))
+
+        assert middleware.authenticate(build_scope(token)) == first == AuthPrincipal(**CLAIMS)
+
+    def test_cached_token_is_rejected_once_expired(self):
+        middleware = AuthMiddleware(app=None)
+        token = build_token(exp=datetime.now(timezone.utc) - timedelta(seconds=1))
+        access_token_cache.put(token, AuthPrincipal(**CLAIMS), time.time() + 0.05)
+        assert middleware.authenticate(build_scope(token)) == AuthPrincipal(**CLAIMS)
+
+        time.sleep(0.1)
+
+        with pytest.raises(UnauthorizedError):
+            middleware.authenticate(build_scope(token))
@@ -0,0 +1,53 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.exceptions import ServiceUnavailableError, UnauthorizedError
+from src.domain.exceptions.auth_exception import TooManyOtpRequestsError
+from src.presentation.api.error_handlers import register_error_handlers
+from src.schemas.error_response import ErrorResponse, PreEncodedError
+
+
+def build_client() -> TestClient:
+    app = FastAPI()
+    register_error_handlers(app)
+
+    @app.get("/otp")
+    async def otp():
+        raise TooManyOtpRequestsError()
+
+    @app.get("/busy")
+    async def busy():
+        raise ServiceUnavailableError(retry_after=7)
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_pre_encoded_body_matches_error_response():
+    error = UnauthorizedError()
+    expected = ErrorResponse(status=error.status_code, message=error.message, errors=error.errors)
+
+    response = PreEncodedError(error.status_code, error.message, error.errors).response()
+
+    assert response.body == expected.body
+    assert response.headers["content-length"] == expected.headers["content-length"]
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_app_errors_are_mapped_by_exception_handlers():
+    client = build_client()
+
+    response = client.get("/otp")
+    assert response.status_code == 429
+    assert response.json()["errors"] == {"message": TooManyOtpRequestsError.error}
+
+    response = client.get("/busy")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "7"
+
+    response = client.get("/boom")
+    assert response.status_code == 500
+    assert response.json()["message"] == "Internal Server Error"
@@ -0,0 +1,100 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.core.exceptions import DoNotPermissionError, PayloadTooLargeError
+from src.presentation.api.error_handlers import register_error_handlers
+from src.presentation.api.request_body import INVALID_JSON, INVALID_VALUE, NOT_AN_OBJECT, parse_body
+from src.schemas.auth_request import ResetPasswordRequest, SignupRequest, SignupVerificationRequest
+
+MAX_BYTES = 256
+
+
+def build_client(monkeypatch) -> TestClient:
+    monkeypatch.setattr("src.presentation.api.request_body.settings.REQUEST_BODY_MAX_BYTES", MAX_BYTES)
+    app = FastAPI()
+    register_error_handlers(app)
+
+    @app.post("/signup")
+    async def signup(request: Request):
+        return (await parse_body(request, SignupRequest)).model_dump()
+
+    @app.post("/verify")
+    async def verify(request: Request):
+        return (await parse_body(request, SignupVerificationRequest)).model_dump()
+
+    @app.post("/reset")
+    async def reset(request: Request):
+        return (await parse_body(request, ResetPasswordRequest)).model_dump()
+
+    return TestClient(app)
+
+
+def test_valid_body_is_stripped(monkeypatch):
+    client = build_client(monkeypatch)
+
+    response = client.post("/signup", json={"name": " An ", "email": "an@example.com ", "password": "Secret#123"})
+
+    assert response.status_code == 200
+    assert response.json() == {"name": "An", "email": "an@example.com", "password": "Secret#123"}
+
+
+def test_field_errors_reuse_validation_messages(monkeypatch):
+    client = build_client(monkeypatch)
+
+    response = client.post("/signup", json={"email": "not-an-email", "password": 12345678})
+
+    assert response.status_code == 400
+    assert response.json()["errors"] == {
+        "name": "Vui lòng nhập tên của bạn",
+        "email": "Email không hợp lệ",
+        "password": INVALID_VALUE,
+    }
+
+    response = client.post("/reset", json={"reset_token": "t", "new_password": "Secret#123", "confirm_password": "x"})
+    assert response.json()["errors"] == {"confirm_password": "Mật khẩu xác nhận không khớp."}
+
+
+def test_missing_flow_identifier_is_forbidden_before_field_errors(monkeypatch):
+    client = build_client(monkeypatch)
+
+    for path, body in (("/verify", {"otp": ""}), ("/verify", {"email": "  "}), ("/reset", {"new_password": "x"})):
+        response = client.post(path, json=body)
+        assert response.status_code == 403
+        assert response.json()["errors"] == {"message": DoNotPermissionError.error}
+
+    response = client.post("/verify", json={"email": "an@example.com", "otp": ""})
+    assert response.status_code == 400
+    assert set(response.json()["errors"]) == {"otp"}
+
+
+def test_malformed_and_non_object_bodies_are_rejected(monkeypatch):
+    client = build_client(monkeypatch)
+
+    response = client.post("/signup", content=b"{not json")
+    assert response.status_code == 400
+    assert response.json()["errors"] == {"body": INVALID_JSON}
+
+    response = client.post("/signup", json=["an@example.com"])
+    assert response.status_code == 400
+    assert response.json()["errors"] == {"body": NOT_AN_OBJECT}
+
+    for content_length in ("abc", "-1"):
+        response = client.post("/signup", content=b"{}", headers={"content-length": content_length})
+        assert response.status_code == 400
+        assert response.json()["errors"] == {"body": INVALID_JSON}
+
+
+def test_oversized_body_is_rejected_while_streaming(monkeypatch):
+    client = build_client(monkeypatch)
+
+    def body():
+        # Không có Content-Length (chunked) → phải chặn theo số byte thực nhận
+        for _ in range(100):
+            yield b" " * 64
+
+    response = client.post("/signup", content=body())
+    assert response.status_code == 413
+    assert response.json()["errors"] == {"message": PayloadTooLargeError.error}
+
+    response = client.post("/signup", content=b" " * (MAX_BYTES + 1))
+    assert response.status_code == 413
@@ -0,0 +1,60 @@
+import multiprocessing
+import os
+import signal
+import socket
+import time
+
+import httpx
+import uvicorn
+
+from src.core.config import settings
+from src.server import Supervisor
+
+
+async def pid_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": str(os.getpid()).encode()})
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_supervisor(port: int):
+    settings.SERVER_MAX_REQUESTS = 2
+    settings.SERVER_MAX_REQUESTS_JITTER = 0
+    # uvloop/httptools chỉ có trong image production; test dùng loop/parser mặc định
+    config = uvicorn.Config(
+        pid_app, host="127.0.0.1", port=port, loop="asyncio", http="h11", lifespan="off",
+        timeout_graceful_shutdown=1, log_level="warning",
+    )
+    os._exit(Supervisor(config, workers=2).run())
+
+
+def get_pid(port: int) -> int:
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            return int(httpx.get(f"http://127.0.0.1:{port}/", timeout=5).text)
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+def test_workers_are_recycled_and_stop_on_sigterm():
+    port = free_port()
+    master = multiprocessing.get_context("fork").Process(target=run_supervisor, args=(port,))
+    master.start()
+    try:
+        pids = [get_pid(port) for _ in range(12)]
+        # Mỗi worker chỉ phục vụ 2 request rồi được thay bằng worker mới
+        assert len(set(pids)) >= 4
+        assert master.pid not in pids
+    finally:
+        os.kill(master.pid, signal.SIGTERM)
+        master.join(timeout=15)
+
+    assert master.exitcode == 0
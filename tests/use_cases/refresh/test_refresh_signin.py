@@ -0,0 +1,54 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, call
+
+from src.core.exceptions import UnauthorizedError
+from src.domain.entities import AuthEpoch
+from src.domain.use_cases.auth import RefreshSigninUseCase
+
+
+def build_use_case(*epochs):
+    user_repo = AsyncMock()
+    user_repo.get_auth_epoch = AsyncMock(side_effect=list(epochs))
+
+    token_service = MagicMock()
+    token_service.verify_token.return_value = {
+        "id": 1, "jti": "device1", "signin_count": 3, "sign_out_count": 1
+    }
+    token_service.get_refresh_token_hash = AsyncMock(return_value="hashed")
+    token_service.hash_token.return_value = "hashed"
+    token_service.delete_all_refresh_tokens = AsyncMock()
+    token_service.create_access_token.return_value = "access123"
+
+    use_case = RefreshSigninUseCase(user_repository=user_repo, token_service=token_service)
+    return use_case, user_repo, token_service
+
+
+@pytest.mark.asyncio
+class TestRefreshSigninUseCase:
+
+    async def test_matching_cached_epoch_issues_access_token(self):
+        use_case, user_repo, _ = build_use_case(AuthEpoch(user_id=1, signin_count=3, sign_out_count=1))
+
+        result = await use_case.execute("refresh123")
+
+        assert result == {"access_token": "access123", "token_type": "Bearer"}
+        user_repo.get_auth_epoch.assert_awaited_once_with(1)
+
+    async def test_stale_cached_epoch_is_reloaded_from_db(self):
+        use_case, user_repo, _ = build_use_case(
+            AuthEpoch(user_id=1, signin_count=2, sign_out_count=1),
+            AuthEpoch(user_id=1, signin_count=3, sign_out_count=1),
+        )
+
+        result = await use_case.execute("refresh123")
+
+        assert result["access_token"] == "access123"
+        assert user_repo.get_auth_epoch.await_args_list == [call(1), call(1, fresh=True)]
+
+    async def test_outdated_token_revokes_all_sessions(self):
+        use_case, _, token_service = build_use_case(AuthEpoch(user_id=1, signin_count=4, sign_out_count=1))
+
+        with pytest.raises(UnauthorizedError):
+            await use_case.execute("refresh123")
+
+        token_service.delete_all_refresh_tokens.assert_awaited_once_with(1)
@@ -13,10 +13,11 @@ class TestSigninWithEmailPasswordUseCase:
 
     async def test_email_not_registered_raises_error(self):
         user_repo = AsyncMock()
-        password_hasher = MagicMock()
+        password_hasher = AsyncMock()
+        password_hasher.needs_rehash = MagicMock(return_value=False)
         token_service = MagicMock()
 
-        user_repo.get_user_by_email = AsyncMock(return_value=None)
+        user_repo.get_user_credentials_by_email = AsyncMock(return_value=None)
 
         use_case = SigninWithEmailPasswordUseCase(
             user_repository=user_repo,
@@ -29,12 +30,13 @@ class TestSigninWithEmailPasswordUseCase:
 
     async def test_incorrect_password_raises_error(self):
         user_repo = AsyncMock()
-        password_hasher = MagicMock()
+        password_hasher = AsyncMock()
+        password_hasher.needs_rehash = MagicMock(return_value=False)
         token_service = MagicMock()
 
         fake_user = MagicMock()
         fake_user.password = "hashed_pw"
-        user_repo.get_user_by_email = AsyncMock(return_value=fake_user)
+        user_repo.get_user_credentials_by_email = AsyncMock(return_value=fake_user)
         password_hasher.verify.return_value = False
 
         use_case = SigninWithEmailPasswordUseCase(
@@ -48,18 +50,21 @@ class TestSigninWithEmailPasswordUseCase:
 
     async def test_successful_signin_returns_tokens(self):
         user_repo = AsyncMock()
-        password_hasher = MagicMock()
+        password_hasher = AsyncMock()
+        password_hasher.needs_rehash = MagicMock(return_value=False)
         token_service = MagicMock()
 
         fake_user = MagicMock()
         fake_user.id = 1
         fake_user.password = "hashed_pw"
-        fake_user.signin_count = 0
-        fake_user.sign_out_count = 0
-        fake_user.increase_signin_count = MagicMock(side_effect=lambda: setattr(fake_user, "signin_count", 1))
 
-        user_repo.get_user_by_email = AsyncMock(return_value=fake_user)
-        user_repo.update_user_by_id = AsyncMock()
+        signed_in_user = MagicMock()
+        signed_in_user.id = 1
+        signed_in_user.signin_count = 1
+        signed_in_user.sign_out_count = 0
+
+        user_repo.get_user_credentials_by_email = AsyncMock(return_value=fake_user)
+        user_repo.record_signin = AsyncMock(return_value=signed_in_user)
 
         password_hasher.verify.return_value = True
 
@@ -79,22 +84,54 @@ class TestSigninWithEmailPasswordUseCase:
             "refresh_token": "refresh123",
             "token_type": "Bearer"
         }
-        user_repo.update_user_by_id.assert_awaited_once_with(1, {"signin_count": 1})
+        user_repo.record_signin.assert_awaited_once_with(1, password=None)
+        token_service.create_refresh_token.assert_called_once_with(
+            user_id=1, signin_count=1, sign_out_count=0
+        )
+
+    async def test_outdated_hash_is_rehashed_on_signin(self):
+        user_repo = AsyncMock()
+        password_hasher = AsyncMock()
+        password_hasher.needs_rehash = MagicMock(return_value=True)
+        token_service = MagicMock()
+
+        fake_user = MagicMock()
+        fake_user.id = 1
+        fake_user.password = "old_hash"
+
+        user_repo.get_user_credentials_by_email = AsyncMock(return_value=fake_user)
+        user_repo.record_signin = AsyncMock(return_value=MagicMock())
+
+        password_hasher.verify.return_value = True
+        password_hasher.hash.return_value = "new_hash"
+
+        token_service.create_refresh_token.return_value = ("refresh123", "device123")
+        token_service.create_access_token.return_value = "access123"
+
+        use_case = SigninWithEmailPasswordUseCase(
+            user_repository=user_repo,
+            password_hasher_service=password_hasher,
+            token_service=token_service
+        )
+
+        await use_case.execute("test@example.com", "123456")
+
+        password_hasher.needs_rehash.assert_called_once_with("old_hash")
+        password_hasher.hash.assert_awaited_once_with("123456")
+        user_repo.record_signin.assert_awaited_once_with(1, password="new_hash")
 
     async def test_app_error_propagates(self):
         user_repo = AsyncMock()
-        password_hasher = MagicMock()
+        password_hasher = AsyncMock()
+        password_hasher.needs_rehash = MagicMock(return_value=False)
         token_service = MagicMock()
 
         fake_user = MagicMock()
         fake_user.id = 1
         fake_user.password = "hashed_pw"
-        fake_user.signin_count = 0
-        fake_user.sign_out_count = 0
-        fake_user.increase_signin_count = MagicMock(side_effect=lambda: setattr(fake_user, "signin_count", 1))
 
-        user_repo.get_user_by_email = AsyncMock(return_value=fake_user)
-        user_repo.update_user_by_id = AsyncMock(side_effect=AppError("db error"))
+        user_repo.get_user_credentials_by_email = AsyncMock(return_value=fake_user)
+        user_repo.record_signin = AsyncMock(side_effect=AppError("db error"))
         password_hasher.verify.return_value = True
 
         use_case = SigninWithEmailPasswordUseCase(
@@ -108,17 +145,17 @@ class TestSigninWithEmailPasswordUseCase:
 
     async def test_unexpected_error_raises_server_error(self):
         user_repo = AsyncMock()
-        password_hasher = MagicMock()
+        password_hasher = AsyncMock()
+        password_hasher.needs_rehash = MagicMock(return_value=False)
         token_service = MagicMock()
 
         fake_user = MagicMock()
         fake_user.password = "hashed_pw"
-        fake_user.increase_signin_count = MagicMock()
 
-        user_repo.get_user_by_email = AsyncMock(return_value=fake_user)
+        user_repo.get_user_credentials_by_email = AsyncMock(return_value=fake_user)
         password_hasher.verify.return_value = True
 
-        user_repo.update_user_by_id = AsyncMock(side_effect=RuntimeError("DB crash"))
+        user_repo.record_signin = AsyncMock(side_effect=RuntimeError("DB crash"))
 
         use_case = SigninWithEmailPasswordUseCase(
             user_repository=user_repo,
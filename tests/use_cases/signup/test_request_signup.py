@@ -5,6 +5,11 @@ from src.domain.use_cases.auth.signup.request_signup import RequestSignupUseCase
 from src.core.exceptions import ServerError
 
 
+async def run_send(email, send, **kwargs):
+    await send()
+    return True
+
+
 @pytest.mark.asyncio
 class TestRequestSignupUseCase:
     async def test_successful_signup(self):
@@ -13,6 +18,7 @@ class TestRequestSignupUseCase:
         user_repo.exists_by_email = AsyncMock(return_value=False)
 
         otp_service = AsyncMock()
+        otp_service.coalesce_send = AsyncMock(side_effect=run_send)
         otp_service.check_and_increment_limit = AsyncMock(return_value=True)
         otp_service.generate_otp = MagicMock(return_value="123456")
         otp_service.save_signup_otp = AsyncMock()
@@ -22,9 +28,9 @@ class TestRequestSignupUseCase:
             "subject": "Test Subject",
             "html": "<p>Test HTML</p>",
         })
-        mail_service.send_mail = AsyncMock()
+        mail_service.enqueue_mail = AsyncMock()
 
-        password_hasher = MagicMock()
+        password_hasher = AsyncMock()
         password_hasher.hash.return_value = "hashed_pw"
 
         # Instantiate use case
@@ -46,8 +52,31 @@ class TestRequestSignupUseCase:
             name="Test User",
             password="hashed_pw",
         )
-        mail_service.send_mail.assert_awaited_once()
-        password_hasher.hash.assert_called_once_with("123456")
+        mail_service.enqueue_mail.assert_awaited_once()
+        password_hasher.hash.assert_awaited_once_with("123456")
+
+    async def test_coalesced_request_does_not_send_again(self):
+        user_repo = AsyncMock()
+        user_repo.exists_by_email = AsyncMock(return_value=False)
+
+        otp_service = AsyncMock()
+        otp_service.coalesce_send = AsyncMock(return_value=False)
+        mail_service = AsyncMock()
+        password_hasher = AsyncMock()
+
+        use_case = RequestSignupUseCase(
+            user_repository=user_repo,
+            otp_service=otp_service,
+            mail_service=mail_service,
+            password_hasher_service=password_hasher,
+        )
+
+        result = await use_case.execute("test@example.com", "Test User", "123456")
+
+        assert result == {"email": "test@example.com"}
+        password_hasher.hash.assert_not_awaited()
+        otp_service.save_signup_otp.assert_not_awaited()
+        mail_service.enqueue_mail.assert_not_awaited()
 
     async def test_existing_user_raises_email_already_used_error(self):
         user_repo = AsyncMock()
@@ -55,7 +84,7 @@ class TestRequestSignupUseCase:
 
         otp_service = AsyncMock()
         mail_service = AsyncMock()
-        password_hasher = MagicMock()
+        password_hasher = AsyncMock()
 
         use_case = RequestSignupUseCase(
             user_repository=user_repo,
@@ -72,10 +101,11 @@ class TestRequestSignupUseCase:
         user_repo.exists_by_email = AsyncMock(return_value=False)
 
         otp_service = AsyncMock()
+        otp_service.coalesce_send = AsyncMock(side_effect=run_send)
         otp_service.check_and_increment_limit = AsyncMock(return_value=False)
 
         mail_service = AsyncMock()
-        password_hasher = MagicMock()
+        password_hasher = AsyncMock()
 
         use_case = RequestSignupUseCase(
             user_repository=user_repo,
@@ -92,10 +122,11 @@ class TestRequestSignupUseCase:
         user_repo.exists_by_email = AsyncMock(return_value=False)
 
         otp_service = AsyncMock()
+        otp_service.coalesce_send = AsyncMock(side_effect=run_send)
         otp_service.check_and_increment_limit = AsyncMock(side_effect=RuntimeError("Something broke"))
 
         mail_service = AsyncMock()
-        password_hasher = MagicMock()
+        password_hasher = AsyncMock()
 
         use_case = RequestSignupUseCase(
             user_repository=user_repo,